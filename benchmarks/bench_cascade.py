@@ -0,0 +1,111 @@
+"""
+Benchmark: CascadeAnalyzer vs. the full pipeline.
+
+Builds a synthetic stream of mostly plain wire copy with some suspicious
+articles and some that mix both, calibrates the cascade on the first
+half, then reports on the second half:
+
+* how many articles were decided clean, decided suspicious and escalated,
+  and the label agreement with full analysis (every first-tier decision
+  is verified),
+* the per-article time of the full pipeline and of the cascade.
+
+Uses the trained artefacts in ``models/``.
+
+Usage
+-----
+    python benchmarks/bench_cascade.py [n_articles] [suspicious_share] [mixed_share]
+"""
+
+import os
+import random
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzer import CascadeAnalyzer, CredibilityAnalyzer  # noqa: E402
+from src.models import ModelLoader  # noqa: E402
+
+WIRE_SENTENCES = [
+    "Scientists at Stanford University have published a peer-reviewed study in the journal Nature.",
+    "The study tracked 30,000 participants across 15 countries for an average of six months.",
+    "Officials confirmed the annual budget on Tuesday after a public consultation.",
+    "The central bank held interest rates at 4.5 percent, according to a statement.",
+    "Independent experts said the sample size was robust and the data was shared openly.",
+    "The council will publish the full report and the underlying statistics next week.",
+    "Researchers noted that the results are preliminary and will be reviewed by regulators.",
+]
+SUSPICIOUS_SENTENCES = [
+    "SHOCKING: mainstream media will never report the hidden truth!",
+    "Sources say the deep state is covering up the false flag operation.",
+    "Wake up, people: they don't want you to know what is really going on!",
+    "Insiders reveal the secret agenda that Big Pharma is desperate to hide.",
+    "This EXPLOSIVE cover-up is the biggest scandal in history, totally unbelievable!",
+]
+
+
+def make_articles(n, suspicious_share, mixed_share, seed=0):
+    rng = random.Random(seed)
+    articles = []
+    for _ in range(n):
+        draw = rng.random()
+        if draw < suspicious_share:
+            sentences = rng.sample(SUSPICIOUS_SENTENCES, rng.randint(3, len(SUSPICIOUS_SENTENCES)))
+        elif draw < suspicious_share + mixed_share:
+            sentences = rng.sample(WIRE_SENTENCES, rng.randint(2, 4))
+            sentences += rng.sample(SUSPICIOUS_SENTENCES, rng.randint(1, 2))
+            rng.shuffle(sentences)
+        else:
+            sentences = rng.sample(WIRE_SENTENCES, rng.randint(3, len(WIRE_SENTENCES)))
+        articles.append(" ".join(sentences))
+    return articles
+
+
+def per_article_ms(fn, articles):
+    t0 = time.perf_counter()
+    for text in articles:
+        fn(text)
+    return (time.perf_counter() - t0) / len(articles) * 1e3
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    share = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+    mixed = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
+    warnings.filterwarnings("ignore")
+    model, vectorizer = ModelLoader().load()
+    articles = make_articles(n, share, mixed)
+    sample, stream = articles[: n // 2], articles[n // 2:]
+
+    cascade = CascadeAnalyzer()
+    report = cascade.calibrate(sample, model, vectorizer)
+    print(f"Calibrated on {report['samples']:,} articles: "
+          f"margin tolerance {report['margin_tolerance']:.3f}, "
+          f"first tier {report['first_tier_share']:.1%} "
+          f"(clean {report['clean_share']:.1%}, suspicious {report['suspicious_share']:.1%})")
+
+    cascade.verify_rate = 1.0
+    for text in stream:
+        cascade.analyze(text, model, vectorizer)
+    m = cascade.metrics
+    agreement = "n/a" if m.agreement is None else f"{m.agreement:.1%}"
+    print(f"First tier decided {m.first_tier_share:.1%} "
+          f"(clean {m.clean:,}, suspicious {m.suspicious:,}, escalated {m.escalated:,}); "
+          f"agreement {agreement}\n")
+
+    cascade.verify_rate = 0.0
+    full = CredibilityAnalyzer()
+    full.analyze(stream[0], model, vectorizer)
+    print(f"{'pipeline':<28}{'ms / article':>14}")
+    for name, fn in (
+        ("full analyze()", lambda t: full.analyze(t, model, vectorizer)),
+        ("cascade analyze()", lambda t: cascade.analyze(t, model, vectorizer)),
+        ("cascade analyze(lazy=True)", lambda t: cascade.analyze(t, model, vectorizer, lazy=True)),
+    ):
+        print(f"{name:<28}{per_article_ms(fn, stream):>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
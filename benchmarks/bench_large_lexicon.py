@@ -0,0 +1,89 @@
+"""
+Benchmark: KeywordMatcher "scan" vs. "automaton" engines on large lexicons.
+
+Builds synthetic watchlists of 100, 10k and 100k phrases (one- to
+four-word combinations over a fixed vocabulary, plus the built-in
+PatternDetector keywords), checks that both engines return identical
+counts, and reports compile time and per-document matching time.  Scan
+time grows with the number of phrases; automaton time stays roughly flat.
+
+Usage
+-----
+    python benchmarks/bench_large_lexicon.py [n_docs] [sizes...]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.patterns import PatternDetector  # noqa: E402
+from src.patterns.lexicon import LEXICON_FAMILIES  # noqa: E402
+from src.patterns import matcher as matcher_module  # noqa: E402
+from src.patterns.matcher import KeywordMatcher  # noqa: E402
+
+VOCAB = (
+    "vaccine hoax fraud election ballot secret cure miracle crisis doctors "
+    "government media truth leaked report agency climate banned exposed "
+    "pharma scandal chemtrails cabal insider microchip rigged plandemic "
+    "deep state virus lab shocking study evidence dailytruth news wire"
+).split()
+
+# Scans at 100k phrases take ~0.1 s per document; cap the docs they see
+SCAN_DOC_LIMIT = 20
+
+
+def build_watchlist(n_terms: int, seed: int = 0):
+    rng = random.Random(seed)
+    default = PatternDetector.default_lexicon()
+    terms = {t for f in LEXICON_FAMILIES for t in default.families[f]}
+    while len(terms) < n_terms:
+        terms.add(" ".join(rng.choice(VOCAB) for _ in range(rng.randint(1, 4))))
+    terms = sorted(terms)[:n_terms]
+    # Spread the phrases over the eight families like a real lexicon
+    return [terms[i::len(LEXICON_FAMILIES)] for i in range(len(LEXICON_FAMILIES))]
+
+
+def build_corpus(n_docs: int, seed: int = 1):
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(VOCAB) for _ in range(rng.randint(200, 1200))).lower()
+        for _ in range(n_docs)
+    ]
+
+
+def time_engine(families, engine, corpus):
+    t0 = time.perf_counter()
+    matcher = KeywordMatcher(families, engine=engine)
+    t_build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    counts = [matcher.count(doc) for doc in corpus]
+    t_match = (time.perf_counter() - t0) / len(corpus)
+    return t_build, t_match, counts
+
+
+def main() -> None:
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    sizes = [int(s) for s in sys.argv[2:]] or [100, 10_000, 100_000]
+    corpus = build_corpus(n_docs)
+    mean_chars = sum(map(len, corpus)) / len(corpus)
+    backend = "pyahocorasick" if matcher_module.ahocorasick is not None else "pure Python"
+
+    print(f"{n_docs} documents, mean {mean_chars:,.0f} chars; automaton backend: {backend}")
+    print(f"{'terms':>8}  {'engine':>9}  {'build (s)':>10}  {'per doc (ms)':>13}")
+    for n_terms in sizes:
+        families = build_watchlist(n_terms)
+        scan_docs = corpus[:SCAN_DOC_LIMIT] if n_terms > 1_000 else corpus
+        results = {}
+        for engine, docs in (("scan", scan_docs), ("automaton", corpus)):
+            t_build, t_match, counts = time_engine(families, engine, docs)
+            results[engine] = counts
+            print(f"{n_terms:>8,}  {engine:>9}  {t_build:>10.3f}  {t_match * 1000:>13.3f}")
+        assert results["scan"] == results["automaton"][:len(results["scan"])], "engines disagree"
+    print("counts identical across engines")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: PatternDetector.detect_patterns loop vs. detect_patterns_batch.
+
+Builds a synthetic corpus from the Streamlit example articles (random
+prefixes, so documents vary in length), checks that the batch output equals
+the per-article dicts, and reports best-of-five wall-clock speed-ups for
+in-process and multi-process batch runs.  The corpus is run twice: plain
+ASCII, and with typographic apostrophes (non-ASCII text).
+
+In one process the batch path is about as fast as the loop (1.0-1.1x on
+20k documents): both run one C-level substring scan per keyword over the
+same text, and that scan is nearly all the time.  The speed-up comes from
+the worker processes, roughly linear in the number of cores, so a 10x
+throughput gain needs about ten cores.  The development machine has one
+core, so the multi-process figure has not been measured there.
+
+Usage
+-----
+    python benchmarks/bench_pattern_batch.py [n_docs] [n_jobs]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.patterns import PatternDetector  # noqa: E402
+
+SEED_ARTICLES = [
+    "Scientists at Stanford University have published a peer-reviewed study in "
+    "the journal Nature showing that a new vaccine candidate demonstrates 89% "
+    "efficacy in phase 3 clinical trials involving 30,000 participants.\n\n"
+    "Dr. Sarah Chen, lead researcher, stated that the results would be submitted "
+    "to the FDA. However, independent experts noted that the data is preliminary.",
+    "SHOCKING DISCOVERY: Government Scientists ADMIT Vaccines Contain Dangerous "
+    "Chemicals That Big Pharma Doesn't Want You to Know About!!!\n\nAn EXPLOSIVE "
+    "new report reveals that mainstream media has been HIDING the truth. Experts "
+    "say this could be the biggest cover-up in history! Wake up, people!",
+]
+
+
+def build_corpus(n_docs: int, seed: int = 0):
+    rng = random.Random(seed)
+    docs = []
+    for i in range(n_docs):
+        base = SEED_ARTICLES[i % len(SEED_ARTICLES)] * rng.randint(1, 4)
+        docs.append(base[: rng.randint(50, len(base))])
+    return docs
+
+
+def best_of(fn, repeat=5):
+    best, value = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        value = fn()
+        best = min(best, time.perf_counter() - t0)
+    return value, best
+
+
+def run(detector, corpus, n_jobs, label):
+    expected, t_loop = best_of(lambda: [detector.detect_patterns(t) for t in corpus])
+    single, t_single = best_of(lambda: detector.detect_patterns_batch(corpus, n_jobs=1))
+    parallel, t_parallel = best_of(lambda: detector.detect_patterns_batch(corpus, n_jobs=n_jobs))
+
+    keys = detector.PATTERN_KEYS
+    for row, ref in zip(parallel, expected):
+        assert {k: row[k].item() for k in keys} == ref
+    assert (single == parallel).all()
+
+    print(f"{label}")
+    print(f"  python loop        : {t_loop:7.2f}s")
+    print(f"  batch, n_jobs=1    : {t_single:7.2f}s  ({t_loop / t_single:4.1f}x)")
+    print(f"  batch, n_jobs={n_jobs:<4d} : {t_parallel:7.2f}s  ({t_loop / t_parallel:4.1f}x)")
+
+
+def main() -> None:
+    n_docs = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    n_jobs = int(sys.argv[2]) if len(sys.argv) > 2 else -1
+    detector = PatternDetector()
+    corpus = build_corpus(n_docs)
+
+    print(f"documents: {n_docs:,}  (cpu_count={os.cpu_count()})")
+    run(detector, corpus, n_jobs, "ASCII corpus")
+    run(detector, [t.replace("'", "\u2019") for t in corpus], n_jobs, "non-ASCII corpus")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark: interactive latency next to a bulk backfill, FIFO vs. lanes.
+
+A pool of worker processes (each with its own analyzer and the trained
+model from ``models/``) is given a bulk backlog, then interactive
+requests arrive at a steady rate.  Three runs:
+
+* ``idle``  — interactive requests alone (the latency to aim for),
+* ``fifo``  — everything submitted straight to the pool,
+* ``lanes`` — bulk and interactive go through ``PriorityScheduler``.
+
+Reports interactive latency percentiles and the bulk throughput reached
+while interactive traffic was flowing.
+
+Usage
+-----
+    python benchmarks/bench_priority_lanes.py [bulk_articles] [interactive_rate] [workers]
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, wait
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzer import BULK, INTERACTIVE, PriorityScheduler  # noqa: E402
+
+SENTENCES = [
+    "Scientists at Stanford University have published a peer-reviewed study in the journal Nature.",
+    "Officials confirmed the annual budget on Tuesday after a public consultation.",
+    "SHOCKING: mainstream media will never report the hidden truth!",
+    "The central bank held interest rates at 4.5 percent, according to a statement.",
+    "Sources say the deep state is covering up the false flag operation.",
+    "Researchers noted that the results are preliminary and will be reviewed by regulators.",
+]
+INTERACTIVE_REQUESTS = 60
+
+_worker_state = {}
+
+
+def _init_worker():
+    warnings.filterwarnings("ignore")
+    from src.analyzer import CredibilityAnalyzer
+    from src.models import ModelLoader
+
+    _worker_state["model"], _worker_state["vectorizer"] = ModelLoader().load()
+    _worker_state["analyzer"] = CredibilityAnalyzer()
+
+
+def _analyze(text):
+    state = _worker_state
+    return state["analyzer"].analyze(text, state["model"], state["vectorizer"])["classification"]
+
+
+def make_articles(n, seed=0):
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(SENTENCES, k=rng.randint(4, 20))) for _ in range(n)]
+
+
+def run(mode, pool, workers, bulk, interactive, rate):
+    if mode == "lanes":
+        scheduler = PriorityScheduler(workers=workers, executor=pool)
+        submit = scheduler.submit
+    else:
+        scheduler = None
+        submit = lambda lane, fn, text: pool.submit(fn, text)  # noqa: E731
+
+    bulk_done = []
+    t0 = time.perf_counter()
+    bulk_futures = [submit(BULK, _analyze, text) for text in (bulk if mode != "idle" else [])]
+    for f in bulk_futures:
+        f.add_done_callback(lambda _: bulk_done.append(time.perf_counter()))
+
+    latencies, lock = [], threading.Lock()
+    futures = []
+    for i, text in enumerate(interactive):
+        time.sleep(max(0.0, t0 + i / rate - time.perf_counter()))
+        sent = time.perf_counter()
+        future = submit(INTERACTIVE, _analyze, text)
+        future.add_done_callback(
+            lambda _, sent=sent: (lock.acquire(), latencies.append(time.perf_counter() - sent), lock.release())
+        )
+        futures.append(future)
+    wait(futures)
+    window_end = time.perf_counter()
+    bulk_rate = sum(1 for t in list(bulk_done) if t <= window_end) / (window_end - t0)
+
+    if scheduler is not None:
+        scheduler.shutdown(wait=False, cancel_pending=True)
+    for f in bulk_futures:
+        f.cancel()
+    wait(bulk_futures)
+    ms = np.array(latencies) * 1e3
+    return np.percentile(ms, 50), np.percentile(ms, 95), ms.max(), bulk_rate
+
+
+def main() -> None:
+    n_bulk = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 20.0
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    bulk = make_articles(n_bulk, seed=1)
+    interactive = make_articles(INTERACTIVE_REQUESTS, seed=2)
+
+    print(f"{workers} worker(s), {n_bulk:,} bulk articles, "
+          f"{INTERACTIVE_REQUESTS} interactive requests at {rate:g}/s\n")
+    print(f"{'mode':<8}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'bulk/s':>10}")
+    for mode in ("idle", "fifo", "lanes"):
+        with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+            list(pool.map(_analyze, bulk[: workers * 2]))  # load the model everywhere
+            p50, p95, worst, bulk_rate = run(mode, pool, workers, bulk, interactive, rate)
+        print(f"{mode:<8}{p50:>10.1f}{p95:>10.1f}{worst:>10.1f}{bulk_rate:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark: memory held by N analysis results as dicts vs. AnalysisResult.
+
+Analyses a handful of real articles with a tiny in-memory model, then
+replicates those results N times with fresh containers (dicts, lists,
+pattern dicts) but *shared* strings and numbers, as a reporting job that
+keeps many results would.  Because the strings are shared, the figures
+isolate the per-result container overhead; the narrative strings
+(summary, explanation, claims) cost the same in both representations.
+
+Usage
+-----
+    python benchmarks/bench_result_memory.py [n_results]
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sklearn.feature_extraction.text import TfidfVectorizer  # noqa: E402
+from sklearn.linear_model import LogisticRegression  # noqa: E402
+
+from src.analyzer import AnalysisResult, CredibilityAnalyzer  # noqa: E402
+from src.utils import clean_text_for_model  # noqa: E402
+
+SEED_ARTICLES = [
+    ("Scientists at Stanford University have published a peer-reviewed study in "
+     "the journal Nature showing that a new vaccine candidate demonstrates 89% "
+     "efficacy in phase 3 clinical trials involving 30,000 participants.\n\n"
+     "Dr. Sarah Chen, lead researcher, stated that the results would be submitted "
+     "to the FDA. However, independent experts noted that the data is preliminary.", 1),
+    ("SHOCKING DISCOVERY: Government Scientists ADMIT Vaccines Contain Dangerous "
+     "Chemicals That Big Pharma Doesn't Want You to Know About!!!\n\nAn EXPLOSIVE "
+     "new report reveals that mainstream media has been HIDING the truth. Experts "
+     "say this could be the biggest cover-up in history! Wake up, people!", 0),
+    ("The city council approved the annual budget on Tuesday after a public "
+     "hearing. Officials said the plan increases school funding by 4% and was "
+     "reviewed by an independent auditor, according to the published report.", 1),
+    ("Sources say a secret agenda is being hidden by the elites. They don't want "
+     "you to know the real truth about what is happening. Share before it's "
+     "deleted! This unbelievable scandal will blow your mind.", 0),
+]
+
+
+def seed_results():
+    texts = [t for t, _ in SEED_ARTICLES]
+    vec = TfidfVectorizer(stop_words="english", ngram_range=(1, 2))
+    X = vec.fit_transform([clean_text_for_model(t) for t in texts])
+    model = LogisticRegression().fit(X, [y for _, y in SEED_ARTICLES])
+    analyzer = CredibilityAnalyzer()
+    return [analyzer.analyze(t, model, vec) for t in texts]
+
+
+def clone(result):
+    """Fresh containers, shared leaves — like a result read back from storage."""
+    out = dict(result)
+    for key in ("key_indicators", "suspicious_claims", "suspicious_claim_spans"):
+        out[key] = list(result[key])
+    out["patterns"] = dict(result["patterns"])
+    out["normalized_patterns"] = dict(result["normalized_patterns"])
+    return out
+
+
+def measure(build, n):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    held = build(n)
+    elapsed = time.perf_counter() - t0
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return held, size, elapsed
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    seeds = seed_results()
+    k = len(seeds)
+
+    dicts, dict_bytes, t_dict = measure(lambda n: [clone(seeds[i % k]) for i in range(n)], n)
+    records, rec_bytes, t_rec = measure(
+        lambda n: [AnalysisResult.from_dict(dicts[i]) for i in range(n)], n
+    )
+
+    for i in range(k):
+        assert records[i].to_dict() == dicts[i]
+
+    print(f"results            : {n:,}")
+    print(f"dict               : {dict_bytes / 2**20:8.1f} MiB  "
+          f"({dict_bytes / n:6.0f} B/result, built in {t_dict:5.2f}s)")
+    print(f"AnalysisResult     : {rec_bytes / 2**20:8.1f} MiB  "
+          f"({rec_bytes / n:6.0f} B/result, built in {t_rec:5.2f}s)")
+    print(f"reduction          : {dict_bytes / rec_bytes:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
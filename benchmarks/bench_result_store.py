@@ -0,0 +1,101 @@
+"""
+Benchmark: ResultStore bulk-insert rate and indexed query latency.
+
+Fills a fresh SQLite store with synthetic results spread over a year
+(labels and scores vary, rows arrive in time order over a year, and the
+payload is a real ``analyze()`` result), then times dashboard-style queries and prints their plans.
+
+Usage
+-----
+    python benchmarks/bench_result_store.py [n_rows] [db_path]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzer import CredibilityAnalyzer  # noqa: E402
+from src.storage import ResultStore  # noqa: E402
+
+LABELS = [("REAL", 0.5), ("FAKE", 0.25), ("MISLEADING", 0.15), ("UNVERIFIED", 0.10)]
+ARTICLE = (
+    "SHOCKING: Government scientists EXPOSED! Sources say the deep state is "
+    "covering up a massive false flag operation. Wake up!"
+)
+NOW = time.time()
+WEEK = 7 * 86400
+
+
+def template_result():
+    model = MagicMock()
+    model.predict.return_value = np.array([0])
+    model.predict_proba.return_value = np.array([[0.8, 0.2]])
+    return CredibilityAnalyzer().analyze(ARTICLE, model, MagicMock())
+
+
+def fill(store, n, seed=0):
+    rng = random.Random(seed)
+    base = template_result()
+    analyzer = CredibilityAnalyzer()
+    labels, weights = zip(*LABELS)
+    t0 = time.perf_counter()
+    for i in range(n):
+        result = dict(base)
+        result["classification"] = rng.choices(labels, weights)[0]
+        result["credibility_score"] = rng.randint(0, 100)
+        result["risk_level"] = analyzer.determine_risk_level(result["credibility_score"])
+        # Rows arrive in time order over the past year, as they would in use
+        store.put(f"{rng.getrandbits(128):032x}", result, url=f"https://example.com/{i}",
+                  analyzed_at=NOW - (n - i) / n * 365 * 86400)
+    store.flush()
+    return time.perf_counter() - t0
+
+
+def timed(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        value = fn()
+        best = min(best, time.perf_counter() - t0)
+    return value, best * 1e3
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(tempfile.mkdtemp(), "results.db")
+    with ResultStore(path, batch_size=10_000) as store:
+        seconds = fill(store, n)
+        store.optimize()
+        size_mb = os.path.getsize(path) / 2**20
+        print(f"inserted {n:,} rows in {seconds:.1f} s ({n / seconds:,.0f} rows/s), "
+              f"{size_mb:,.0f} MiB on disk\n")
+
+        queries = [
+            ("FAKE this week, score < 20",
+             dict(classification="FAKE", since=NOW - WEEK, max_score=19)),
+            ("High Risk this week", dict(risk_level="High Risk", since=NOW - WEEK)),
+            ("score >= 95 today", dict(min_score=95, since=NOW - 86400)),
+            ("latest 100 FAKE", dict(classification="FAKE", limit=100)),
+        ]
+        print(f"{'query':<30}{'rows':>10}{'ms':>10}")
+        for name, filters in queries:
+            frame, ms = timed(lambda: store.query(**filters))
+            print(f"{name:<30}{len(frame):>10,}{ms:>10.2f}")
+        key = store.query(limit=1)["content_hash"][0]
+        _, ms = timed(lambda: store.get(key))
+        print(f"{'get() by content hash':<30}{1:>10}{ms:>10.2f}")
+
+        sql, params = store._where(classification="FAKE", since=NOW - WEEK, max_score=19)
+        plan = store._conn.execute(f"EXPLAIN QUERY PLAN SELECT * FROM results{sql}", params)
+        print("\nplan:", "; ".join(row[-1] for row in plan))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: allocation and speed of the sentence splitters.
+
+Compares, on one long synthetic article, the peak traced allocation
+(``tracemalloc``) and wall-clock time of
+
+* the former ``re.split`` list splitter (reproduced here for reference),
+* ``split_into_sentences`` (list of sentence strings),
+* ``split_into_sentence_spans`` (list of offset pairs),
+* ``iter_sentences`` consumed lazily, and with an early exit after five
+  sentences (what ``ClaimHighlighter`` does once five claims are flagged).
+
+Usage
+-----
+    python benchmarks/bench_sentence_iter.py [n_sentences]
+"""
+
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import (  # noqa: E402
+    iter_sentences,
+    split_into_sentence_spans,
+    split_into_sentences,
+)
+
+SENTENCES = [
+    "Dr. Chen of the U.S. health agency said the rate fell to 0.1% last year.",
+    "Sources say the deep state is covering up the false flag operation!",
+    "Is this the hidden truth they don't want you to know?",
+    "The research data was analysed by professors over six months.",
+]
+
+_OLD_BOUNDARY = re.compile(r"[.!?]+\s+|\n+")
+
+
+def old_split(text):
+    return [s.strip() for s in _OLD_BOUNDARY.split(text) if s.strip()]
+
+
+def consume(text):
+    n = 0
+    for _ in iter_sentences(text):
+        n += 1
+    return n
+
+
+def first_five(text):
+    it = iter_sentences(text)
+    return [next(it) for _ in range(5)]
+
+
+def measure(fn, text, repeat=5):
+    tracemalloc.start()
+    fn(text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(text)
+    return peak, (time.perf_counter() - t0) / repeat
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    text = " ".join(SENTENCES[i % len(SENTENCES)] for i in range(n))
+    print(f"{n:,} sentences, {len(text) / 1e6:.1f} M characters\n")
+    print(f"{'splitter':<32}{'peak alloc (KiB)':>18}{'time (ms)':>12}")
+    for name, fn in (
+        ("re.split list (former)", old_split),
+        ("split_into_sentences", split_into_sentences),
+        ("split_into_sentence_spans", split_into_sentence_spans),
+        ("iter_sentences (full pass)", consume),
+        ("iter_sentences (first 5)", first_five),
+    ):
+        peak, seconds = measure(fn, text)
+        print(f"{name:<32}{peak / 1024:>18,.1f}{seconds * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
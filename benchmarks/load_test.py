@@ -0,0 +1,511 @@
+"""
+Load test: throughput and latency percentiles of the analyzer.
+
+Replays a corpus against the analyzer and reports latency percentiles
+from an HDR-style histogram for every load step, plus the
+throughput-vs-latency curve across steps.  Everything runs offline on
+one machine.
+
+Targets
+-------
+* ``inproc`` (default) — a pool of worker processes, each with its own
+  ``CredibilityAnalyzer`` and model loaded once, so CPU-bound analysis
+  scales with cores instead of contending for one GIL.
+* ``http`` — POSTs ``{"text": …}`` as JSON to ``--url``.  Without
+  ``--url`` a local reference endpoint (``serve`` sub-command, stdlib
+  ``http.server``) is started in a child process and stopped afterwards.
+
+Load models
+-----------
+* ``--rates`` — open loop: Poisson arrivals at each rate (req/s).
+  Latency is measured from the *scheduled* arrival time, so queueing
+  behind a saturated service is counted (no coordinated omission).
+* ``--concurrency`` — closed loop: N requests always in flight.
+
+The highest throughput of a step whose p99 meets ``--slo-ms`` (and, for
+open-loop steps, that keeps up with at least 95 % of its arrivals) is
+reported as the max sustainable throughput.
+
+Corpus
+------
+Synthetic articles of varying length by default.  ``--corpus`` samples
+from a CSV (``text`` column, optionally ``title``), a ``.txt`` file (one
+article per blank-line-separated block) or a directory of ``.txt`` files.
+
+Usage
+-----
+    python benchmarks/load_test.py run --rates 2 5 10 20 --slo-ms 250
+    python benchmarks/load_test.py run --concurrency 1 2 4 8 --workers 4
+    python benchmarks/load_test.py run --target http --rates 5 10 --out load.json
+    python benchmarks/load_test.py serve --port 8765
+"""
+
+import argparse
+import collections
+import csv
+import glob
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SEED_SENTENCES = [
+    "Scientists at Stanford University published a peer-reviewed study in Nature.",
+    "Sources say the deep state is covering up the false flag operation!",
+    "Dr. Chen of the U.S. health agency said the rate fell to 0.1% last year.",
+    "SHOCKING: mainstream media will never report the hidden truth.",
+    "The research data was analysed by professors over six months.",
+    "Officials confirmed the budget report and released the statistics on Monday.",
+    "Wake up, people: they don't want you to know what is really going on!",
+]
+
+PERCENTILES = (50.0, 75.0, 90.0, 95.0, 99.0, 99.9, 99.99, 100.0)
+# A step is sustainable if it completes at least this share of the arrivals
+# within the step (a saturated service drains its backlog long afterwards)
+SUSTAINED_SHARE = 0.95
+
+
+# ---------------------------------------------------------------------------
+# HDR-style latency histogram
+# ---------------------------------------------------------------------------
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+
+    Values are recorded in microseconds into buckets that are exact below
+    ``2**SUB_BITS`` µs and keep ``SUB_BITS`` bits of precision above it
+    (relative error under 1 %), so memory stays constant however many
+    requests are recorded.  Thread-safe.
+    """
+
+    SUB_BITS = 7
+
+    def __init__(self):
+        self.counts = collections.Counter()
+        self.total = 0
+        self.max_us = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        value = max(1, int(seconds * 1e6))
+        shift = max(0, value.bit_length() - 1 - self.SUB_BITS)
+        with self._lock:
+            self.counts[(shift, value >> shift)] += 1
+            self.total += 1
+            self.max_us = max(self.max_us, value)
+
+    def percentile(self, p):
+        """Highest value (µs) equivalent to the *p*-th percentile recording."""
+        if not self.total:
+            return 0
+        if p >= 100.0:
+            return self.max_us
+        rank = max(1, math.ceil(p / 100.0 * self.total))
+        seen = 0
+        for shift, mantissa in sorted(self.counts):
+            seen += self.counts[(shift, mantissa)]
+            if seen >= rank:
+                return min(((mantissa + 1) << shift) - 1, self.max_us)
+        return self.max_us
+
+    def distribution(self):
+        """Rows of ``(value_ms, percentile, count, 1/(1-percentile))`` as in ``.hgrm``."""
+        rows = []
+        for p in PERCENTILES:
+            q = p / 100.0
+            inverse = float("inf") if q >= 1.0 else 1.0 / (1.0 - q)
+            rank = self.total if q >= 1.0 else max(1, math.ceil(q * self.total))
+            rows.append((self.percentile(p) / 1000.0, q, rank, inverse))
+        return rows
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+def synthetic_corpus(n, seed=0):
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(SEED_SENTENCES) for _ in range(int(rng.lognormvariate(2.5, 0.8)) + 2))
+        for _ in range(n)
+    ]
+
+
+def load_corpus(path, n, seed=0):
+    texts = []
+    if os.path.isdir(path):
+        for name in sorted(glob.glob(os.path.join(path, "*.txt"))):
+            with open(name, encoding="utf-8") as fh:
+                texts.append(fh.read())
+    elif path.endswith(".csv"):
+        csv.field_size_limit(sys.maxsize)
+        with open(path, encoding="utf-8", newline="") as fh:
+            for row in csv.DictReader(fh):
+                text = f"{row.get('title') or ''} {row.get('text') or ''}".strip()
+                if text:
+                    texts.append(text)
+    else:
+        with open(path, encoding="utf-8") as fh:
+            texts = [block.strip() for block in fh.read().split("\n\n") if block.strip()]
+    if not texts:
+        raise ValueError(f"No articles found in {path}")
+    rng = random.Random(seed)
+    return rng.sample(texts, n) if len(texts) > n else texts
+
+
+# ---------------------------------------------------------------------------
+# Targets
+# ---------------------------------------------------------------------------
+
+_worker_state = {}
+
+
+def _init_worker(model_dir):
+    import warnings
+
+    warnings.filterwarnings("ignore")
+    from src.analyzer import CredibilityAnalyzer
+    from src.models import ModelLoader
+
+    _worker_state["model"], _worker_state["vectorizer"] = ModelLoader(model_dir).load()
+    _worker_state["analyzer"] = CredibilityAnalyzer()
+
+
+def _analyze(text):
+    state = _worker_state
+    return state["analyzer"].analyze(text, state["model"], state["vectorizer"])["classification"]
+
+
+class InProcessTarget:
+    """Worker processes, each holding an analyzer and the loaded model."""
+
+    def __init__(self, workers, model_dir):
+        self._pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model_dir,))
+        # Start every worker (and load the model) before timing anything
+        list(self._pool.map(_analyze, [SEED_SENTENCES[0] * 3] * workers * 2))
+
+    def submit(self, text):
+        return self._pool.submit(_analyze, text)
+
+    def close(self):
+        self._pool.shutdown()
+
+
+class HttpTarget:
+    """JSON POSTs to an analysis endpoint, one client thread per in-flight request."""
+
+    def __init__(self, url, max_in_flight):
+        self._url = url
+        self._pool = ThreadPoolExecutor(max_in_flight)
+
+    def _post(self, text):
+        body = json.dumps({"text": text}).encode("utf-8")
+        request = urllib.request.Request(
+            self._url, data=body, headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return json.load(response)["classification"]
+
+    def submit(self, text):
+        return self._pool.submit(self._post, text)
+
+    def close(self):
+        self._pool.shutdown()
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_local_server(model_dir):
+    """Start ``serve`` in a child process; return ``(process, url)``."""
+    port = _free_port()
+    cmd = [sys.executable, os.path.abspath(__file__), "serve", "--port", str(port)]
+    if model_dir:
+        cmd += ["--model-dir", model_dir]
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1).close()
+            return process, f"http://127.0.0.1:{port}/analyze"
+        except OSError:
+            if process.poll() is not None:
+                break
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("Local analysis endpoint did not start.")
+
+
+def serve(port, model_dir):
+    """Reference HTTP endpoint: POST /analyze {"text": …} → result JSON."""
+    import warnings
+
+    warnings.filterwarnings("ignore")
+    from src.analyzer import CredibilityAnalyzer
+    from src.models import ModelLoader
+
+    model, vectorizer = ModelLoader(model_dir).load()
+    analyzer = CredibilityAnalyzer()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self._reply(200, {"status": "ok"} if self.path == "/health" else {})
+
+        def do_POST(self):
+            if self.path != "/analyze":
+                return self._reply(404, {"error": "not found"})
+            length = int(self.headers.get("Content-Length", 0))
+            text = json.loads(self.rfile.read(length))["text"]
+            result = analyzer.analyze(text, model, vectorizer)
+            self._reply(200, analyzer.format_json_output(result))
+
+        def _reply(self, status, payload):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    ThreadingHTTPServer(("127.0.0.1", port), Handler).serve_forever()
+
+
+# ---------------------------------------------------------------------------
+# Load generation
+# ---------------------------------------------------------------------------
+
+class _Step:
+    """Collects the outcome of one load step."""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+        self.issued = 0
+        self.done = threading.Event()
+        self._outstanding = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def track(self, future, start, on_done=None):
+        with self._lock:
+            self._outstanding += 1
+            self.issued += 1
+
+        def finished(f):
+            if f.exception() is None:
+                self.histogram.record(time.perf_counter() - start)
+            else:
+                with self._lock:
+                    self.errors += 1
+            if on_done is not None:
+                on_done()
+            with self._lock:
+                self._outstanding -= 1
+                if self._closed and not self._outstanding:
+                    self.done.set()
+
+        future.add_done_callback(finished)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            if not self._outstanding:
+                self.done.set()
+
+
+def open_loop(target, corpus, rate, duration, seed=0):
+    """Poisson arrivals at *rate*; latency counted from the scheduled time."""
+    rng = random.Random(seed)
+    step = _Step()
+    t0 = time.perf_counter()
+    scheduled, i = t0, 0
+    while True:
+        scheduled += rng.expovariate(rate)
+        if scheduled - t0 >= duration:
+            break
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        step.track(target.submit(corpus[i % len(corpus)]), scheduled)
+        i += 1
+    step.close()
+    step.done.wait()
+    return step, time.perf_counter() - t0
+
+
+def closed_loop(target, corpus, concurrency, duration):
+    """*concurrency* requests in flight until *duration* has elapsed."""
+    step = _Step()
+    lock = threading.Lock()
+    counter = [0]
+    t0 = time.perf_counter()
+    deadline = t0 + duration
+
+    def launch():
+        if time.perf_counter() >= deadline:
+            return
+        with lock:
+            i = counter[0]
+            counter[0] += 1
+        step.track(target.submit(corpus[i % len(corpus)]), time.perf_counter(), launch)
+
+    for _ in range(concurrency):
+        launch()
+    # Requests are only launched before the deadline, so the last ones end soon after
+    while time.perf_counter() < deadline:
+        time.sleep(0.05)
+    step.close()
+    step.done.wait()
+    return step, time.perf_counter() - t0
+
+
+def summarise(step, elapsed, **load):
+    h = step.histogram
+    row = dict(load)
+    row.update({
+        "completed": h.total,
+        "errors": step.errors,
+        "throughput_rps": round(h.total / elapsed, 2) if elapsed else 0.0,
+        **{f"p{p:g}_ms": round(h.percentile(p) / 1000.0, 3) for p in PERCENTILES[:-1]},
+        "max_ms": round(h.max_us / 1000.0, 3),
+        "distribution": [list(r) for r in h.distribution()],
+    })
+    return row
+
+
+def print_step(row):
+    load = (f"rate {row['offered_rps']:g}/s" if "offered_rps" in row
+            else f"concurrency {row['concurrency']}")
+    print(f"\n{load}: {row['completed']:,} ok, {row['errors']} errors, "
+          f"{row['throughput_rps']:.1f} req/s")
+    print(f"  {'Value (ms)':>12} {'Percentile':>12} {'TotalCount':>11} {'1/(1-P)':>10}")
+    for value, q, count, inverse in row["distribution"]:
+        inv = "inf" if inverse == float("inf") else f"{inverse:.2f}"
+        print(f"  {value:>12.3f} {q:>12.6f} {count:>11,} {inv:>10}")
+
+
+def print_curve(rows, slo_ms):
+    print(f"\nThroughput vs latency (SLO: p99 ≤ {slo_ms:g} ms)")
+    print(f"{'load':>16}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}  SLO")
+    for row in rows:
+        load = (f"{row['offered_rps']:g}/s" if "offered_rps" in row
+                else f"c={row['concurrency']}")
+        print(f"{load:>16}{row['throughput_rps']:>10.1f}{row['p50_ms']:>10.1f}"
+              f"{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}  "
+              f"{'ok' if row['meets_slo'] else 'MISS'}")
+
+
+def run(args):
+    corpus = (load_corpus(args.corpus, args.corpus_size) if args.corpus
+              else synthetic_corpus(args.corpus_size))
+    rates = args.rates or []
+    concurrency = args.concurrency or ([] if rates else [1, 2, 4, 8])
+
+    server = None
+    if args.target == "http":
+        url = args.url
+        if url is None:
+            server, url = start_local_server(args.model_dir)
+        target = HttpTarget(url, max(concurrency + [args.max_in_flight]))
+    else:
+        target = InProcessTarget(args.workers, args.model_dir)
+
+    rows = []
+    try:
+        for rate in rates:
+            open_loop(target, corpus, rate, args.warmup)
+            step, elapsed = open_loop(target, corpus, rate, args.duration)
+            # Compare with the arrivals actually drawn, not the nominal rate
+            arrived = step.issued / args.duration
+            row = summarise(step, elapsed, offered_rps=rate)
+            row["meets_slo"] = (row["p99_ms"] <= args.slo_ms and not step.errors
+                                and row["throughput_rps"] >= SUSTAINED_SHARE * arrived)
+            rows.append(row)
+            print_step(row)
+        for n in concurrency:
+            closed_loop(target, corpus, n, args.warmup)
+            step, elapsed = closed_loop(target, corpus, n, args.duration)
+            row = summarise(step, elapsed, concurrency=n)
+            row["meets_slo"] = row["p99_ms"] <= args.slo_ms and not step.errors
+            rows.append(row)
+            print_step(row)
+    finally:
+        target.close()
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print_curve(rows, args.slo_ms)
+    sustainable = [r["throughput_rps"] for r in rows if r["meets_slo"]]
+    best = max(sustainable) if sustainable else None
+    print(f"\nMax sustainable throughput: "
+          f"{f'{best:.1f} req/s' if best is not None else 'none of the steps met the SLO'}")
+    return {
+        "target": args.target,
+        "workers": args.workers if args.target == "inproc" else None,
+        "corpus": args.corpus or "synthetic",
+        "corpus_size": len(corpus),
+        "duration_s": args.duration,
+        "slo_p99_ms": args.slo_ms,
+        "max_sustainable_rps": best,
+        "steps": rows,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_cmd = commands.add_parser("run", help="Run a load test.")
+    run_cmd.add_argument("--target", choices=("inproc", "http"), default="inproc")
+    run_cmd.add_argument("--url", help="Endpoint for --target http (default: local server).")
+    run_cmd.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                         help="Analyzer processes for --target inproc.")
+    run_cmd.add_argument("--rates", type=float, nargs="+", help="Open-loop rates (req/s).")
+    run_cmd.add_argument("--concurrency", type=int, nargs="+", help="Closed-loop in-flight counts.")
+    run_cmd.add_argument("--max-in-flight", type=int, default=64,
+                         help="HTTP client threads for open-loop steps.")
+    run_cmd.add_argument("--duration", type=float, default=10.0, help="Seconds per step.")
+    run_cmd.add_argument("--warmup", type=float, default=2.0, help="Unrecorded seconds per step.")
+    run_cmd.add_argument("--slo-ms", type=float, default=250.0, help="p99 latency objective.")
+    run_cmd.add_argument("--corpus", help="CSV, .txt or directory of .txt articles.")
+    run_cmd.add_argument("--corpus-size", type=int, default=500)
+    run_cmd.add_argument("--model-dir", help="Model artefacts (default: models/).")
+    run_cmd.add_argument("--out", help="Write the JSON report here.")
+
+    serve_cmd = commands.add_parser("serve", help="Run the reference HTTP endpoint.")
+    serve_cmd.add_argument("--port", type=int, default=8765)
+    serve_cmd.add_argument("--model-dir")
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        serve(args.port, args.model_dir)
+        return 0
+
+    report = run(args)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,347 @@
+"""
+Memory harness: peak and retained memory of analysis and training.
+
+Measures, with ``tracemalloc`` (Python and NumPy allocations) and the
+process resident set size (everything, including C extensions):
+
+* each ``train_model.py`` stage — CSV load, cleaning, TF-IDF fit, split,
+  model training and cross-validation — on the real dataset if present,
+  else on a synthetic WELFake-shaped CSV;
+* ``CredibilityAnalyzer.analyze`` at several input sizes;
+* the vectorised batch path (``detect_patterns_batch`` + one
+  ``transform`` + ``score_batch``) at several batch sizes.
+
+For every measurement it records
+
+* ``peak_bytes`` / ``retained_bytes`` — traced allocations at the peak of
+  the step and still alive after it returns (its outputs and caches);
+* ``rss_peak_bytes`` / ``rss_retained_bytes`` — the same from the RSS
+  (the peak is exact on Linux, where it is reset before each step; on
+  other systems it is the process high-water mark and only grows).
+
+Results are written as JSON.  With ``--budget`` they are compared against
+an earlier results file, and the run fails (exit code 1) if any traced
+figure grew by more than ``--tolerance`` percent.
+
+Cross-validation runs with ``n_jobs=1`` by default so all of its memory is
+in this process; ``--cv-jobs -1`` reproduces training but leaves the
+workers' memory unmeasured.
+
+Usage
+-----
+    python benchmarks/memory_harness.py [--rows 5000] [--out memory.json]
+    python benchmarks/memory_harness.py --write-budget benchmarks/memory_budget.json
+    python benchmarks/memory_harness.py --budget benchmarks/memory_budget.json --tolerance 10
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+import train_model  # noqa: E402
+from src.analyzer import CredibilityAnalyzer  # noqa: E402
+from src.patterns import PatternDetector  # noqa: E402
+from src.utils import clean_text_for_model  # noqa: E402
+
+# Figures compared against the budget; RSS is too noisy to gate on
+BUDGETED_FIELDS = ("peak_bytes", "retained_bytes")
+# Growth below this is ignored whatever the percentage (allocator noise)
+MIN_REGRESSION_BYTES = 256 * 1024
+
+CREDIBLE_WORDS = (
+    "study published journal researchers university data survey report "
+    "officials confirmed according analysis evidence percent trial results "
+    "professor institute statistics sample review method findings"
+).split()
+FAKE_WORDS = (
+    "shocking secret truth exposed hidden cover agenda elites mainstream "
+    "media wake deep state they don't want you know banned censored "
+    "miracle insiders leaked"
+).split()
+COMMON_WORDS = (
+    "the government people city year new week said would could also after "
+    "first last time country world health news market school water plan"
+).split()
+
+SEED_SENTENCES = [
+    "Scientists at Stanford University published a peer-reviewed study in Nature.",
+    "Sources say the deep state is covering up the false flag operation!",
+    "Dr. Chen of the U.S. health agency said the rate fell to 0.1% last year.",
+    "SHOCKING: mainstream media will never report the hidden truth.",
+    "The research data was analysed by professors over six months.",
+]
+
+
+# ---------------------------------------------------------------------------
+# Memory probes
+# ---------------------------------------------------------------------------
+
+def _rss_bytes():
+    """Current resident set size, or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _reset_rss_peak():
+    """Reset the kernel's RSS high-water mark (Linux); True on success."""
+    try:
+        with open("/proc/self/clear_refs", "w") as fh:
+            fh.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _rss_peak_bytes():
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(fn, *args, **kwargs):
+    """
+    Run ``fn(*args, **kwargs)`` and measure its memory.
+
+    Returns:
+        ``(return value, record)``; the return value is kept alive while
+        retained memory is read, so it counts as retained.
+    """
+    gc.collect()
+    rss_before = _rss_bytes()
+    exact_rss_peak = _reset_rss_peak()
+    tracemalloc.start()
+    traced_before = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        value = fn(*args, **kwargs)
+
+    seconds = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    rss_peak = _rss_peak_bytes()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    rss_after = _rss_bytes()
+
+    record = {
+        "seconds": round(seconds, 4),
+        "peak_bytes": peak - traced_before,
+        "retained_bytes": retained - traced_before,
+        "rss_peak_bytes": None,
+        "rss_retained_bytes": None,
+        "rss_peak_exact": exact_rss_peak,
+    }
+    if rss_before is not None and rss_after is not None:
+        record["rss_retained_bytes"] = rss_after - rss_before
+        if rss_peak is not None:
+            record["rss_peak_bytes"] = rss_peak - rss_before
+    return value, record
+
+
+# ---------------------------------------------------------------------------
+# Workloads
+# ---------------------------------------------------------------------------
+
+def synthetic_csv(path, rows, seed=0):
+    """Write a WELFake-shaped CSV (title, text, label) with *rows* rows."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(rows):
+        label = i % 2
+        pool = CREDIBLE_WORDS if label else FAKE_WORDS
+        # A long tail of rare terms so the vocabulary grows like real news
+        words = [
+            rng.choice(pool) if rng.random() < 0.3
+            else rng.choice(COMMON_WORDS) if rng.random() < 0.6
+            else f"term{int(rng.paretovariate(1.2)) % 200_000}"
+            for _ in range(rng.randint(80, 400))
+        ]
+        title = " ".join(rng.choice(pool) for _ in range(8)).capitalize()
+        records.append((title, " ".join(words) + ".", label))
+    pd.DataFrame(records, columns=["title", "text", "label"]).to_csv(path)
+
+
+def article_of(n_chars):
+    parts, size, i = [], 0, 0
+    while size < n_chars:
+        sentence = SEED_SENTENCES[i % len(SEED_SENTENCES)]
+        parts.append(sentence)
+        size += len(sentence) + 1
+        i += 1
+    return " ".join(parts)[:n_chars]
+
+
+def batch_pipeline(analyzer, detector, texts, model, vectorizer):
+    """The vectorised batch path, in-process."""
+    patterns = detector.detect_patterns_batch(texts, n_jobs=1)
+    features = vectorizer.transform([clean_text_for_model(t) for t in texts])
+    predictions, confidences = analyzer.model_inference_batch(model, features)
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    return analyzer.score_batch(patterns, confidences, predictions, lengths)
+
+
+def run(args):
+    results = {}
+
+    # -- Training stages ----------------------------------------------------
+    tmp = None
+    csv_path = args.csv
+    if csv_path is None and os.path.exists(train_model.DATASET_PATH):
+        csv_path = train_model.DATASET_PATH
+    if csv_path is None:
+        tmp = tempfile.TemporaryDirectory()
+        csv_path = os.path.join(tmp.name, "synthetic.csv")
+        synthetic_csv(csv_path, args.rows)
+
+    try:
+        df, results["train.csv_load"] = measure(train_model.load_dataset, csv_path)
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+    df, results["train.clean"] = measure(train_model.clean_dataset, df)
+    (tfidf, X), results["train.tfidf_fit"] = measure(
+        train_model.build_features, df["content"]
+    )
+    y = df["label"]
+    content = df["content"]
+    del df
+    split, results["train.split"] = measure(train_model.split_data, X, y)
+    trained, results["train.fit_candidates"] = measure(train_model.train_candidates, *split)
+    best_name, model = trained[1], trained[2]
+    del split, trained
+    _, results["train.cv"] = measure(
+        train_model.cross_validate_model,
+        best_name, train_model.make_candidates()[best_name], content, y,
+        cv=train_model.CV_FOLDS, n_jobs=args.cv_jobs,
+    )
+    del X, y, content
+
+    # -- analyze() at several input sizes -----------------------------------
+    analyzer = CredibilityAnalyzer()
+    analyzer.analyze(article_of(2_000), model, tfidf)  # one-off caches
+    for size in args.analyze_sizes:
+        text = article_of(size)
+        _, results[f"analyze.{size}"] = measure(analyzer.analyze, text, model, tfidf)
+
+    # -- Batch path at several batch sizes ----------------------------------
+    detector = PatternDetector()
+    for size in args.batch_sizes:
+        texts = [article_of(500 + 37 * (i % 50)) for i in range(size)]
+        _, results[f"batch.{size}"] = measure(
+            batch_pipeline, analyzer, detector, texts, model, tfidf
+        )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "dataset": "synthetic" if tmp is not None else csv_path,
+            "rows": args.rows if tmp is not None else None,
+            "cv_jobs": args.cv_jobs,
+        },
+        "measurements": results,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Budgets and reporting
+# ---------------------------------------------------------------------------
+
+def compare(measurements, budget, tolerance):
+    """Return ``(name, field, budget, actual)`` for every regression."""
+    regressions = []
+    for name, allowed in budget.get("measurements", {}).items():
+        actual = measurements.get(name)
+        if actual is None:
+            continue
+        for field in BUDGETED_FIELDS:
+            limit = allowed.get(field)
+            if limit is None:
+                continue
+            excess = actual[field] - limit
+            if excess > MIN_REGRESSION_BYTES and excess > abs(limit) * tolerance / 100:
+                regressions.append((name, field, limit, actual[field]))
+    return regressions
+
+
+def _mib(n):
+    return "-" if n is None else f"{n / 2**20:,.1f}"
+
+
+def print_table(measurements):
+    print(f"{'step':<24}{'peak MiB':>10}{'kept MiB':>10}{'RSS pk MiB':>12}"
+          f"{'RSS kept':>10}{'time s':>9}")
+    for name, r in measurements.items():
+        print(f"{name:<24}{_mib(r['peak_bytes']):>10}{_mib(r['retained_bytes']):>10}"
+              f"{_mib(r['rss_peak_bytes']):>12}{_mib(r['rss_retained_bytes']):>10}"
+              f"{r['seconds']:>9.2f}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--csv", help="Training CSV (default: dataset/ or synthetic).")
+    parser.add_argument("--rows", type=int, default=5000, help="Synthetic CSV rows.")
+    parser.add_argument("--analyze-sizes", type=int, nargs="+",
+                        default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[100, 1_000, 5_000])
+    parser.add_argument("--cv-jobs", type=int, default=1)
+    parser.add_argument("--out", default="memory_results.json", help="Results JSON path.")
+    parser.add_argument("--budget", help="Earlier results JSON to compare against.")
+    parser.add_argument("--tolerance", type=float, default=10.0,
+                        help="Allowed growth over the budget, in percent.")
+    parser.add_argument("--write-budget", help="Also save the results here as the budget.")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    report = run(args)
+    print_table(report["measurements"])
+    print()
+    for path in filter(None, (args.out, args.write_budget)):
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"Wrote {path}")
+
+    if args.budget:
+        with open(args.budget, encoding="utf-8") as fh:
+            budget = json.load(fh)
+        regressions = compare(report["measurements"], budget, args.tolerance)
+        for name, field, limit, actual in regressions:
+            print(f"REGRESSION {name} {field}: {_mib(actual)} MiB "
+                  f"> budget {_mib(limit)} MiB (+{args.tolerance:g}%)")
+        if regressions:
+            return 1
+        print(f"\nAll steps within {args.tolerance:g}% of {args.budget}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Report: how pattern counts and scores shift from substring to word matching.
+
+Runs ``PatternDetector`` in ``match_mode="substring"`` and ``"word"`` over
+a sample corpus and prints, per keyword family, the mean count in each
+mode, the share of documents whose count changed and the keywords that
+fire only as substrings (e.g. "all" inside "ball").  It closes with the
+shift in ``calculate_pattern_score`` and in the 0–100 credibility score
+at a fixed model output.
+
+The corpus is the WELFake CSV used by ``train_model.py`` (title + text)
+when given, otherwise a built-in sample of credible and fake-style
+articles.
+
+Usage
+-----
+    python benchmarks/report_match_mode_shift.py [path/to/WELFake_Dataset.csv] [n_docs]
+"""
+
+import os
+import re
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.analyzer import CredibilityAnalyzer  # noqa: E402
+from src.patterns import PatternDetector  # noqa: E402
+from src.patterns.lexicon import LEXICON_FAMILIES  # noqa: E402
+
+SAMPLE_ARTICLES = [
+    "Scientists at Stanford University have published a peer-reviewed study in "
+    "the journal Nature showing that a new vaccine candidate demonstrates 89% "
+    "efficacy in phase 3 clinical trials involving 30,000 participants. The "
+    "database of results will be made available to all researchers.",
+    "The city council finally approved the budget on Tuesday. Although critics "
+    "called the stadium plan a waste, the mayor said the ball park would bring "
+    "jobs. Officials released the data in a report to the state legislature.",
+    "SHOCKING DISCOVERY: Government Scientists ADMIT Vaccines Contain Dangerous "
+    "Chemicals That Big Pharma Doesn't Want You to Know About!!! An EXPLOSIVE "
+    "new report reveals that mainstream media has been HIDING the truth. This "
+    "is the biggest cover-up in history! Wake up, people!",
+    "You won't believe what happened next. Insiders say the deep state has "
+    "always controlled the weather; every hallway in the capitol is bugged and "
+    "nobody will report it. The statistics are totally hidden from the public.",
+    "Researchers from the university's economics department analysed survey "
+    "responses from 4,000 households. The analysis found that, despite rising "
+    "wages, households were spending a greater percentage of income on housing.",
+    "The truthful account of the storm, published yesterday, describes how "
+    "residents cleared debris overnight. Nevertheless, some say recovery will "
+    "take months, while the governor called the damage devastating.",
+]
+
+
+def load_corpus(path, n_docs):
+    if path is None:
+        return SAMPLE_ARTICLES
+    import pandas as pd
+
+    df = pd.read_csv(path, usecols=["title", "text"], nrows=n_docs).dropna()
+    return (df["title"] + " " + df["text"]).tolist()
+
+
+def substring_only_keywords(texts, detector):
+    """Keywords counted as substrings in places where no whole word matches."""
+    default = detector.default_lexicon()
+    counts = Counter()
+    for text in texts:
+        lowered = text.lower()
+        for family in LEXICON_FAMILIES:
+            for kw in default.families[family]:
+                n_sub = lowered.count(kw)
+                if n_sub:
+                    pattern = r"(?<!\w)" + re.escape(kw) + r"(?!\w)"
+                    n_word = len(re.findall(pattern, lowered))
+                    if n_sub > n_word:
+                        counts[kw] += n_sub - n_word
+    return counts
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    n_docs = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+    texts = load_corpus(path, n_docs)
+
+    analyzers = {
+        mode: CredibilityAnalyzer(match_mode=mode) for mode in PatternDetector.MATCH_MODES
+    }
+    results = {
+        mode: [a._pattern_detector.detect_patterns(t) for t in texts]
+        for mode, a in analyzers.items()
+    }
+    sub, word = results["substring"], results["word"]
+    n = len(texts)
+
+    print(f"{n} documents ({'sample' if path is None else path})\n")
+    print(f"{'pattern':<24}{'substring':>11}{'word':>9}{'changed':>10}")
+    for key in PatternDetector.PATTERN_KEYS:
+        mean_sub = sum(r[key] for r in sub) / n
+        mean_word = sum(r[key] for r in word) / n
+        changed = sum(a[key] != b[key] for a, b in zip(sub, word)) / n
+        print(f"{key:<24}{mean_sub:>11.3f}{mean_word:>9.3f}{changed:>10.1%}")
+
+    print("\nKeywords firing only as substrings (extra hits):")
+    detector = analyzers["substring"]._pattern_detector
+    for kw, extra in substring_only_keywords(texts, detector).most_common(10):
+        print(f"  {kw!r:<18}{extra:>6}")
+
+    scores = {
+        mode: [analyzers[mode].calculate_pattern_score(r) for r in rs]
+        for mode, rs in results.items()
+    }
+    deltas = [b - a for a, b in zip(scores["substring"], scores["word"])]
+    # Credibility at an undecided model (50% confidence, predicted credible)
+    cred = {
+        mode: [analyzers[mode].calculate_credibility_score(0.5, 1, s) for s in ss]
+        for mode, ss in scores.items()
+    }
+    cred_deltas = [b - a for a, b in zip(cred["substring"], cred["word"])]
+
+    print("\npattern_score shift (word - substring):")
+    print(f"  mean {sum(deltas) / n:+.4f}   min {min(deltas):+.4f}   max {max(deltas):+.4f}")
+    print(f"  documents changed: {sum(d != 0 for d in deltas) / n:.1%}")
+    print("credibility_score shift at a 50% model output:")
+    print(f"  mean {sum(cred_deltas) / n:+.2f}   min {min(cred_deltas):+d}   max {max(cred_deltas):+d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,9 @@ from utils import (
     contains_conspiracy_markers
 )
 
+# The built-in keyword lists are the default lexicon families
+from src.utils.terms import DEFAULT_FAMILIES
+
 
 class ClaimHighlighter:
     """
@@ -20,6 +23,20 @@ class ClaimHighlighter:
     cite vague sources, or make extraordinary assertions.
     """
     
+    def __init__(self, lexicon=None):
+        """
+        Initialize the ClaimHighlighter with the claim families of a lexicon.
+
+        Args:
+            lexicon: A src.patterns.Lexicon (default: the built-in lexicon)
+        """
+        families = lexicon.families if lexicon is not None else DEFAULT_FAMILIES
+
+        self.vague_source_patterns = list(families["claim_vague_sources"])
+        self.conspiracy_markers = list(families["claim_conspiracy"])
+        self.extreme_words = list(families["claim_extreme"])
+        self.evidence_markers = list(families["claim_evidence"])
+    
     def identify_suspicious_claims(self, text: str) -> List[str]:
         """
         Identify claims requiring fact-checking based on suspicion score.
@@ -40,19 +57,19 @@ class ClaimHighlighter:
             suspicion_score = 0
             
             # Check for vague sources (weight: 2)
-            if contains_vague_source(sentence):
+            if contains_vague_source(sentence, self.vague_source_patterns):
                 suspicion_score += 2
             
             # Check for extreme language (weight: 1)
-            if contains_extreme_language(sentence):
+            if contains_extreme_language(sentence, self.extreme_words):
                 suspicion_score += 1
             
             # Check for lack of evidence (weight: 1)
-            if not contains_evidence_markers(sentence):
+            if not contains_evidence_markers(sentence, self.evidence_markers):
                 suspicion_score += 1
             
             # Check for conspiracy markers (weight: 2)
-            if contains_conspiracy_markers(sentence):
+            if contains_conspiracy_markers(sentence, self.conspiracy_markers):
                 suspicion_score += 2
             
             # Filter sentences with suspicion score >= 3
@@ -5,69 +5,32 @@ Pattern detection module for identifying linguistic patterns associated with mis
 from typing import Dict
 from utils import count_keywords, count_phrases
 
+# The built-in keyword lists are the default lexicon families
+from src.utils.terms import DEFAULT_FAMILIES
+
 
 class PatternDetector:
     """
     Detects linguistic patterns associated with misinformation in news articles.
     """
     
-    def __init__(self):
-        """Initialize the PatternDetector with predefined pattern keywords and phrases."""
-        # Sensational phrases keywords
-        self.sensational_keywords = [
-            "SHOCKING", "BREAKING", "UNBELIEVABLE", "EXPOSED",
-            "REVEALED", "SECRET", "HIDDEN", "TRUTH", "BOMBSHELL",
-            "EXPLOSIVE", "STUNNING", "INCREDIBLE"
-        ]
-        
-        # Vague source patterns
-        self.vague_source_patterns = [
-            "sources say", "experts claim", "reports suggest",
-            "allegedly", "rumored", "according to sources",
-            "insiders say", "it is believed", "some say", "many believe"
-        ]
-        
-        # Conspiracy framing keywords
-        self.conspiracy_keywords = [
-            "cover-up", "cover up", "conspiracy", "they don't want you to know",
-            "mainstream media", "wake up", "sheeple", "hidden truth",
-            "secret agenda", "deep state", "false flag", "controlled by"
-        ]
-        
-        # Emotional manipulation keywords
-        self.emotional_keywords = [
-            "outrage", "terrifying", "devastating", "horrifying",
-            "shocking", "disgusting", "appalling", "outrageous",
-            "scandalous", "alarming", "disturbing"
-        ]
-        
-        # Balance indicators (for detecting one-sided narratives)
-        self.balance_indicators = [
-            "however", "although", "on the other hand", "but",
-            "despite", "nevertheless", "yet", "while", "whereas",
-            "conversely", "alternatively"
-        ]
-        
-        # Evidence indicators
-        self.evidence_indicators = [
-            "study", "research", "data", "statistics", "percent",
-            "according to", "published", "journal", "university",
-            "professor", "analysis", "survey", "report"
-        ]
-        
-        # Extreme adjectives
-        self.extreme_adjectives = [
-            "always", "never", "every", "all", "none", "completely",
-            "totally", "absolutely", "definitely", "entirely",
-            "utterly", "wholly"
-        ]
-        
-        # Clickbait patterns
-        self.clickbait_patterns = [
-            "you won't believe", "what happened next", "number",
-            "will shock you", "doctors hate", "one weird trick",
-            "this is why", "the reason why", "you need to see"
-        ]
+    def __init__(self, lexicon=None):
+        """
+        Initialize the PatternDetector with the keyword families of a lexicon.
+
+        Args:
+            lexicon: A src.patterns.Lexicon (default: the built-in lexicon)
+        """
+        families = lexicon.families if lexicon is not None else DEFAULT_FAMILIES
+
+        self.sensational_keywords = list(families["sensational_phrases"])
+        self.vague_source_patterns = list(families["vague_sources"])
+        self.conspiracy_keywords = list(families["conspiracy_framing"])
+        self.emotional_keywords = list(families["emotional_manipulation"])
+        self.balance_indicators = list(families["balance"])
+        self.evidence_indicators = list(families["evidence"])
+        self.extreme_adjectives = list(families["extreme_adjectives"])
+        self.clickbait_patterns = list(families["clickbait"])
     
     def detect_patterns(self, text: str) -> Dict[str, float]:
         """
@@ -1,3 +1,30 @@
+from .cascade import CascadeAnalyzer, CascadeDecision, CascadeMetrics
 from .credibility_analyzer import CredibilityAnalyzer
+from .incremental import IncrementalAnalyzer
+from .lazy_result import LazyAnalysisResult
+from .near_duplicates import NearDuplicateAnalyzer, NearDuplicateIndex
+from .pattern_features import PatternFeatures
+from .result_cache import CachedAnalyzer, CachedIncrementalAnalyzer
+from .records import AnalysisResult, PatternCounts
+from .scheduler import BULK, INTERACTIVE, NEAR_REAL_TIME, LaneConfig, PriorityScheduler
 
-__all__ = ["CredibilityAnalyzer"]
+__all__ = [
+    "AnalysisResult",
+    "BULK",
+    "CachedAnalyzer",
+    "CachedIncrementalAnalyzer",
+    "CascadeAnalyzer",
+    "CascadeDecision",
+    "CascadeMetrics",
+    "CredibilityAnalyzer",
+    "INTERACTIVE",
+    "IncrementalAnalyzer",
+    "LaneConfig",
+    "LazyAnalysisResult",
+    "NEAR_REAL_TIME",
+    "NearDuplicateAnalyzer",
+    "NearDuplicateIndex",
+    "PatternCounts",
+    "PatternFeatures",
+    "PriorityScheduler",
+]
@@ -0,0 +1,544 @@
+"""
+Cascaded analysis: a cheap first tier in front of the full pipeline.
+
+Most inbound articles are plainly credible wire copy or plainly
+suspicious, and do not need vectorisation, term attribution, claim
+scoring and the narrative generators to be classified.
+``CascadeAnalyzer`` screens each article with a first tier:
+
+* the pattern counts (``detect_patterns``, one compiled scan), and
+* a linear score over a pruned vocabulary: the ``vocabulary_size``
+  unigrams with the largest ``|coef × idf|`` of the fitted linear model.
+
+The tier estimates the model margin and classifies the article with the
+same rules as the full pipeline.  If every margin within
+``margin_tolerance`` of the estimate gives the same label, the tier
+decides: ``REAL`` is routed as clean, ``FAKE`` / ``MISLEADING`` as
+suspicious.  Otherwise (and for ``UNVERIFIED``) the article escalates to
+the full pipeline.
+
+Design decisions
+----------------
+* Routing follows the label, not the credibility score.  Models without
+  ``predict_proba`` get a confidence of ``0.5 + |margin| / 10``, so their
+  scores stay near 50 and fixed score thresholds either decide nothing or,
+  once lowered, call suspicious articles clean.
+* The label depends on the margin only through its sign and the
+  confidence thresholds, and confidence grows with ``|margin|``, so
+  checking the two ends of the tolerance interval (and both sides of
+  zero if it straddles it) covers every margin inside it.
+* The tier emulates the TF-IDF row on a ``Counter`` of regex tokens
+  (sublinear tf × idf, L2-normalised over the unigram part), so it needs
+  no sparse matrix, bigram generation or ``predict`` call.  Bigram
+  weights and their share of the norm are missing, so the raw margin is
+  an approximation.  ``calibrate()`` fits ``margin ≈ a · raw + b`` on a
+  sample and picks the smallest tolerance that keeps the tier's labels in
+  agreement with the full pipeline.  Without it the raw margin and a
+  conservative default tolerance are used, and a warning says so.
+* A first-tier decision is returned as a ``LazyAnalysisResult`` built
+  from the estimated model output, the exact pattern counts and the
+  pruned-term attributions.  The narrative fields come from the same
+  code as ``analyze()`` and are only built if read.
+* Escalated articles reuse the tier's pattern counts; apart from that the
+  result is exactly ``CredibilityAnalyzer.analyze()``'s.  ``fields=`` and
+  ``profile=`` behave as in ``CredibilityAnalyzer.analyze()``; selections
+  that never need the model skip the tier.
+* Without a binary linear model (``coef_``) and a fitted TF-IDF
+  vectorizer (``vocabulary_``, ``idf_``) every article escalates.
+* ``metrics`` counts the share each tier handled.  With ``verify_rate``
+  a random share of first-tier decisions is also run through the full
+  pipeline in shadow, which measures the agreement in production.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import re
+import warnings
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from src.utils import clean_text_for_model
+from .credibility_analyzer import CredibilityAnalyzer
+from .lazy_result import (
+    MODEL_STAGE,
+    LazyAnalysisResult,
+    required_stages,
+    resolve_fields,
+)
+
+CLEAN = "clean"
+SUSPICIOUS = "suspicious"
+ESCALATE = "escalate"
+
+_CLAIM_FIELDS = frozenset({"suspicious_claims", "suspicious_claim_spans"})
+_VERIFIED_FIELDS = frozenset({"classification", "credibility_score"})
+
+
+class CascadeDecision(NamedTuple):
+    """Outcome of the first tier for one article."""
+
+    route: str  # CLEAN, SUSPICIOUS or ESCALATE
+    estimated_score: Optional[int]  # None if the tier could not score
+    model_prediction: Optional[int]
+    model_confidence: Optional[float]
+    classification: Optional[str]  # label at the estimated margin
+
+
+class CascadeMetrics:
+    """Counters of how articles were routed (and, if verified, how well)."""
+
+    __slots__ = (
+        "screened", "clean", "suspicious", "escalated",
+        "verified", "agreed", "score_error_total",
+    )
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.screened = self.clean = self.suspicious = self.escalated = 0
+        self.verified = self.agreed = 0
+        self.score_error_total = 0
+
+    @property
+    def first_tier_share(self) -> float:
+        """Share of screened articles decided by the first tier."""
+        return (self.clean + self.suspicious) / self.screened if self.screened else 0.0
+
+    @property
+    def agreement(self) -> Optional[float]:
+        """Share of verified first-tier decisions with the full-pipeline label."""
+        return self.agreed / self.verified if self.verified else None
+
+    @property
+    def mean_score_error(self) -> Optional[float]:
+        """Mean absolute credibility-score difference on verified decisions."""
+        return self.score_error_total / self.verified if self.verified else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "screened": self.screened,
+            "clean": self.clean,
+            "suspicious": self.suspicious,
+            "escalated": self.escalated,
+            "first_tier_share": self.first_tier_share,
+            "verified": self.verified,
+            "agreement": self.agreement,
+            "mean_score_error": self.mean_score_error,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"CascadeMetrics(screened={self.screened}, "
+            f"first_tier_share={self.first_tier_share:.1%}, agreement={self.agreement})"
+        )
+
+
+class _PrunedLinearScorer:
+    """Approximate ``decision_function`` from the top unigrams of a linear model."""
+
+    __slots__ = ("_idf", "_weights", "_token_re", "_lowercase", "_sublinear",
+                 "_intercept", "_classes", "slope", "offset", "calibrated", "warned")
+
+    def __init__(self, model: Any, vectorizer: Any, vocabulary_size: int) -> None:
+        coef = model.coef_[0]
+        idf = vectorizer.idf_
+        unigrams = {t: j for t, j in vectorizer.vocabulary_.items() if " " not in t}
+        self._idf = {t: float(idf[j]) for t, j in unigrams.items()}
+        ranked = sorted(unigrams, key=lambda t: -abs(coef[unigrams[t]] * idf[unigrams[t]]))
+        self._weights = {
+            t: float(coef[unigrams[t]] * idf[unigrams[t]]) for t in ranked[:vocabulary_size]
+        }
+        self._token_re = re.compile(vectorizer.token_pattern)
+        self._lowercase = vectorizer.lowercase
+        self._sublinear = vectorizer.sublinear_tf
+        self._intercept = float(np.ravel(getattr(model, "intercept_", [0.0]))[0])
+        self._classes = getattr(model, "classes_", np.array([0, 1]))
+        self.slope, self.offset = 1.0, 0.0
+        self.calibrated = self.warned = False
+
+    @classmethod
+    def build(cls, model: Any, vectorizer: Any, vocabulary_size: int) -> Optional["_PrunedLinearScorer"]:
+        coef = getattr(model, "coef_", None)
+        if not isinstance(coef, np.ndarray) or coef.ndim != 2 or coef.shape[0] != 1:
+            return None
+        if not all(hasattr(vectorizer, a) for a in ("vocabulary_", "idf_", "token_pattern")):
+            return None
+        if getattr(vectorizer, "analyzer", "word") != "word":
+            return None
+        return cls(model, vectorizer, vocabulary_size)
+
+    def raw_margin(self, cleaned: str) -> Tuple[float, Dict[str, float]]:
+        """Uncalibrated margin and the per-term contributions behind it."""
+        if self._lowercase:
+            cleaned = cleaned.lower()
+        counts = Counter(self._token_re.findall(cleaned))
+        idf, weights = self._idf, self._weights
+        norm_sq = 0.0
+        contributions: Dict[str, float] = {}
+        for term, n in counts.items():
+            term_idf = idf.get(term)
+            if term_idf is None:
+                continue
+            tf = 1.0 + math.log(n) if self._sublinear else float(n)
+            norm_sq += (tf * term_idf) ** 2
+            weight = weights.get(term)
+            if weight is not None:
+                contributions[term] = weight * tf
+        if norm_sq:
+            norm = math.sqrt(norm_sq)
+            contributions = {t: c / norm for t, c in contributions.items()}
+        else:
+            contributions = {}
+        return self._intercept + sum(contributions.values()), contributions
+
+    def margin(self, cleaned: str) -> Tuple[float, Dict[str, float]]:
+        raw, contributions = self.raw_margin(cleaned)
+        return self.slope * raw + self.offset, contributions
+
+    def prediction(self, margin: float) -> int:
+        return int(self._classes[1] if margin > 0 else self._classes[0])
+
+
+class CascadeAnalyzer(CredibilityAnalyzer):
+    """
+    ``CredibilityAnalyzer`` that answers easy articles from a cheap first tier.
+
+    ``calibrate()`` must run once per model before the tier can be trusted:
+    the pruned score leaves out the bigrams, so its raw margin is on a
+    different scale from the model's.  Uncalibrated, the raw margin and
+    ``UNCALIBRATED_TOLERANCE`` are used and a ``RuntimeWarning`` is issued.
+
+    Usage
+    -----
+    >>> cascade = CascadeAnalyzer()
+    >>> cascade.calibrate(sample_texts, model, vectorizer)
+    >>> result = cascade.analyze(text, model, vectorizer)
+    >>> cascade.metrics.first_tier_share, cascade.metrics.agreement
+    """
+
+    UNCALIBRATED_TOLERANCE: float = 1.0
+
+    def __init__(
+        self,
+        margin_tolerance: Optional[float] = None,
+        vocabulary_size: int = 10_000,
+        verify_rate: float = 0.0,
+        seed: Optional[int] = None,
+        **analyzer_kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            margin_tolerance: The tier decides only if the label is the same
+                for every margin within this distance of its estimate
+                (``0`` trusts the estimate, ``math.inf`` disables the tier).
+                ``None`` uses ``UNCALIBRATED_TOLERANCE`` until
+                ``calibrate()`` picks one.
+            vocabulary_size: Unigrams kept for the first-tier linear score.
+            verify_rate: Share of first-tier decisions also run through the
+                full pipeline to measure agreement (``metrics``).
+            seed: Seed of the verification sampling.
+            **analyzer_kwargs: Passed to ``CredibilityAnalyzer``.
+
+        Raises:
+            ValueError: If *margin_tolerance* is negative, or *verify_rate*
+                is outside ``[0, 1]``.
+        """
+        super().__init__(**analyzer_kwargs)
+        if margin_tolerance is not None and not margin_tolerance >= 0.0:
+            raise ValueError(f"margin_tolerance must be >= 0, got {margin_tolerance}.")
+        if not 0.0 <= verify_rate <= 1.0:
+            raise ValueError(f"verify_rate must be in [0, 1], got {verify_rate}.")
+        self.margin_tolerance = (
+            self.UNCALIBRATED_TOLERANCE if margin_tolerance is None else margin_tolerance
+        )
+        self.vocabulary_size = vocabulary_size
+        self.verify_rate = verify_rate
+        self.metrics = CascadeMetrics()
+        self._rng = random.Random(seed)
+        self._scorer_for: Tuple[Any, Any] | None = None
+        self._scorer: _PrunedLinearScorer | None = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def analyze(
+        self,
+        text: str,
+        model: Any,
+        vectorizer: Any,
+        *,
+        lazy: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        profile: bool = False,
+    ) -> Dict[str, Any] | LazyAnalysisResult:
+        """
+        Analyse *text* with the first tier, escalating if it is uncertain.
+
+        Args:
+            text: News article text.
+            model: Trained sklearn classifier.
+            vectorizer: Fitted TF-IDF vectorizer.
+            lazy: Return a ``LazyAnalysisResult`` (see ``CredibilityAnalyzer``).
+            fields: Only produce these result keys (see
+                ``CredibilityAnalyzer``); selections that do not need the
+                model bypass the cascade.
+            profile: Profile the cascaded analysis (see ``CredibilityAnalyzer``).
+
+        Returns:
+            Same result as ``CredibilityAnalyzer.analyze()``; for first-tier
+            decisions the model fields are the tier's estimates.
+
+        Raises:
+            ValueError: As ``CredibilityAnalyzer.analyze()``.
+        """
+        if profile:
+            return super().analyze(
+                text, model, vectorizer, lazy=lazy, fields=fields, profile=True
+            )
+        wanted = resolve_fields(fields)
+        if MODEL_STAGE not in required_stages(wanted):
+            return super().analyze(text, model, vectorizer, lazy=lazy, fields=fields)
+        eager = not lazy and fields is None
+
+        rejected = self._insufficient_input_result(text)
+        if rejected is not None:
+            if eager:
+                return rejected
+            result = LazyAnalysisResult.from_dict(rejected, wanted)
+            return result if lazy else result.to_dict()
+
+        patterns = self._pattern_detector.detect_patterns(text)
+        cleaned = clean_text_for_model(text)
+        decision, contributions = self._screen(text, cleaned, model, vectorizer, patterns)
+        self.metrics.screened += 1
+
+        if decision.route == ESCALATE:
+            self.metrics.escalated += 1
+            if eager:
+                return self._full_result(text, cleaned, model, vectorizer, patterns)
+            result = self._full_result(text, cleaned, model, vectorizer, patterns, wanted)
+            return result if lazy else result.to_dict()
+
+        if decision.route == CLEAN:
+            self.metrics.clean += 1
+        else:
+            self.metrics.suspicious += 1
+        result = LazyAnalysisResult(
+            self, text, wanted,
+            decision.model_prediction, decision.model_confidence, patterns,
+            self._pruned_top_terms(contributions),
+        )
+        if self.ml_claims and wanted & _CLAIM_FIELDS:
+            result.suspicious_claim_spans = self._claim_spans(text, model, vectorizer)
+        if self.verify_rate and self._rng.random() < self.verify_rate:
+            self._verify(result, text, cleaned, model, vectorizer, patterns)
+        return result if lazy else result.to_dict()
+
+    def screen(self, text: str, model: Any, vectorizer: Any) -> CascadeDecision:
+        """
+        Route *text* without analysing it (metrics are not updated).
+
+        Returns:
+            The first-tier ``CascadeDecision``; too-short texts escalate.
+        """
+        if self._insufficient_input_result(text) is not None:
+            return CascadeDecision(ESCALATE, None, None, None, None)
+        patterns = self._pattern_detector.detect_patterns(text)
+        return self._screen(text, clean_text_for_model(text), model, vectorizer, patterns)[0]
+
+    def calibrate(
+        self,
+        texts: Iterable[str],
+        model: Any,
+        vectorizer: Any,
+        target_agreement: float = 0.98,
+    ) -> Dict[str, Any]:
+        """
+        Fit the first-tier margin and ``margin_tolerance`` on a sample of articles.
+
+        The raw first-tier margin is mapped to the model margin by least
+        squares.  The tolerance is then the smallest quantile of the
+        remaining absolute error for which the tier's labels agree with the
+        full pipeline on at least *target_agreement* of the articles it
+        decides; if none does, the largest error is used, which covers
+        every sampled margin.
+
+        Args:
+            texts: Representative articles (a few hundred is plenty).
+            model: Trained binary linear classifier.
+            vectorizer: Fitted TF-IDF vectorizer.
+            target_agreement: Required label agreement on decided articles.
+
+        Returns:
+            ``{"margin_tolerance", "first_tier_share", "clean_share",
+            "suspicious_share", "agreement", "samples"}`` for the chosen
+            tolerance.
+
+        Raises:
+            ValueError: If the model or vectorizer cannot be scored by the
+                first tier, or no text in *texts* is long enough.
+        """
+        scorer = self._scorer_for_pair(model, vectorizer)
+        if scorer is None:
+            raise ValueError("The first tier needs a binary linear model and a TF-IDF vectorizer.")
+        texts = [t for t in texts if self._insufficient_input_result(t) is None]
+        if not texts:
+            raise ValueError("No calibration text is long enough to analyse.")
+
+        cleaned = [clean_text_for_model(t) for t in texts]
+        raw = np.array([scorer.raw_margin(c)[0] for c in cleaned])
+        margins = np.ravel(model.decision_function(vectorizer.transform(cleaned)))
+        if len(texts) > 1 and np.ptp(raw) > 0:
+            scorer.slope, scorer.offset = (float(v) for v in np.polyfit(raw, margins, 1))
+        scorer.calibrated = True
+        estimates = scorer.slope * raw + scorer.offset
+
+        patterns = [self._pattern_detector.detect_patterns(t) for t in texts]
+        full_labels = [
+            CredibilityAnalyzer.analyze(self, t, model, vectorizer, fields=["classification"])
+            ["classification"]
+            for t in texts
+        ]
+        errors = np.abs(margins - estimates)
+        candidates = np.unique(np.quantile(errors, np.linspace(0.5, 1.0, 11)))
+
+        for tolerance in candidates:
+            routes, agree = [], []
+            for text, margin, found, label in zip(texts, estimates, patterns, full_labels):
+                route, tier_label = self._route(text, scorer, float(margin), float(tolerance),
+                                                found, model)
+                routes.append(route)
+                agree.append(tier_label == label)
+            routes, agree = np.array(routes), np.array(agree)
+            decided = routes != ESCALATE
+            agreement = float(agree[decided].mean()) if decided.any() else None
+            if agreement is None or agreement >= target_agreement:
+                break
+        self.margin_tolerance = float(tolerance)
+
+        return {
+            "margin_tolerance": self.margin_tolerance,
+            "first_tier_share": float(decided.mean()),
+            "clean_share": float((routes == CLEAN).mean()),
+            "suspicious_share": float((routes == SUSPICIOUS).mean()),
+            "agreement": agreement,
+            "samples": len(texts),
+        }
+
+    # ------------------------------------------------------------------
+    # Tiers
+    # ------------------------------------------------------------------
+
+    def _scorer_for_pair(self, model: Any, vectorizer: Any) -> _PrunedLinearScorer | None:
+        if self._scorer_for is None or self._scorer_for[0] is not model \
+                or self._scorer_for[1] is not vectorizer:
+            self._scorer = _PrunedLinearScorer.build(model, vectorizer, self.vocabulary_size)
+            self._scorer_for = (model, vectorizer)
+        return self._scorer
+
+    @staticmethod
+    def _tier_confidence(margin: float, model: Any) -> float:
+        """``_model_inference()``'s confidence for a model margin."""
+        if hasattr(model, "predict_proba"):
+            return 1.0 / (1.0 + math.exp(-abs(margin)))
+        return min(1.0, 0.5 + abs(margin) / 10.0)
+
+    def _route(
+        self, text: str, scorer: _PrunedLinearScorer, margin: float, tolerance: float,
+        patterns: Dict[str, float], model: Any,
+    ) -> Tuple[str, str]:
+        """Route for an estimated *margin*, and the label at the estimate."""
+        def label_at(m: float) -> str:
+            return self.classify_credibility(
+                text, scorer.prediction(m), self._tier_confidence(m, model), patterns
+            )
+
+        label = label_at(margin)
+        if label == "UNVERIFIED" or math.isinf(tolerance):
+            return ESCALATE, label
+        # The label only changes with the sign of the margin and with
+        # confidence thresholds, and confidence is monotone in |margin|, so
+        # the interval ends (and both sides of zero) decide it.
+        low, high = margin - tolerance, margin + tolerance
+        points = [low, high]
+        if low <= 0.0 < high:
+            points += [0.0, math.nextafter(0.0, 1.0)]
+        if any(label_at(m) != label for m in points):
+            return ESCALATE, label
+        return (CLEAN if label == "REAL" else SUSPICIOUS), label
+
+    def _screen(
+        self, text: str, cleaned: str, model: Any, vectorizer: Any, patterns: Dict[str, float]
+    ) -> Tuple[CascadeDecision, Dict[str, float]]:
+        """First-tier decision for the article, and its term contributions."""
+        scorer = self._scorer_for_pair(model, vectorizer)
+        if scorer is None:
+            return CascadeDecision(ESCALATE, None, None, None, None), {}
+        if not scorer.calibrated and not scorer.warned:
+            scorer.warned = True
+            warnings.warn(
+                "CascadeAnalyzer is not calibrated for this model; call calibrate() "
+                "on a sample of articles before relying on first-tier decisions.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+        margin, contributions = scorer.margin(cleaned)
+        prediction = scorer.prediction(margin)
+        confidence = self._tier_confidence(margin, model)
+        route, label = self._route(text, scorer, margin, self.margin_tolerance, patterns, model)
+        score = self.calculate_credibility_score(
+            confidence, prediction, self.calculate_pattern_score(patterns)
+        )
+        return CascadeDecision(route, score, prediction, confidence, label), contributions
+
+    def _pruned_top_terms(
+        self, contributions: Dict[str, float]
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        """``term_attributions()`` format over the first tier's pruned terms."""
+        names = np.array(list(contributions), dtype=object)
+        values = np.fromiter(contributions.values(), dtype=np.float64, count=len(names))
+        return self._top_terms(np.arange(len(names)), values, names, self._TOP_TERMS)
+
+    def _full_result(
+        self, text: str, cleaned: str, model: Any, vectorizer: Any,
+        patterns: Dict[str, float], fields: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str, Any] | LazyAnalysisResult:
+        """
+        ``CredibilityAnalyzer.analyze()`` reusing the tier's cleaning and pattern counts.
+
+        Returns the complete result dict, or a ``LazyAnalysisResult`` over
+        *fields* if they are given.
+        """
+        features = vectorizer.transform([cleaned])
+        model_prediction, model_confidence = self._model_inference(model, features)
+        top_terms = self.term_attributions(features, model, vectorizer)
+        if fields is not None:
+            result = LazyAnalysisResult(
+                self, text, fields,
+                model_prediction, model_confidence, patterns, top_terms,
+            )
+            if self.ml_claims and fields & _CLAIM_FIELDS:
+                result.suspicious_claim_spans = self._claim_spans(text, model, vectorizer)
+            return result
+        return self._assemble_result(
+            text, model_prediction, model_confidence, patterns,
+            self._claim_spans(text, model, vectorizer), top_terms,
+        )
+
+    def _verify(
+        self, result: LazyAnalysisResult, text: str, cleaned: str, model: Any,
+        vectorizer: Any, patterns: Dict[str, float],
+    ) -> None:
+        full = self._full_result(
+            text, cleaned, model, vectorizer, patterns, _VERIFIED_FIELDS
+        )
+        self.metrics.verified += 1
+        self.metrics.agreed += result.classification == full.classification
+        self.metrics.score_error_total += abs(result.credibility_score - full.credibility_score)
@@ -10,14 +10,33 @@ Changes vs. original credibility_analyzer.py
   instantiated **once** in ``__init__`` (not on every ``analyze()`` call),
   avoiding repeated object construction.
 * Full type hints throughout.
+* Every per-article scoring helper has an array counterpart (see
+  "Vectorised scoring") that scores N articles at once from an (N × 9)
+  pattern matrix, with results identical to the scalar path.
+* ``analyze(..., lazy=True, fields=...)`` defers narrative text and
+  skips unneeded stages (see ``lazy_result``).
+* ``analyze(..., profile=True)`` attaches a ``cProfile`` report (see
+  ``profiling``).
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse
 
 from src.utils import clean_text_for_model
-from src.patterns import PatternDetector, EmotionalAnalyzer, ClaimHighlighter
+from src.patterns import PatternDetector, EmotionalAnalyzer, ClaimHighlighter, Lexicon
+from .lazy_result import (
+    MODEL_STAGE,
+    PATTERN_STAGE,
+    LazyAnalysisResult,
+    required_stages,
+    resolve_fields,
+)
+from .pattern_features import PatternFeatures
+from .profiling import profile_call
 
 
 class CredibilityAnalyzer:
@@ -55,47 +74,79 @@ class CredibilityAnalyzer:
 
     _MIN_TEXT_LENGTH: int = 50
 
-    def __init__(self) -> None:
-        """Initialise sub-components (created once per analyzer instance)."""
-        self._pattern_detector = PatternDetector()
+    _TOP_TERMS: int = 5
+
+    # (pattern key, saturation divisor or None if already in [0, 1], weight)
+    # in PatternDetector.PATTERN_KEYS order
+    _PATTERN_NORMALIZERS: Tuple[Tuple[str, Optional[float], float], ...] = (
+        ("sensational_phrases",    5.0,  0.15),
+        ("excessive_caps",         None, 0.10),
+        ("vague_sources",          3.0,  0.15),
+        ("conspiracy_framing",     2.0,  0.15),
+        ("emotional_manipulation", 4.0,  0.10),
+        ("one_sided",              None, 0.10),
+        ("no_evidence",            None, 0.10),
+        ("extreme_adjectives",     6.0,  0.10),
+        ("clickbait",              2.0,  0.05),
+    )
+
+    def __init__(
+        self,
+        ml_claims: bool = False,
+        lexicon: Optional[Lexicon] = None,
+        lexicon_cache_dir: Optional[str] = None,
+        match_mode: str = "substring",
+    ) -> None:
+        """
+        Initialise sub-components (created once per analyzer instance).
+
+        Args:
+            ml_claims: Rank suspicious claims by a blend of sentence-level
+                model suspicion and the keyword heuristics (one batched
+                model pass per article) instead of the heuristics alone.
+            lexicon: Per-market keyword lexicon for pattern detection
+                and claim scoring (default: the built-in lists).
+            lexicon_cache_dir: Directory caching the compiled *lexicon*.
+            match_mode: Keyword matching of the pattern detector:
+                ``"substring"`` or whole-``"word"``.
+        """
+        self.ml_claims = ml_claims
+        self._pattern_detector = PatternDetector(lexicon, lexicon_cache_dir, match_mode)
         self._emotional_analyzer = EmotionalAnalyzer()
-        self._claim_highlighter = ClaimHighlighter()
+        self._claim_highlighter = ClaimHighlighter(lexicon)
+
+        # Feature names of the last vectorizer seen by term_attributions()
+        self._term_names_for: Any = None
+        self._term_names: np.ndarray | None = None
 
     # ------------------------------------------------------------------
     # Pattern scoring
     # ------------------------------------------------------------------
 
+    def pattern_features(self, patterns: Dict[str, float]) -> PatternFeatures:
+        """
+        Normalise *patterns* once into a reusable ``PatternFeatures`` object.
+
+        Passing the object (instead of the raw dict) to the scoring,
+        classification, indicator and explanation helpers lets them reuse the
+        cached normalised values, score and consistency.
+        """
+        if isinstance(patterns, PatternFeatures):
+            return patterns
+        return PatternFeatures.from_patterns(patterns, self._PATTERN_NORMALIZERS)
+
     def calculate_pattern_score(self, patterns: Dict[str, float]) -> float:
         """
         Aggregate pattern-detection results into a single suspicion score.
 
         Args:
-            patterns: Dict produced by ``PatternDetector.detect_patterns()``.
+            patterns: Dict produced by ``PatternDetector.detect_patterns()``,
+                or a ``PatternFeatures`` whose cached score is returned.
 
         Returns:
             Float in ``[0.0, 1.0]`` — higher means more suspicious.
         """
-        sensational  = min(1.0, patterns.get("sensational_phrases", 0) / 5.0)
-        excessive_caps = patterns.get("excessive_caps", 0.0)
-        vague_sources  = min(1.0, patterns.get("vague_sources", 0) / 3.0)
-        conspiracy     = min(1.0, patterns.get("conspiracy_framing", 0) / 2.0)
-        emotional      = min(1.0, patterns.get("emotional_manipulation", 0) / 4.0)
-        one_sided      = patterns.get("one_sided", 0.0)
-        no_evidence    = patterns.get("no_evidence", 0.0)
-        extreme_adj    = min(1.0, patterns.get("extreme_adjectives", 0) / 6.0)
-        clickbait      = min(1.0, patterns.get("clickbait", 0) / 2.0)
-
-        return (
-            sensational   * 0.15 +
-            excessive_caps * 0.10 +
-            vague_sources  * 0.15 +
-            conspiracy     * 0.15 +
-            emotional      * 0.10 +
-            one_sided      * 0.10 +
-            no_evidence    * 0.10 +
-            extreme_adj    * 0.10 +
-            clickbait      * 0.05
-        )
+        return self.pattern_features(patterns).score
 
     # ------------------------------------------------------------------
     # Classification
@@ -178,6 +229,272 @@ class CredibilityAnalyzer:
         )
         return round(combined * 100)
 
+    # ------------------------------------------------------------------
+    # Vectorised scoring (N articles at once)
+    # ------------------------------------------------------------------
+
+    def pattern_matrix(self, patterns: Any) -> np.ndarray:
+        """
+        Coerce pattern data to a float ``(N, 9)`` matrix in ``PATTERN_KEYS`` order.
+
+        Accepts the structured array returned by
+        ``PatternDetector.detect_patterns_batch()``, a sequence of
+        ``detect_patterns()`` dicts, or an array that is already ``(N, 9)``.
+        """
+        keys = [key for key, _, _ in self._PATTERN_NORMALIZERS]
+        if isinstance(patterns, np.ndarray) and patterns.dtype.names:
+            return np.column_stack([patterns[k].astype(np.float64) for k in keys])
+        if isinstance(patterns, (list, tuple)) and patterns and isinstance(patterns[0], dict):
+            return np.array([[p.get(k, 0) for k in keys] for p in patterns], dtype=np.float64)
+        return np.asarray(patterns, dtype=np.float64).reshape(-1, len(keys))
+
+    def normalize_pattern_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        """Return the ``(N, 9)`` matrix of per-pattern values saturated to ``[0, 1]``."""
+        norm = np.array(matrix, dtype=np.float64, copy=True)
+        for j, (_, divisor, _) in enumerate(self._PATTERN_NORMALIZERS):
+            if divisor is not None:
+                np.minimum(1.0, norm[:, j] / divisor, out=norm[:, j])
+        return norm
+
+    def calculate_pattern_scores(self, normalized: np.ndarray) -> np.ndarray:
+        """Array form of ``calculate_pattern_score`` over a normalised matrix."""
+        scores = np.zeros(len(normalized))
+        # Accumulate column by column to keep the scalar path's summation order
+        for j, (_, _, weight) in enumerate(self._PATTERN_NORMALIZERS):
+            scores += normalized[:, j] * weight
+        return scores
+
+    def calculate_pattern_consistencies(self, normalized: np.ndarray) -> np.ndarray:
+        """Array form of the pattern-consistency (1 − 2·variance) term."""
+        n_cols = normalized.shape[1]
+        total = np.zeros(len(normalized))
+        for j in range(n_cols):
+            total += normalized[:, j]
+        mean = total / n_cols
+        sq = np.zeros(len(normalized))
+        for j in range(n_cols):
+            dev = normalized[:, j] - mean
+            sq += dev * dev
+        return 1.0 - np.minimum(1.0, (sq / n_cols) * 2.0)
+
+    def classify_credibility_batch(
+        self,
+        model_prediction: np.ndarray,
+        model_confidence: np.ndarray,
+        pattern_scores: np.ndarray,
+        text_lengths: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Array form of ``classify_credibility``; returns a string array of labels."""
+        pred = np.asarray(model_prediction)
+        conf = np.asarray(model_confidence, dtype=np.float64)
+        ps = np.asarray(pattern_scores, dtype=np.float64)
+        short = (
+            np.asarray(text_lengths) < self._MIN_TEXT_LENGTH
+            if text_lengths is not None else np.zeros(len(ps), dtype=bool)
+        )
+        confident_fake = (pred == 0) & (conf > self._FAKE_CONF_THRESHOLD)
+        confident_real = (pred == 1) & (conf > self._REAL_CONF_THRESHOLD)
+
+        # np.select picks the first matching branch, mirroring the if-chain
+        return np.select(
+            [
+                short,
+                confident_fake & (ps > self._FAKE_PATTERN_HIGH),
+                confident_fake,
+                confident_real & (ps < self._REAL_PATTERN_LOW),
+                confident_real,
+                conf < self._LOW_CONF_THRESHOLD,
+                ps > self._MED_PATTERN_THRESHOLD,
+            ],
+            ["UNVERIFIED", "FAKE", "MISLEADING", "REAL", "MISLEADING", "UNVERIFIED", "MISLEADING"],
+            default="REAL",
+        )
+
+    def calculate_credibility_scores(
+        self,
+        model_confidence: np.ndarray,
+        model_prediction: np.ndarray,
+        pattern_scores: np.ndarray,
+    ) -> np.ndarray:
+        """Array form of ``calculate_credibility_score`` (int64, 0–100)."""
+        conf = np.asarray(model_confidence, dtype=np.float64)
+        model_component = np.where(
+            np.asarray(model_prediction) == 1, conf * 100, (1 - conf) * 100
+        )
+        pattern_component = (1 - np.asarray(pattern_scores, dtype=np.float64)) * 100
+        score = (
+            model_component  * self._MODEL_WEIGHT +
+            pattern_component * self._PATTERN_WEIGHT
+        )
+        # np.rint rounds half to even, like the built-in round()
+        return np.rint(np.clip(score, 0, 100)).astype(np.int64)
+
+    def determine_risk_levels(self, credibility_scores: np.ndarray) -> np.ndarray:
+        """Array form of ``determine_risk_level``; returns a string array."""
+        scores = np.asarray(credibility_scores)
+        return np.select(
+            [scores >= self._HIGH_CREDIBILITY, scores >= self._MED_CREDIBILITY],
+            ["Low Risk", "Medium Risk"],
+            default="High Risk",
+        )
+
+    def calculate_confidences(
+        self,
+        model_confidence: np.ndarray,
+        pattern_consistency: np.ndarray,
+    ) -> np.ndarray:
+        """Array form of ``calculate_confidence`` (int64)."""
+        combined = (
+            np.asarray(model_confidence, dtype=np.float64) * self._MODEL_CONFIDENCE_WEIGHT +
+            np.asarray(pattern_consistency, dtype=np.float64) * self._PATTERN_CONSISTENCY_WEIGHT
+        )
+        return np.rint(combined * 100).astype(np.int64)
+
+    def score_batch(
+        self,
+        patterns: Any,
+        model_confidence: np.ndarray,
+        model_prediction: np.ndarray,
+        text_lengths: Optional[np.ndarray] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score N articles at once with NumPy broadcasting.
+
+        Args:
+            patterns: ``(N, 9)`` pattern matrix or anything ``pattern_matrix``
+                accepts (e.g. ``detect_patterns_batch()`` output).
+            model_confidence: ``(N,)`` model confidences.
+            model_prediction: ``(N,)`` model predictions (0 = fake, 1 = real).
+            text_lengths: Optional ``(N,)`` raw text lengths; articles shorter
+                than the minimum are labelled UNVERIFIED, as in the scalar path.
+
+        Returns:
+            Dict of ``(N,)`` arrays: pattern_score, pattern_consistency,
+            classification, credibility_score, risk_level, confidence.
+        """
+        normalized = self.normalize_pattern_matrix(self.pattern_matrix(patterns))
+        pattern_scores = self.calculate_pattern_scores(normalized)
+        consistency = self.calculate_pattern_consistencies(normalized)
+        credibility = self.calculate_credibility_scores(
+            model_confidence, model_prediction, pattern_scores
+        )
+        return {
+            "pattern_score": pattern_scores,
+            "pattern_consistency": consistency,
+            "classification": self.classify_credibility_batch(
+                model_prediction, model_confidence, pattern_scores, text_lengths
+            ),
+            "credibility_score": credibility,
+            "risk_level": self.determine_risk_levels(credibility),
+            "confidence": self.calculate_confidences(model_confidence, consistency),
+        }
+
+    @staticmethod
+    def model_inference_batch(model: Any, features: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Array form of ``_model_inference``: ``(predictions, confidences)``."""
+        predictions = np.asarray(model.predict(features)).astype(np.int64)
+        if hasattr(model, "predict_proba"):
+            confidences = np.asarray(model.predict_proba(features), dtype=np.float64).max(axis=1)
+        elif hasattr(model, "decision_function"):
+            decision = np.abs(np.asarray(model.decision_function(features), dtype=np.float64))
+            confidences = np.minimum(1.0, 0.5 + decision.reshape(len(predictions)) / 10.0)
+        else:
+            confidences = np.full(len(predictions), 0.5)
+        return predictions, confidences
+
+    # ------------------------------------------------------------------
+    # Term attribution (what drove the model score)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _empty_terms() -> Dict[str, List[Tuple[str, float]]]:
+        return {"credible": [], "suspicious": []}
+
+    def _linear_weights(
+        self, model: Any, vectorizer: Any
+    ) -> Tuple[np.ndarray, np.ndarray] | None:
+        """Return ``(coef row, feature names)`` for a binary linear model, else ``None``."""
+        coef = getattr(model, "coef_", None)
+        if not isinstance(coef, np.ndarray) or coef.ndim != 2 or coef.shape[0] != 1:
+            return None
+        if self._term_names_for is not vectorizer:
+            self._term_names = np.asarray(vectorizer.get_feature_names_out(), dtype=object)
+            self._term_names_for = vectorizer
+        if len(self._term_names) != coef.shape[1]:
+            return None
+        return coef[0], self._term_names
+
+    def term_attributions(
+        self, features: Any, model: Any, vectorizer: Any, k: int | None = None
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Return the n-grams that pushed the model towards each class.
+
+        The contribution of term *j* is ``tfidf_j × coef_j``, computed over
+        the non-zero entries of the sparse row only; the top *k* of each
+        sign are picked with ``argpartition``.
+
+        Args:
+            features: ``(1, n_features)`` TF-IDF row of the article.
+            model: Fitted binary linear classifier (has ``coef_``); other
+                models yield empty lists.
+            vectorizer: The vectorizer that produced *features*.
+            k: Terms per side (default ``_TOP_TERMS``).
+
+        Returns:
+            ``{"credible": [(term, contribution), ...], "suspicious": [...]}``
+            sorted by decreasing magnitude.  Positive contributions push
+            towards label 1 (credible).
+        """
+        if not issparse(features) and not isinstance(features, np.ndarray):
+            return self._empty_terms()
+        return self.term_attributions_batch(features, model, vectorizer, k)[0]
+
+    def term_attributions_batch(
+        self, features: Any, model: Any, vectorizer: Any, k: int | None = None
+    ) -> List[Dict[str, List[Tuple[str, float]]]]:
+        """
+        ``term_attributions`` for every row of an ``(N, n_features)`` matrix.
+
+        The element-wise product with ``coef_`` is done once for the whole
+        CSR matrix; only the top-k selection runs per row.
+        """
+        k = self._TOP_TERMS if k is None else k
+        matrix = csr_matrix(features)
+        n_rows = matrix.shape[0]
+        linear = self._linear_weights(model, vectorizer)
+        if linear is None or k < 1:
+            return [self._empty_terms() for _ in range(n_rows)]
+
+        weights, names = linear
+        contributions = matrix.data * weights[matrix.indices]
+        indptr = matrix.indptr
+        return [
+            self._top_terms(
+                matrix.indices[indptr[i]:indptr[i + 1]],
+                contributions[indptr[i]:indptr[i + 1]],
+                names, k,
+            )
+            for i in range(n_rows)
+        ]
+
+    @staticmethod
+    def _top_terms(
+        indices: np.ndarray, contributions: np.ndarray, names: np.ndarray, k: int
+    ) -> Dict[str, List[Tuple[str, float]]]:
+        terms: Dict[str, List[Tuple[str, float]]] = {}
+        for side, signed in (("credible", contributions), ("suspicious", -contributions)):
+            candidates = np.flatnonzero(signed > 0)
+            if len(candidates) > k:
+                candidates = candidates[np.argpartition(-signed[candidates], k - 1)[:k]]
+            # Rounded so that equal rows give equal results across code paths
+            picked = [
+                (names[indices[i]], round(float(contributions[i]), 4)) for i in candidates
+            ]
+            picked.sort(key=lambda item: (-abs(item[1]), item[0]))
+            terms[side] = picked
+        return terms
+
     # ------------------------------------------------------------------
     # Indicator / summary / explanation helpers
     # ------------------------------------------------------------------
@@ -272,6 +589,7 @@ class CredibilityAnalyzer:
         credibility_score: int,
         patterns: Dict[str, float],
         indicators: List[str],
+        top_terms: Dict[str, List[Tuple[str, float]]] | None = None,
     ) -> str:
         """Generate a detailed natural-language explanation of the assessment."""
         class_notes = {
@@ -292,6 +610,20 @@ class CredibilityAnalyzer:
             f"(higher values indicate more suspicious patterns). "
         )
 
+        if top_terms and (top_terms["suspicious"] or top_terms["credible"]):
+            drivers = [
+                f"{', '.join(repr(term) for term, _ in top_terms[side][:3])} ({label})"
+                for side, label in (
+                    ("suspicious", "towards misinformation"),
+                    ("credible", "towards credible reporting"),
+                )
+                if top_terms[side]
+            ]
+            explanation += (
+                "The model's prediction was driven most by the terms "
+                + " and ".join(drivers) + ". "
+            )
+
         if indicators:
             joined = ", and ".join(
                 [", ".join(indicators[:-1]), indicators[-1]]
@@ -324,8 +656,15 @@ class CredibilityAnalyzer:
     # ------------------------------------------------------------------
 
     def analyze(
-        self, text: str, model: Any, vectorizer: Any
-    ) -> Dict[str, Any]:
+        self,
+        text: str,
+        model: Any,
+        vectorizer: Any,
+        *,
+        lazy: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        profile: bool = False,
+    ) -> Dict[str, Any] | LazyAnalysisResult:
         """
         Run the full credibility-assessment pipeline on *text*.
 
@@ -333,13 +672,128 @@ class CredibilityAnalyzer:
             text: News article text.
             model: Trained sklearn classifier.
             vectorizer: Fitted TF-IDF vectorizer.
+            lazy: Return a ``LazyAnalysisResult`` whose narrative fields,
+                emotional tone and claims are only computed on first access.
+            fields: Only produce these result keys.  Stages that none of
+                them depend on are skipped entirely (e.g. ``["patterns"]``
+                never runs the model, ``["suspicious_claims"]`` never runs
+                the model or the pattern detector).
+            profile: Run the analysis under ``cProfile`` and add its
+                ``ProfileReport`` to the result under ``"profile"`` (see
+                ``src.analyzer.profiling``).
 
         Returns:
             Dictionary with keys: classification, credibility_score, risk_level,
             confidence, analysis_summary, key_indicators, emotional_tone,
             suspicious_claims, recommended_action, explanation, model_prediction,
-            pattern_score, patterns.
+            top_terms, pattern_score, pattern_consistency, normalized_patterns,
+            patterns, suspicious_claim_spans — restricted to *fields* if given, or a
+            ``LazyAnalysisResult`` over the same keys if *lazy* is set.
+
+        Raises:
+            ValueError: If *fields* names an unknown result key, or *profile*
+                is combined with *lazy* (deferred work would not be profiled).
+        """
+        if profile:
+            if lazy:
+                raise ValueError("profile=True cannot be combined with lazy=True.")
+            result, report = profile_call(
+                self.analyze, text, model, vectorizer, fields=fields
+            )
+            result = dict(result)
+            result["profile"] = report
+            return result
+
+        if lazy or fields is not None:
+            result = self._analyze_lazy(text, model, vectorizer, resolve_fields(fields))
+            return result if lazy else result.to_dict()
+
+        rejected = self._insufficient_input_result(text)
+        if rejected is not None:
+            return rejected
+
+        # -- ML inference --------------------------------------------------
+        cleaned = clean_text_for_model(text)
+        features = vectorizer.transform([cleaned])
+        model_prediction, model_confidence = self._model_inference(model, features)
+        top_terms = self.term_attributions(features, model, vectorizer)
+
+        # -- Pattern analysis ----------------------------------------------
+        detected_patterns = self._pattern_detector.detect_patterns(text)
+        claim_spans = self._claim_spans(text, model, vectorizer)
+
+        return self._assemble_result(
+            text, model_prediction, model_confidence,
+            detected_patterns, claim_spans, top_terms,
+        )
+
+    def analyze_stream(
+        self,
+        file_like: Any,
+        model: Any,
+        vectorizer: Any,
+        *,
+        chunk_size: int = 1 << 16,
+        on_claim: Optional[Callable[[str, Tuple[int, int]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Analyse a document read from *file_like* in chunks.
+
+        Memory stays bounded by a few chunks however long the document is,
+        and the result equals ``analyze()`` on the concatenated text (see
+        ``src.analyzer.streaming`` for the details and caveats).
+
+        Args:
+            file_like: Object with ``read(n)`` returning ``str`` or UTF-8
+                ``bytes`` (an open file, ``io.StringIO``, a socket file …).
+            model: Trained sklearn classifier.
+            vectorizer: Fitted TF-IDF vectorizer.
+            chunk_size: Characters (or bytes) per ``read`` call.
+            on_claim: Called as ``on_claim(sentence, (start, end))`` as soon
+                as a suspicious sentence has been read.
+
+        Returns:
+            Same dictionary as ``analyze()``.
+
+        Raises:
+            ValueError: If *chunk_size* is not positive.
         """
+        from .streaming import analyze_stream
+
+        return analyze_stream(self, file_like, model, vectorizer, chunk_size, on_claim)
+
+    def _analyze_lazy(
+        self, text: str, model: Any, vectorizer: Any, fields: FrozenSet[str]
+    ) -> LazyAnalysisResult:
+        """Run only the stages *fields* need; defer everything else."""
+        rejected = self._insufficient_input_result(text)
+        if rejected is not None:
+            return LazyAnalysisResult.from_dict(rejected, fields)
+
+        stages = required_stages(fields)
+        model_prediction = model_confidence = detected_patterns = top_terms = None
+        if MODEL_STAGE in stages:
+            features = vectorizer.transform([clean_text_for_model(text)])
+            model_prediction, model_confidence = self._model_inference(model, features)
+            top_terms = self.term_attributions(features, model, vectorizer)
+        if PATTERN_STAGE in stages:
+            detected_patterns = self._pattern_detector.detect_patterns(text)
+
+        result = LazyAnalysisResult(
+            self, text, fields,
+            model_prediction, model_confidence, detected_patterns, top_terms,
+        )
+        # Model-ranked claims need the model, which the lazy result does not keep
+        if self.ml_claims and fields & {"suspicious_claims", "suspicious_claim_spans"}:
+            result.suspicious_claim_spans = self._claim_spans(text, model, vectorizer)
+        return result
+
+    # ------------------------------------------------------------------
+    # Pipeline stages (shared by analyze() and its specialised variants)
+    # ------------------------------------------------------------------
+
+    def _insufficient_input_result(self, text: Any) -> Dict[str, Any] | None:
+        """Return the UNVERIFIED placeholder result, or ``None`` if *text* is usable."""
         _empty_result = {
             "classification": "UNVERIFIED",
             "credibility_score": 0,
@@ -349,10 +803,14 @@ class CredibilityAnalyzer:
             "key_indicators": ["Insufficient input"],
             "emotional_tone": "N/A",
             "suspicious_claims": [],
+            "suspicious_claim_spans": [],
             "recommended_action": "Please provide article text for analysis.",
             "explanation": "INSUFFICIENT INFORMATION",
             "model_prediction": 0,
+            "top_terms": self._empty_terms(),
             "pattern_score": 0.0,
+            "pattern_consistency": 0.0,
+            "normalized_patterns": {},
             "patterns": {},
         }
 
@@ -370,9 +828,25 @@ class CredibilityAnalyzer:
             )
             return _empty_result
 
-        # -- ML inference --------------------------------------------------
-        cleaned = clean_text_for_model(text)
-        features = vectorizer.transform([cleaned])
+        return None
+
+    def _claim_spans(
+        self,
+        text: str,
+        model: Any,
+        vectorizer: Any,
+        score_cache: Optional[Dict[str, int]] = None,
+    ) -> List[Tuple[int, int]]:
+        """Suspicious-claim spans, model-ranked if ``ml_claims`` is set."""
+        if self.ml_claims:
+            return self._claim_highlighter.identify_suspicious_claim_spans(
+                text, score_cache, model, vectorizer
+            )
+        return self._claim_highlighter.identify_suspicious_claim_spans(text, score_cache)
+
+    @staticmethod
+    def _model_inference(model: Any, features: Any) -> Tuple[int, float]:
+        """Return ``(prediction, confidence)`` for a single vectorised article."""
         model_prediction = int(model.predict(features)[0])
 
         if hasattr(model, "predict_proba"):
@@ -384,46 +858,55 @@ class CredibilityAnalyzer:
         else:
             model_confidence = 0.5
 
-        # -- Pattern analysis ----------------------------------------------
-        detected_patterns = self._pattern_detector.detect_patterns(text)
-        pattern_score = self.calculate_pattern_score(detected_patterns)
+        return model_prediction, model_confidence
 
-        # Pattern consistency (low variance = high consistency)
-        norm_vals = [
-            min(1.0, detected_patterns.get("sensational_phrases", 0) / 5.0),
-            detected_patterns.get("excessive_caps", 0.0),
-            min(1.0, detected_patterns.get("vague_sources", 0) / 3.0),
-            min(1.0, detected_patterns.get("conspiracy_framing", 0) / 2.0),
-            min(1.0, detected_patterns.get("emotional_manipulation", 0) / 4.0),
-            detected_patterns.get("one_sided", 0.0),
-            detected_patterns.get("no_evidence", 0.0),
-            min(1.0, detected_patterns.get("extreme_adjectives", 0) / 6.0),
-            min(1.0, detected_patterns.get("clickbait", 0) / 2.0),
-        ]
-        mean_val = sum(norm_vals) / len(norm_vals)
-        variance = sum((v - mean_val) ** 2 for v in norm_vals) / len(norm_vals)
-        pattern_consistency = 1.0 - min(1.0, variance * 2.0)
+    def _assemble_result(
+        self,
+        text: str,
+        model_prediction: int,
+        model_confidence: float,
+        detected_patterns: Dict[str, float],
+        claim_spans: List[Tuple[int, int]],
+        top_terms: Dict[str, List[Tuple[str, float]]] | None = None,
+        suspicious_claims: List[str] | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Combine model output, patterns and claim spans into the result dict.
+
+        *suspicious_claims* defaults to the *claim_spans* slices of *text*;
+        callers that no longer hold the whole text pass them explicitly.
+        With *suspicious_claims* given, *text* is only compared against
+        ``_MIN_TEXT_LENGTH`` (the indicator and tone helpers ignore it), so
+        any prefix of at least that many characters gives the same result.
+        """
+        if top_terms is None:
+            top_terms = self._empty_terms()
+        if suspicious_claims is None:
+            suspicious_claims = [text[start:end] for start, end in claim_spans]
+        # Normalised once; every helper below reads the cached values
+        features = self.pattern_features(detected_patterns)
+        pattern_score = features.score
+        pattern_consistency = features.consistency
 
         # -- Combine -------------------------------------------------------
         classification   = self.classify_credibility(
-            text, model_prediction, model_confidence, detected_patterns
+            text, model_prediction, model_confidence, features
         )
         credibility_score = self.calculate_credibility_score(
             model_confidence, model_prediction, pattern_score
         )
         risk_level    = self.determine_risk_level(credibility_score)
         confidence    = self.calculate_confidence(model_confidence, pattern_consistency)
-        key_indicators = self.extract_key_indicators(detected_patterns, text)
+        key_indicators = self.extract_key_indicators(features, text)
         emotional_tone = self._emotional_analyzer.analyze_emotional_tone(
-            detected_patterns, text
+            features, text
         )
-        suspicious_claims = self._claim_highlighter.identify_suspicious_claims(text)
         analysis_summary  = self.generate_analysis_summary(
             classification, credibility_score, key_indicators
         )
         recommended_action = self.generate_recommended_action(risk_level)
         explanation = self.generate_explanation(
-            classification, credibility_score, detected_patterns, key_indicators
+            classification, credibility_score, features, key_indicators, top_terms
         )
 
         return {
@@ -435,10 +918,14 @@ class CredibilityAnalyzer:
             "key_indicators":    key_indicators,
             "emotional_tone":    emotional_tone,
             "suspicious_claims": suspicious_claims,
+            "suspicious_claim_spans": claim_spans,
             "recommended_action": recommended_action,
             "explanation":       explanation,
             "model_prediction":  model_prediction,
+            "top_terms":         top_terms,
             "pattern_score":     pattern_score,
+            "pattern_consistency": pattern_consistency,
+            "normalized_patterns": features.normalized_dict(),
             "patterns":          detected_patterns,
         }
 
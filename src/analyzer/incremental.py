@@ -0,0 +1,322 @@
+"""
+Incremental re-analysis for interactively edited articles.
+
+``IncrementalAnalyzer`` produces exactly the same result dict as
+``CredibilityAnalyzer.analyze()`` but memoises the expensive per-segment
+work, so editing one paragraph of a long article only re-processes that
+paragraph.
+
+Design decisions
+----------------
+* **Lines are the paragraph-level unit.**  No keyword, phrase or sentence
+  crosses a newline, so pattern hits are additive over lines and are
+  cached per line.
+* **Sentences are the claim-level unit.**  The suspicion score of a
+  sentence depends on that sentence only, so scores are cached per
+  sentence and the flagged list is rebuilt in document order.
+* **TF-IDF is updated by delta.**  Each line caches its n-gram counts; the
+  article-level count vector is patched with the lines that were added or
+  removed since the previous call.  N-grams that span a line break are
+  recomputed from the cached line head/tail tokens (cheap: O(lines)).
+  The final IDF weighting and normalisation reuse the fitted vectorizer's
+  parameters, so the feature row equals ``vectorizer.transform``.
+* Vectorizers that are not word-level ``TfidfVectorizer``s (or mocks) fall
+  back to a full ``transform`` of the cleaned text.
+* ``lazy=``, ``fields=`` and ``profile=`` calls run the plain pipeline
+  and leave the incremental state alone.
+
+Caveat: ``clean_text_for_model`` strips HTML tags per line here, so a tag
+that itself spans a line break is tokenised differently from a full run.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import TfidfTransformer
+
+from src.patterns import PatternDetector
+from src.utils import clean_text_for_model
+from .credibility_analyzer import CredibilityAnalyzer
+from .lazy_result import LazyAnalysisResult
+
+
+class _LRUDict(OrderedDict):
+    """OrderedDict that evicts its least-recently-inserted entry past *maxsize*."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class _Segment:
+    """Cached per-line state (pattern hits, n-gram counts, edge tokens)."""
+
+    __slots__ = ("hits", "terms", "head", "tail", "n_tokens")
+
+    def __init__(
+        self,
+        hits: Tuple[int, ...],
+        terms: Dict[int, int],
+        head: Tuple[str, ...],
+        tail: Tuple[str, ...],
+        n_tokens: int,
+    ) -> None:
+        self.hits = hits
+        self.terms = terms
+        self.head = head
+        self.tail = tail
+        self.n_tokens = n_tokens
+
+
+class IncrementalAnalyzer(CredibilityAnalyzer):
+    """
+    Drop-in ``CredibilityAnalyzer`` that memoises per-line and per-sentence work.
+
+    Keep one instance per editing session (e.g. in Streamlit session state);
+    the caches hold state about the previously analysed text.
+
+    Usage
+    -----
+    >>> inc = IncrementalAnalyzer()
+    >>> first = inc.analyze(text, model, vectorizer)
+    >>> second = inc.analyze(text_with_one_edit, model, vectorizer)  # fast
+    """
+
+    def __init__(self, max_cached_segments: int = 4096, **analyzer_kwargs: Any) -> None:
+        """
+        Args:
+            max_cached_segments: Lines and sentences kept in each memo.
+            **analyzer_kwargs: Passed to ``CredibilityAnalyzer`` (e.g.
+                ``ml_claims``, ``lexicon``, ``match_mode``).
+        """
+        super().__init__(**analyzer_kwargs)
+        self._segments: Dict[str, _Segment] = _LRUDict(max_cached_segments)
+        self._sentence_scores: Dict[str, int] = _LRUDict(max_cached_segments)
+
+        # State of the previously analysed document
+        self._vectorizer: Any = None
+        self._transformer: TfidfTransformer | None = None
+        self._doc_lines: Counter = Counter()
+        self._hit_totals: List[int] = [0] * len(PatternDetector.HIT_FIELDS)
+        self._term_totals: Dict[int, int] = {}
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def analyze(
+        self,
+        text: str,
+        model: Any,
+        vectorizer: Any,
+        *,
+        lazy: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        profile: bool = False,
+    ) -> Dict[str, Any] | LazyAnalysisResult:
+        """
+        Analyse *text*, re-processing only lines/sentences not seen before.
+
+        Args:
+            text: News article text.
+            model: Trained sklearn classifier.
+            vectorizer: Fitted TF-IDF vectorizer.
+            lazy: See ``CredibilityAnalyzer.analyze()``.
+            fields: See ``CredibilityAnalyzer.analyze()``.
+            profile: See ``CredibilityAnalyzer.analyze()``.
+
+        Returns:
+            Same result as ``CredibilityAnalyzer.analyze()``.  Only complete,
+            eager analyses use (and update) the incremental state.
+        """
+        if lazy or fields is not None or profile:
+            return super().analyze(
+                text, model, vectorizer, lazy=lazy, fields=fields, profile=profile
+            )
+
+        rejected = self._insufficient_input_result(text)
+        if rejected is not None:
+            return rejected
+
+        if vectorizer is not self._vectorizer:
+            self._bind_vectorizer(vectorizer)
+
+        lines = text.split("\n")
+        self._apply_line_delta(Counter(lines))
+
+        if self._transformer is not None:
+            features = self._features_from_counts(lines)
+        else:
+            features = vectorizer.transform([clean_text_for_model(text)])
+        model_prediction, model_confidence = self._model_inference(model, features)
+        top_terms = self.term_attributions(features, model, vectorizer)
+
+        detected_patterns = self._pattern_detector.patterns_from_hits(self._hit_totals)
+        claim_spans = self._claim_spans(
+            text, model, vectorizer, score_cache=self._sentence_scores
+        )
+
+        return self._assemble_result(
+            text, model_prediction, model_confidence,
+            detected_patterns, claim_spans, top_terms,
+        )
+
+    def clear(self) -> None:
+        """Drop all cached segments and the previous-document state."""
+        self._segments.clear()
+        self._sentence_scores.clear()
+        self._vectorizer = None
+        self._transformer = None
+        self._reset_document()
+
+    # ------------------------------------------------------------------
+    # Vectorizer binding
+    # ------------------------------------------------------------------
+
+    def _bind_vectorizer(self, vectorizer: Any) -> None:
+        """Prepare delta TF-IDF for *vectorizer* (or disable it if unsupported)."""
+        self._segments.clear()
+        self._reset_document()
+        self._vectorizer = vectorizer
+        self._transformer = None
+
+        if getattr(vectorizer, "analyzer", None) != "word" or not hasattr(vectorizer, "idf_"):
+            return
+
+        transformer = TfidfTransformer(
+            norm=vectorizer.norm,
+            use_idf=vectorizer.use_idf,
+            smooth_idf=vectorizer.smooth_idf,
+            sublinear_tf=vectorizer.sublinear_tf,
+        )
+        transformer.idf_ = vectorizer.idf_
+        self._transformer = transformer
+        self._preprocess = vectorizer.build_preprocessor()
+        self._tokenize = vectorizer.build_tokenizer()
+        self._stop_words = vectorizer.get_stop_words() or frozenset()
+        self._min_n, self._max_n = vectorizer.ngram_range
+        self._vocabulary = vectorizer.vocabulary_
+
+    def _reset_document(self) -> None:
+        self._doc_lines = Counter()
+        self._hit_totals = [0] * len(PatternDetector.HIT_FIELDS)
+        self._term_totals = {}
+
+    # ------------------------------------------------------------------
+    # Per-line cache and delta maintenance
+    # ------------------------------------------------------------------
+
+    def _segment(self, line: str) -> _Segment:
+        seg = self._segments.get(line)
+        if seg is not None:
+            self._segments.move_to_end(line)
+            return seg
+
+        hits = self._pattern_detector.count_pattern_hits(line)
+        terms: Dict[int, int] = {}
+        head = tail = ()
+        n_tokens = 0
+        if self._transformer is not None:
+            tokens = self._tokens(line)
+            n_tokens = len(tokens)
+            for gram in self._ngrams(tokens):
+                idx = self._vocabulary.get(gram)
+                if idx is not None:
+                    terms[idx] = terms.get(idx, 0) + 1
+            edge = self._max_n - 1
+            head, tail = tuple(tokens[:edge]), tuple(tokens[-edge:]) if edge else ()
+
+        seg = self._segments[line] = _Segment(hits, terms, head, tail, n_tokens)
+        return seg
+
+    def _apply_line_delta(self, new_lines: Counter) -> None:
+        """Patch running hit / term totals with lines added or removed."""
+        old_lines = self._doc_lines
+        for line, old_k in old_lines.items():
+            delta = new_lines.get(line, 0) - old_k
+            if delta:
+                self._add_segment(self._segment(line), delta)
+        for line, new_k in new_lines.items():
+            if line not in old_lines:
+                self._add_segment(self._segment(line), new_k)
+        self._doc_lines = new_lines
+
+    def _add_segment(self, seg: _Segment, times: int) -> None:
+        totals = self._hit_totals
+        for i, h in enumerate(seg.hits):
+            totals[i] += h * times
+        term_totals = self._term_totals
+        for idx, c in seg.terms.items():
+            v = term_totals.get(idx, 0) + c * times
+            if v:
+                term_totals[idx] = v
+            else:
+                del term_totals[idx]
+
+    # ------------------------------------------------------------------
+    # Delta TF-IDF
+    # ------------------------------------------------------------------
+
+    def _tokens(self, line: str) -> List[str]:
+        tokens = self._tokenize(self._preprocess(clean_text_for_model(line)))
+        stop = self._stop_words
+        return [t for t in tokens if t not in stop] if stop else tokens
+
+    def _ngrams(self, tokens: List[str]) -> List[str]:
+        """Replicates the word n-gram expansion of sklearn's CountVectorizer."""
+        min_n, max_n = self._min_n, self._max_n
+        grams: List[str] = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+            for i in range(len(tokens) - n + 1):
+                grams.append(" ".join(tokens[i:i + n]))
+        return grams
+
+    def _boundary_terms(self, lines: List[str]) -> Dict[int, int]:
+        """Count n-grams whose first and last tokens lie on different lines."""
+        counts: Dict[int, int] = {}
+        if self._max_n < 2:
+            return counts
+        edge = self._max_n - 1
+        window: Tuple[str, ...] = ()   # last `edge` tokens of the stream so far
+        for line in lines:
+            seg = self._segment(line)
+            if not seg.n_tokens:
+                continue
+            if window:
+                combined = window + seg.head
+                w = len(window)
+                for n in range(max(self._min_n, 2), self._max_n + 1):
+                    # n-grams ending at head index j (< n-1) that start in window
+                    for j in range(min(n - 1, len(seg.head))):
+                        start = w + j - n + 1
+                        if start < 0:
+                            continue
+                        idx = self._vocabulary.get(" ".join(combined[start:w + j + 1]))
+                        if idx is not None:
+                            counts[idx] = counts.get(idx, 0) + 1
+            window = (window + seg.tail)[-edge:] if seg.n_tokens < edge else seg.tail
+        return counts
+
+    def _features_from_counts(self, lines: List[str]) -> csr_matrix:
+        counts = dict(self._term_totals)
+        for idx, c in self._boundary_terms(lines).items():
+            counts[idx] = counts.get(idx, 0) + c
+
+        indices = np.fromiter(sorted(counts), dtype=np.int64, count=len(counts))
+        data = np.fromiter((counts[i] for i in indices), dtype=np.int64, count=len(counts))
+        if getattr(self._vectorizer, "binary", False):
+            data = np.minimum(data, 1)
+        raw = csr_matrix(
+            (data, indices, np.array([0, len(indices)])),
+            shape=(1, len(self._transformer.idf_)),
+        )
+        return self._transformer.transform(raw).astype(self._vectorizer.dtype, copy=False)
@@ -0,0 +1,281 @@
+"""
+Lazily evaluated analysis result.
+
+``CredibilityAnalyzer.analyze(..., lazy=True)`` returns a
+``LazyAnalysisResult`` instead of the eager result dict.  Bulk pipelines that
+only store ``classification`` and ``credibility_score`` then never pay for
+the narrative strings (summary, explanation, recommended action), the
+emotional-tone pass or claim extraction.
+
+Design decisions
+----------------
+* Every result field is a ``__slots__`` slot.  Reading an unset slot falls
+  through to ``__getattr__``, which computes the field from the cached
+  stage outputs, stores it in the slot and returns it — so each field is
+  computed at most once and later reads are plain slot loads.
+* The expensive inputs (model inference, pattern detection) are computed
+  eagerly by ``analyze()``, so the object never holds the model or
+  vectorizer.  It keeps a reference to the analyzer and the text only.
+* ``fields`` restricts what the object exposes as a mapping / in
+  ``to_dict()``; ``analyze()`` uses it to skip whole stages (model or
+  pattern detection) that no requested field depends on.
+* The object is a read-only ``Mapping`` so ``result["classification"]``
+  keeps working, and ``to_dict()`` returns exactly the eager dict (same
+  keys and order) for ``format_json_output`` or JSON serialisation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, Iterator, Optional
+
+from .pattern_features import PatternFeatures
+
+if TYPE_CHECKING:
+    from .credibility_analyzer import CredibilityAnalyzer
+
+
+# Key order of the eager result dict returned by CredibilityAnalyzer.analyze()
+RESULT_FIELDS = (
+    "classification",
+    "credibility_score",
+    "risk_level",
+    "confidence",
+    "analysis_summary",
+    "key_indicators",
+    "emotional_tone",
+    "suspicious_claims",
+    "suspicious_claim_spans",
+    "recommended_action",
+    "explanation",
+    "model_prediction",
+    "top_terms",
+    "pattern_score",
+    "pattern_consistency",
+    "normalized_patterns",
+    "patterns",
+)
+
+MODEL_STAGE = "model"
+PATTERN_STAGE = "patterns"
+
+# Pipeline stages each field needs (claims only need the text itself)
+_FIELD_STAGES: Dict[str, FrozenSet[str]] = {
+    "classification":         frozenset({MODEL_STAGE, PATTERN_STAGE}),
+    "credibility_score":      frozenset({MODEL_STAGE, PATTERN_STAGE}),
+    "risk_level":             frozenset({MODEL_STAGE, PATTERN_STAGE}),
+    "confidence":             frozenset({MODEL_STAGE, PATTERN_STAGE}),
+    "analysis_summary":       frozenset({MODEL_STAGE, PATTERN_STAGE}),
+    "key_indicators":         frozenset({PATTERN_STAGE}),
+    "emotional_tone":         frozenset({PATTERN_STAGE}),
+    "suspicious_claims":      frozenset(),
+    "suspicious_claim_spans": frozenset(),
+    "recommended_action":     frozenset({MODEL_STAGE, PATTERN_STAGE}),
+    "explanation":            frozenset({MODEL_STAGE, PATTERN_STAGE}),
+    "model_prediction":       frozenset({MODEL_STAGE}),
+    "top_terms":              frozenset({MODEL_STAGE}),
+    "pattern_score":          frozenset({PATTERN_STAGE}),
+    "pattern_consistency":    frozenset({PATTERN_STAGE}),
+    "normalized_patterns":    frozenset({PATTERN_STAGE}),
+    "patterns":               frozenset({PATTERN_STAGE}),
+}
+
+
+def resolve_fields(fields: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """
+    Validate a ``fields=`` selector.
+
+    Args:
+        fields: Field names, a single field name, or ``None`` for all fields.
+
+    Returns:
+        Frozen set of field names.
+
+    Raises:
+        ValueError: If a name is not a result field.
+    """
+    if fields is None:
+        return frozenset(RESULT_FIELDS)
+    if isinstance(fields, str):
+        fields = (fields,)
+    wanted = frozenset(fields)
+    unknown = sorted(wanted.difference(RESULT_FIELDS))
+    if unknown:
+        raise ValueError(f"Unknown result fields: {', '.join(unknown)}")
+    return wanted
+
+
+def required_stages(fields: Iterable[str]) -> FrozenSet[str]:
+    """Return the pipeline stages needed to compute *fields*."""
+    stages: FrozenSet[str] = frozenset()
+    for name in fields:
+        stages |= _FIELD_STAGES[name]
+    return stages
+
+
+class LazyAnalysisResult(Mapping):
+    """
+    Analysis result whose fields are computed on first access.
+
+    Usage
+    -----
+    >>> result = analyzer.analyze(text, model, vectorizer, lazy=True)
+    >>> result.credibility_score           # cheap, no narrative text built
+    >>> result["explanation"]              # built now, cached afterwards
+    >>> analyzer.format_json_output(result.to_dict())
+    """
+
+    __slots__ = RESULT_FIELDS + (
+        "_analyzer", "_text", "_fields", "_model_confidence", "_features",
+    )
+
+    def __init__(
+        self,
+        analyzer: "CredibilityAnalyzer",
+        text: str,
+        fields: FrozenSet[str] = frozenset(RESULT_FIELDS),
+        model_prediction: Optional[int] = None,
+        model_confidence: Optional[float] = None,
+        patterns: Optional[Dict[str, float]] = None,
+        top_terms: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self._analyzer = analyzer
+        self._text = text
+        self._fields = fields
+        self._model_confidence = model_confidence
+        self._features: Optional[PatternFeatures] = None
+        if model_prediction is not None:
+            self.model_prediction = model_prediction
+        if top_terms is not None:
+            self.top_terms = top_terms
+        if patterns is not None:
+            self.patterns = patterns
+            self._features = analyzer.pattern_features(patterns)
+
+    @classmethod
+    def from_dict(
+        cls,
+        result: Dict[str, Any],
+        fields: FrozenSet[str] = frozenset(RESULT_FIELDS),
+    ) -> "LazyAnalysisResult":
+        """Wrap an already complete result dict (e.g. the insufficient-input one)."""
+        obj = cls.__new__(cls)
+        obj._analyzer = None
+        obj._text = ""
+        obj._fields = fields
+        obj._model_confidence = None
+        obj._features = None
+        for name in RESULT_FIELDS:
+            setattr(obj, name, result[name])
+        return obj
+
+    # -- Lazy evaluation ---------------------------------------------------
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when a slot is unset (or the name is not a slot)
+        if name not in _FIELD_STAGES:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        missing = _FIELD_STAGES[name] - self._stages()
+        if missing:
+            raise AttributeError(
+                f"'{name}' needs the {', '.join(sorted(missing))} stage, which was "
+                f"skipped; include it in fields= when calling analyze()"
+            )
+        value = _COMPUTE[name](self)
+        setattr(self, name, value)
+        return value
+
+    def _stages(self) -> FrozenSet[str]:
+        stages = set()
+        if self._model_confidence is not None:
+            stages.add(MODEL_STAGE)
+        if self._features is not None:
+            stages.add(PATTERN_STAGE)
+        return frozenset(stages)
+
+    # -- Mapping protocol over the selected fields -------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in RESULT_FIELDS if name in self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compute every selected field and return the eager-style result dict."""
+        return {name: getattr(self, name) for name in self}
+
+    def __repr__(self) -> str:
+        computed = [name for name in self if _is_set(self, name)]
+        return (
+            f"LazyAnalysisResult(fields={len(self._fields)}, "
+            f"computed={computed})"
+        )
+
+
+def _is_set(obj: LazyAnalysisResult, name: str) -> bool:
+    try:
+        object.__getattribute__(obj, name)
+    except AttributeError:
+        return False
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Field builders — each mirrors one line of CredibilityAnalyzer._assemble_result
+# ---------------------------------------------------------------------------
+
+def _classification(r: LazyAnalysisResult) -> str:
+    return r._analyzer.classify_credibility(
+        r._text, r.model_prediction, r._model_confidence, r._features
+    )
+
+
+def _credibility_score(r: LazyAnalysisResult) -> int:
+    return r._analyzer.calculate_credibility_score(
+        r._model_confidence, r.model_prediction, r._features.score
+    )
+
+
+def _explanation(r: LazyAnalysisResult) -> str:
+    return r._analyzer.generate_explanation(
+        r.classification, r.credibility_score, r._features, r.key_indicators,
+        r.top_terms,
+    )
+
+
+def _analysis_summary(r: LazyAnalysisResult) -> str:
+    return r._analyzer.generate_analysis_summary(
+        r.classification, r.credibility_score, r.key_indicators
+    )
+
+
+_COMPUTE: Dict[str, Callable[[LazyAnalysisResult], Any]] = {
+    "classification":      _classification,
+    "credibility_score":   _credibility_score,
+    "risk_level":          lambda r: r._analyzer.determine_risk_level(r.credibility_score),
+    "confidence":          lambda r: r._analyzer.calculate_confidence(
+        r._model_confidence, r._features.consistency
+    ),
+    "analysis_summary":    _analysis_summary,
+    "key_indicators":      lambda r: r._analyzer.extract_key_indicators(r._features, r._text),
+    "emotional_tone":      lambda r: r._analyzer._emotional_analyzer.analyze_emotional_tone(
+        r._features, r._text
+    ),
+    "suspicious_claim_spans": lambda r: (
+        r._analyzer._claim_highlighter.identify_suspicious_claim_spans(r._text)
+    ),
+    "suspicious_claims":   lambda r: [r._text[s:e] for s, e in r.suspicious_claim_spans],
+    "recommended_action":  lambda r: r._analyzer.generate_recommended_action(r.risk_level),
+    "explanation":         _explanation,
+    "pattern_score":       lambda r: r._features.score,
+    "pattern_consistency": lambda r: r._features.consistency,
+    "normalized_patterns": lambda r: r._features.normalized_dict(),
+}
@@ -0,0 +1,96 @@
+"""
+Per-article normalised pattern features, computed once and shared.
+
+``PatternFeatures`` wraps the raw ``detect_patterns()`` dict together with
+the saturated [0, 1] values derived from it, the weighted pattern score and
+the pattern-consistency term.  It behaves as a read-only mapping over the
+*raw* values, so every helper that used to take the pattern dict
+(``extract_key_indicators``, ``generate_explanation``, the emotional-tone
+classifier, …) accepts it unchanged while scoring reads the cached values.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+
+class PatternFeatures(Mapping):
+    """
+    Immutable view of one article's patterns plus their normalised form.
+
+    Attributes
+    ----------
+    normalized : tuple of float
+        Saturated per-pattern values in normaliser order.
+    score : float
+        Weighted pattern score (``CredibilityAnalyzer.calculate_pattern_score``).
+    consistency : float
+        ``1 − min(1, 2·variance)`` of the normalised values.
+    """
+
+    __slots__ = ("_raw", "keys_order", "normalized", "score", "consistency")
+
+    def __init__(
+        self,
+        raw: Dict[str, float],
+        keys_order: Tuple[str, ...],
+        normalized: Tuple[float, ...],
+        score: float,
+        consistency: float,
+    ) -> None:
+        self._raw = raw
+        self.keys_order = keys_order
+        self.normalized = normalized
+        self.score = score
+        self.consistency = consistency
+
+    @classmethod
+    def from_patterns(
+        cls,
+        patterns: Dict[str, float],
+        normalizers: Sequence[Tuple[str, Optional[float], float]],
+    ) -> "PatternFeatures":
+        """
+        Normalise *patterns* once with ``(key, divisor, weight)`` *normalizers*.
+
+        The score and consistency are accumulated in the same order as the
+        array path in ``CredibilityAnalyzer``, so both give identical floats.
+        """
+        keys = tuple(key for key, _, _ in normalizers)
+        normalized = []
+        score = 0.0
+        for key, divisor, weight in normalizers:
+            value = patterns.get(key, 0)
+            if divisor is not None:
+                value = min(1.0, value / divisor)
+            normalized.append(value)
+            score += value * weight
+
+        mean_val = sum(normalized) / len(normalized)
+        # d * d (not d ** 2): correctly rounded, so the array path matches exactly
+        variance = sum((v - mean_val) * (v - mean_val) for v in normalized) / len(normalized)
+        consistency = 1.0 - min(1.0, variance * 2.0)
+
+        return cls(dict(patterns), keys, tuple(normalized), score, consistency)
+
+    # -- Mapping protocol over the raw values ------------------------------
+
+    def __getitem__(self, key: str) -> float:
+        return self._raw[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def normalized_dict(self) -> Dict[str, float]:
+        """Return ``{pattern key: normalised value}`` (JSON-safe)."""
+        return dict(zip(self.keys_order, self.normalized))
+
+    def __repr__(self) -> str:
+        return (
+            f"PatternFeatures(score={self.score:.4f}, "
+            f"consistency={self.consistency:.4f}, normalized={self.normalized_dict()})"
+        )
@@ -0,0 +1,243 @@
+"""
+cProfile wrapper that reports where one analysis spends its time.
+
+``profile_call()`` runs any callable under ``cProfile`` and returns a
+``ProfileReport`` with two views of the run:
+
+* ``collapsed_stacks()`` — one ``frame;frame;frame <microseconds>`` line
+  per call path, the input format of ``flamegraph.pl``, speedscope and
+  inferno.
+* ``hot_functions()`` — the functions with the most self time, restricted
+  to the modules we own or tune (``src.patterns``, ``src.utils`` and the
+  vectorizer's module).
+
+Design decisions
+----------------
+* Deterministic ``cProfile`` rather than a sampler: a single article runs
+  in milliseconds, which is too short for a sampling profiler to collect
+  a useful number of stacks, while ``cProfile`` sees every call.
+* ``cProfile`` records caller → callee edges, not full stacks.  Call paths
+  are rebuilt from the edges by splitting each function's time between
+  its callers in proportion to the time spent on each edge (the same
+  approximation ``flameprof`` and ``gprof2dot`` use).  A recursive call
+  (a function already on the path) ends the path, because its time is
+  already included in the outer call.
+* Frames are labelled ``module:function:line``, with module names derived
+  from ``sys.path`` so repository code and site-packages read the same way
+  (``src.patterns.matcher:count:123``, not a file path).  The line number
+  tells apart same-named functions such as two ``<listcomp>`` in a module.
+* Only the thread that calls ``profile_call()`` is profiled, matching
+  ``cProfile``'s own behaviour.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Modules whose functions ``hot_functions()`` ranks by default.  The
+# vectorizer's module is added by callers that know which one is in use.
+DEFAULT_HOT_MODULES: Tuple[str, ...] = ("src.patterns", "src.utils")
+
+# pstats function key: (filename, first line number, function name)
+_FuncKey = Tuple[str, int, str]
+
+# Call paths below this share of the run are folded into a single leaf frame
+_MIN_PATH_SECONDS = 1e-6
+
+
+class HotFunction(NamedTuple):
+    """One row of the hot-function table."""
+
+    function: str
+    calls: int
+    self_seconds: float
+    cumulative_seconds: float
+    share: float  # self time as a fraction of the profiled run
+
+
+class ProfileReport:
+    """
+    Profile of one ``profile_call()`` run.
+
+    Usage
+    -----
+    >>> result = analyzer.analyze(text, model, vectorizer, profile=True)
+    >>> report = result["profile"]
+    >>> report.write_collapsed("article.folded")
+    >>> print(report.format_hot_table(extra_modules=["sklearn.feature_extraction"]))
+    """
+
+    __slots__ = ("stats", "wall_seconds", "_labels")
+
+    def __init__(self, profiler: cProfile.Profile, wall_seconds: float) -> None:
+        self.stats = pstats.Stats(profiler)
+        self.wall_seconds = wall_seconds
+        self._labels: Dict[_FuncKey, str] = {}
+
+    @property
+    def total_seconds(self) -> float:
+        """Profiled time (the sum of all self times)."""
+        return self.stats.total_tt
+
+    # ------------------------------------------------------------------
+    # Flamegraph output
+    # ------------------------------------------------------------------
+
+    def collapsed_stacks(self) -> List[str]:
+        """
+        Return the run as collapsed stacks, one line per call path.
+
+        Each line is ``root;caller;…;function <self time in µs>``; paths
+        that round to zero microseconds are omitted.
+        """
+        entries = self.stats.stats
+        children: Dict[_FuncKey, Dict[_FuncKey, float]] = {}
+        for callee, (_, _, _, _, callers) in entries.items():
+            for caller, edge in callers.items():
+                children.setdefault(caller, {})[callee] = edge[3]
+
+        totals: Dict[Tuple[str, ...], float] = {}
+
+        def walk(func: _FuncKey, path: Tuple[_FuncKey, ...], seconds: float) -> None:
+            _, _, self_time, cumulative, _ = entries[func]
+            scale = seconds / cumulative if cumulative else 0.0
+            labels = tuple(self._label(f) for f in path)
+            totals[labels] = totals.get(labels, 0.0) + self_time * scale
+            for child, edge_seconds in children.get(func, {}).items():
+                share = edge_seconds * scale
+                if child in path:
+                    continue
+                if share >= _MIN_PATH_SECONDS:
+                    walk(child, path + (child,), share)
+                else:
+                    # Too small to expand: the child's whole subtree as one leaf
+                    leaf = labels + (self._label(child),)
+                    totals[leaf] = totals.get(leaf, 0.0) + share
+
+        for func, (_, _, _, cumulative, callers) in entries.items():
+            if not callers and not _is_profiler_call(func):
+                walk(func, (func,), cumulative)
+
+        lines = []
+        for labels, seconds in totals.items():
+            micros = round(seconds * 1e6)
+            if micros > 0:
+                lines.append(f"{';'.join(labels)} {micros}")
+        lines.sort()
+        return lines
+
+    def write_collapsed(self, path: str) -> int:
+        """Write ``collapsed_stacks()`` to *path*; return the number of lines."""
+        lines = self.collapsed_stacks()
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.writelines(line + "\n" for line in lines)
+        return len(lines)
+
+    def dump_stats(self, path: str) -> None:
+        """Write the raw ``pstats`` file (for snakeviz, ``python -m pstats``…)."""
+        self.stats.dump_stats(path)
+
+    # ------------------------------------------------------------------
+    # Hot-function table
+    # ------------------------------------------------------------------
+
+    def hot_functions(
+        self, modules: Sequence[str] = DEFAULT_HOT_MODULES, top: int = 15
+    ) -> List[HotFunction]:
+        """
+        Rank the functions of *modules* (and their sub-modules) by self time.
+
+        Args:
+            modules: Dotted module prefixes, e.g. ``"src.patterns"``.
+            top: Maximum number of rows.
+        """
+        total = self.total_seconds or 1.0
+        rows = []
+        for func, (_, calls, self_time, cumulative, _) in self.stats.stats.items():
+            label = self._label(func)
+            module = label.partition(":")[0]
+            if any(module == m or module.startswith(m + ".") for m in modules):
+                rows.append(HotFunction(label, calls, self_time, cumulative, self_time / total))
+        rows.sort(key=lambda row: row.self_seconds, reverse=True)
+        return rows[:top]
+
+    def format_hot_table(
+        self,
+        top: int = 15,
+        extra_modules: Sequence[str] = (),
+    ) -> str:
+        """Render ``hot_functions()`` over the default modules plus *extra_modules*."""
+        modules = DEFAULT_HOT_MODULES + tuple(extra_modules)
+        rows = self.hot_functions(modules, top)
+        header = f"{'#':>3}  {'calls':>8}  {'self ms':>9}  {'cum ms':>9}  {'self %':>6}  function"
+        lines = [header, "-" * len(header)]
+        for rank, row in enumerate(rows, 1):
+            lines.append(
+                f"{rank:>3}  {row.calls:>8,}  {row.self_seconds * 1e3:>9.3f}  "
+                f"{row.cumulative_seconds * 1e3:>9.3f}  {row.share:>6.1%}  {row.function}"
+            )
+        if not rows:
+            lines.append(f"  (no calls in {', '.join(modules)})")
+        return "\n".join(lines)
+
+    # ------------------------------------------------------------------
+    # Frame labels
+    # ------------------------------------------------------------------
+
+    def _label(self, func: _FuncKey) -> str:
+        label = self._labels.get(func)
+        if label is None:
+            filename, line, name = func
+            if filename == "~":  # built-in function or method
+                label = name
+            else:
+                label = f"{_module_name(filename)}:{name}:{line}"
+            # ';' separates frames and the last space the count
+            label = label.replace(";", ",")
+            self._labels[func] = label
+        return label
+
+
+def profile_call(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, ProfileReport]:
+    """
+    Call ``fn(*args, **kwargs)`` under ``cProfile``.
+
+    Returns:
+        ``(return value, ProfileReport)``.
+    """
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        profiler.disable()
+    return result, ProfileReport(profiler, time.perf_counter() - start)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _is_profiler_call(func: _FuncKey) -> bool:
+    return func[0] == "~" and "_lsprof.Profiler" in func[2]
+
+
+def _module_name(filename: str, search_path: Optional[Sequence[str]] = None) -> str:
+    """Dotted module name for *filename*, relative to the longest ``sys.path`` entry."""
+    if filename.startswith("<"):  # <string>, <frozen …>
+        return filename
+    path = os.path.abspath(filename)
+    best = ""
+    for entry in sys.path if search_path is None else search_path:
+        root = os.path.abspath(entry or os.curdir)
+        if path.startswith(root + os.sep) and len(root) > len(best):
+            best = root
+    relative = os.path.relpath(path, best) if best else os.path.basename(path)
+    module = os.path.splitext(relative)[0].replace(os.sep, ".")
+    return module[: -len(".__init__")] if module.endswith(".__init__") else module
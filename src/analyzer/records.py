@@ -0,0 +1,251 @@
+"""
+Compact, slotted records for holding many analysis results in memory.
+
+The result dict returned by ``CredibilityAnalyzer.analyze()`` costs roughly
+a kilobyte of container overhead per article before any of its strings are
+counted: a 16-key dict, a nested 9-key patterns dict, a 9-key normalised
+patterns dict and several lists.  Reporting jobs that keep millions of
+results around use ``AnalysisResult`` / ``PatternCounts`` instead and
+convert back with ``to_dict()`` where the dict API is expected.
+
+Design decisions
+----------------
+* ``__slots__`` only — no per-instance ``__dict__``.
+* Lists become tuples (no over-allocation); claim spans are stored as one
+  flat ``(start, end, start, end, …)`` tuple instead of a list of pairs,
+  and the two ``top_terms`` lists as a pair of tuples.
+* ``normalized_patterns`` is not stored: it is a pure function of the
+  pattern counts and is rebuilt by ``to_dict()``.
+* ``PatternCounts`` is a read-only ``Mapping``, so every helper that takes
+  a pattern dict (``extract_key_indicators``, ``calculate_pattern_score``,
+  the emotional-tone classifier, …) accepts it directly.
+* ``AnalysisResult.from_dict(result).to_dict() == result`` for every dict
+  ``analyze()`` produces.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.patterns import PatternDetector
+from .credibility_analyzer import CredibilityAnalyzer
+from .pattern_features import PatternFeatures
+
+
+class PatternCounts(Mapping):
+    """
+    The nine ``detect_patterns()`` values as slots instead of a dict.
+
+    Usage
+    -----
+    >>> counts = PatternCounts.from_dict(detector.detect_patterns(text))
+    >>> counts.vague_sources, counts["one_sided"]
+    """
+
+    __slots__ = PatternDetector.PATTERN_KEYS
+
+    def __init__(
+        self,
+        sensational_phrases: int = 0,
+        excessive_caps: float = 0.0,
+        vague_sources: int = 0,
+        conspiracy_framing: int = 0,
+        emotional_manipulation: int = 0,
+        one_sided: float = 0.0,
+        no_evidence: float = 0.0,
+        extreme_adjectives: int = 0,
+        clickbait: int = 0,
+    ) -> None:
+        self.sensational_phrases = sensational_phrases
+        self.excessive_caps = excessive_caps
+        self.vague_sources = vague_sources
+        self.conspiracy_framing = conspiracy_framing
+        self.emotional_manipulation = emotional_manipulation
+        self.one_sided = one_sided
+        self.no_evidence = no_evidence
+        self.extreme_adjectives = extreme_adjectives
+        self.clickbait = clickbait
+
+    @classmethod
+    def from_dict(cls, patterns: Mapping) -> "PatternCounts":
+        """Build from a ``detect_patterns()`` dict (missing keys default to 0)."""
+        if isinstance(patterns, cls):
+            return patterns
+        return cls(**{key: patterns[key] for key in cls.__slots__ if key in patterns})
+
+    def to_dict(self) -> Dict[str, float]:
+        """Return the plain ``detect_patterns()`` dict."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    # -- Mapping protocol --------------------------------------------------
+
+    def __getitem__(self, key: str) -> float:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"PatternCounts({self.to_dict()})"
+
+
+class AnalysisResult:
+    """
+    Slotted equivalent of the ``analyze()`` result dict.
+
+    Usage
+    -----
+    >>> record = AnalysisResult.from_dict(analyzer.analyze(text, model, vec))
+    >>> record.credibility_score
+    >>> record.to_dict()          # the original dict again
+    """
+
+    __slots__ = (
+        "classification",
+        "credibility_score",
+        "risk_level",
+        "confidence",
+        "analysis_summary",
+        "key_indicators",
+        "emotional_tone",
+        "suspicious_claims",
+        "_claim_spans",
+        "recommended_action",
+        "explanation",
+        "model_prediction",
+        "_top_terms",
+        "pattern_score",
+        "pattern_consistency",
+        "patterns",
+    )
+
+    def __init__(
+        self,
+        classification: str,
+        credibility_score: int,
+        risk_level: str,
+        confidence: int,
+        analysis_summary: str = "",
+        key_indicators: Tuple[str, ...] = (),
+        emotional_tone: str = "",
+        suspicious_claims: Tuple[str, ...] = (),
+        suspicious_claim_spans: Tuple[Tuple[int, int], ...] = (),
+        recommended_action: str = "",
+        explanation: str = "",
+        model_prediction: int = 0,
+        top_terms: Optional[Mapping] = None,
+        pattern_score: float = 0.0,
+        pattern_consistency: float = 0.0,
+        patterns: Optional[PatternCounts] = None,
+    ) -> None:
+        self.classification = classification
+        self.credibility_score = credibility_score
+        self.risk_level = risk_level
+        self.confidence = confidence
+        self.analysis_summary = analysis_summary
+        self.key_indicators = tuple(key_indicators)
+        self.emotional_tone = emotional_tone
+        self.suspicious_claims = tuple(suspicious_claims)
+        self._claim_spans = tuple(pos for span in suspicious_claim_spans for pos in span)
+        self.recommended_action = recommended_action
+        self.explanation = explanation
+        self.model_prediction = model_prediction
+        self._top_terms = (
+            (tuple(top_terms["credible"]), tuple(top_terms["suspicious"]))
+            if top_terms else ((), ())
+        )
+        self.pattern_score = pattern_score
+        self.pattern_consistency = pattern_consistency
+        self.patterns = patterns
+
+    @classmethod
+    def from_dict(cls, result: Mapping) -> "AnalysisResult":
+        """
+        Build from an ``analyze()`` result dict (or ``LazyAnalysisResult``).
+
+        An empty ``patterns`` dict (insufficient-input results) is stored
+        as ``None``.
+        """
+        patterns = result.get("patterns")
+        return cls(
+            classification=result["classification"],
+            credibility_score=result["credibility_score"],
+            risk_level=result["risk_level"],
+            confidence=result["confidence"],
+            analysis_summary=result.get("analysis_summary", ""),
+            key_indicators=result.get("key_indicators", ()),
+            emotional_tone=result.get("emotional_tone", ""),
+            suspicious_claims=result.get("suspicious_claims", ()),
+            suspicious_claim_spans=result.get("suspicious_claim_spans", ()),
+            recommended_action=result.get("recommended_action", ""),
+            explanation=result.get("explanation", ""),
+            model_prediction=result.get("model_prediction", 0),
+            top_terms=result.get("top_terms"),
+            pattern_score=result.get("pattern_score", 0.0),
+            pattern_consistency=result.get("pattern_consistency", 0.0),
+            patterns=PatternCounts.from_dict(patterns) if patterns else None,
+        )
+
+    @property
+    def suspicious_claim_spans(self) -> List[Tuple[int, int]]:
+        """``(start, end)`` offsets of the suspicious claims."""
+        flat = self._claim_spans
+        return list(zip(flat[::2], flat[1::2]))
+
+    @property
+    def top_terms(self) -> Dict[str, List[Tuple[str, float]]]:
+        """Model term attributions (see ``CredibilityAnalyzer.term_attributions``)."""
+        credible, suspicious = self._top_terms
+        return {"credible": list(credible), "suspicious": list(suspicious)}
+
+    def normalized_patterns(self) -> Dict[str, float]:
+        """Rebuild the ``normalized_patterns`` entry from the stored counts."""
+        if self.patterns is None:
+            return {}
+        return PatternFeatures.from_patterns(
+            self.patterns, CredibilityAnalyzer._PATTERN_NORMALIZERS
+        ).normalized_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dict ``analyze()`` produced (same keys and order)."""
+        return {
+            "classification":    self.classification,
+            "credibility_score": self.credibility_score,
+            "risk_level":        self.risk_level,
+            "confidence":        self.confidence,
+            "analysis_summary":  self.analysis_summary,
+            "key_indicators":    list(self.key_indicators),
+            "emotional_tone":    self.emotional_tone,
+            "suspicious_claims": list(self.suspicious_claims),
+            "suspicious_claim_spans": self.suspicious_claim_spans,
+            "recommended_action": self.recommended_action,
+            "explanation":       self.explanation,
+            "model_prediction":  self.model_prediction,
+            "top_terms":         self.top_terms,
+            "pattern_score":     self.pattern_score,
+            "pattern_consistency": self.pattern_consistency,
+            "normalized_patterns": self.normalized_patterns(),
+            "patterns":          self.patterns.to_dict() if self.patterns is not None else {},
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AnalysisResult):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    __hash__ = None  # mutable record
+
+    def __repr__(self) -> str:
+        return (
+            f"AnalysisResult(classification={self.classification!r}, "
+            f"credibility_score={self.credibility_score}, "
+            f"risk_level={self.risk_level!r})"
+        )
@@ -0,0 +1,189 @@
+"""
+Two-level result cache in front of the analysis pipeline.
+
+``CachedAnalyzer`` looks an article up first in an in-process LRU
+(level 1) and then in a persistent ``src.storage.ResultStore`` (level 2).
+It runs the pipeline only when both miss, and writes the new result to
+both levels.
+
+Design decisions
+----------------
+* Keyed by ``ResultStore.content_hash`` of the raw text, because
+  patterns and claim spans are computed from the raw text and not from
+  the cleaned text.
+* A result is only reused for the model that produced it.  The
+  ``model_version`` is either given or a fingerprint of the pickled
+  model and vectorizer plus the analyzer settings (lexicon hash, match
+  mode, ML claims).  The fingerprint is computed once per model pair,
+  which takes about 0.15 s for the shipped model.  The level-1 cache is
+  cleared when a different model pair is passed.
+* Rejected input (empty or too short) is never cached; the placeholder
+  is cheaper to rebuild than to look up.
+* Callers get their own copy of the result, so mutating it cannot
+  corrupt the cache.
+* Only complete, eager results are cached.  ``lazy=`` and ``fields=``
+  calls go straight to the pipeline, so the store never holds partial
+  results.  ``profile=`` profiles the cached call itself.
+* ``CachedIncrementalAnalyzer`` puts the cache in front of
+  ``IncrementalAnalyzer`` for editing sessions (the Streamlit app).
+  Misses are computed incrementally, and the store can be shared by all
+  sessions.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import pickle
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.storage import ResultStore
+from .credibility_analyzer import CredibilityAnalyzer
+from .incremental import IncrementalAnalyzer
+from .lazy_result import LazyAnalysisResult
+
+
+class CachedAnalyzer(CredibilityAnalyzer):
+    """
+    ``CredibilityAnalyzer`` with a memory LRU and a persistent result store.
+
+    Usage
+    -----
+    >>> cached = CachedAnalyzer(ResultStore("results.db"))
+    >>> result = cached.analyze(text, model, vectorizer, url=url)
+    >>> cached.cache_info()
+    {'memory_hits': 0, 'store_hits': 1, 'misses': 0, 'memory_entries': 1}
+    """
+
+    def __init__(
+        self,
+        store: Optional[ResultStore] = None,
+        memory_entries: int = 10_000,
+        model_version: Optional[str] = None,
+        **analyzer_kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            store: Level-2 store; ``None`` keeps only the memory cache.
+            memory_entries: Results kept in the level-1 LRU (0 disables it).
+            model_version: Fixed version key; default: a fingerprint of
+                the model pair passed to ``analyze()``.
+            **analyzer_kwargs: Passed to ``CredibilityAnalyzer``.
+
+        Raises:
+            ValueError: If *memory_entries* is negative.
+        """
+        if memory_entries < 0:
+            raise ValueError(f"memory_entries must be >= 0, got {memory_entries}.")
+        super().__init__(**analyzer_kwargs)
+        self.store = store
+        self.memory_entries = memory_entries
+        self._fixed_version = model_version
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._bound: Tuple[Any, Any] | None = None
+        self._version = ""
+        self.memory_hits = self.store_hits = self.misses = 0
+
+    def model_version(self, model: Any, vectorizer: Any) -> str:
+        """Version key of results produced with *model* and *vectorizer*."""
+        # (held, not id()s: a freed pair's ids can be reused by a new one)
+        if self._bound is None or self._bound[0] is not model \
+                or self._bound[1] is not vectorizer:
+            self._memory.clear()
+            self._bound = (model, vectorizer)
+            self._version = self._fixed_version or self._fingerprint(model, vectorizer)
+        return self._version
+
+    def analyze(
+        self,
+        text: str,
+        model: Any,
+        vectorizer: Any,
+        *,
+        lazy: bool = False,
+        fields: Optional[Iterable[str]] = None,
+        profile: bool = False,
+        url: Optional[str] = None,
+    ) -> Dict[str, Any] | LazyAnalysisResult:
+        """
+        Cached ``CredibilityAnalyzer.analyze()``.
+
+        Args:
+            text: News article text.
+            model: Trained sklearn classifier.
+            vectorizer: Fitted TF-IDF vectorizer.
+            lazy: See ``CredibilityAnalyzer.analyze()`` (not cached).
+            fields: See ``CredibilityAnalyzer.analyze()`` (not cached).
+            profile: See ``CredibilityAnalyzer.analyze()``; profiles the
+                cache lookup and, on a miss, the pipeline.
+            url: Source URL, stored with a newly computed result.
+
+        Returns:
+            The same result as ``CredibilityAnalyzer.analyze()``.
+        """
+        if lazy or fields is not None or profile:
+            return super().analyze(
+                text, model, vectorizer, lazy=lazy, fields=fields, profile=profile
+            )
+
+        rejected = self._insufficient_input_result(text)
+        if rejected is not None:
+            return rejected
+
+        version = self.model_version(model, vectorizer)
+        key = ResultStore.content_hash(text)
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return copy.deepcopy(result)
+
+        result = self.store.get(key, version) if self.store is not None else None
+        if result is not None:
+            self.store_hits += 1
+        else:
+            self.misses += 1
+            result = super().analyze(text, model, vectorizer)
+            if self.store is not None:
+                self.store.put(key, result, model_version=version, url=url)
+        self._remember(key, result)
+        return copy.deepcopy(result)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Hit / miss counters and the current level-1 size."""
+        return {
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "memory_entries": len(self._memory),
+        }
+
+    def _remember(self, key: str, result: Dict[str, Any]) -> None:
+        if not self.memory_entries:
+            return
+        self._memory[key] = result
+        if len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _fingerprint(self, model: Any, vectorizer: Any) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pickle.dumps((model, vectorizer), protocol=4))
+        detector = self._pattern_detector
+        digest.update(
+            f"{detector.lexicon_hash}|{detector.match_mode}|{self.ml_claims}".encode("utf-8")
+        )
+        return digest.hexdigest()
+
+
+class CachedIncrementalAnalyzer(CachedAnalyzer, IncrementalAnalyzer):
+    """
+    ``CachedAnalyzer`` whose misses are computed by ``IncrementalAnalyzer``.
+
+    Keep one instance per editing session; the store may be shared.
+
+    Usage
+    -----
+    >>> analyzer = CachedIncrementalAnalyzer(store, memory_entries=64, lexicon=lexicon)
+    >>> result = analyzer.analyze(text, model, vectorizer)
+    """
@@ -0,0 +1,333 @@
+"""
+Priority-lane scheduler for sharing one analyzer pool between workloads.
+
+Interactive requests (Streamlit users), near-real-time feeds and bulk
+backfills submit to named lanes instead of directly to an executor:
+
+.. code-block:: python
+
+    with PriorityScheduler(workers=4) as scheduler:
+        future = scheduler.submit(INTERACTIVE, analyzer.analyze, text, model, vectorizer)
+        for text in backfill:
+            scheduler.submit(BULK, analyzer.analyze, text, model, vectorizer)
+        scheduler.metrics()[BULK]["queued"]
+
+Design decisions
+----------------
+* The scheduler keeps the backlog itself and never hands the executor
+  more than ``workers`` tasks.  The executor's own FIFO queue therefore
+  stays empty, and an interactive request waits for at most one running
+  task to finish, not for a 500k-article backfill.
+* Lanes are dequeued by weighted fair (stride) scheduling.  Each dispatch
+  advances the lane's virtual time by ``1 / weight``; the eligible lane
+  with the smallest virtual time goes next, with ties going to the
+  higher-priority lane.  A lane that was idle re-enters at the current
+  virtual time, so it cannot bank credit.  Bulk always progresses, but
+  gets ``1 / (sum of weights)`` of the dispatches under contention and
+  all of them when the other lanes are idle.
+* Per-lane concurrency limits.  By default bulk may use all workers but
+  one, so a worker is always free or freeing up for the other lanes.
+* Any ``concurrent.futures`` executor works.  Use a process pool (with a
+  picklable task that holds its own analyzer and model) to use every
+  core for CPU-bound analysis.  The default thread pool suits I/O-bound
+  tasks or a GIL-releasing model.
+* ``submit`` returns a ``Future`` at once.  Cancelling it while it is
+  still queued removes it from the lane (a done-callback), so it no
+  longer counts toward ``queued`` or ``max_queue``.  A lane with
+  ``max_queue`` set raises ``queue.Full`` when full, as backpressure for
+  producers.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+INTERACTIVE = "interactive"
+NEAR_REAL_TIME = "near_real_time"
+BULK = "bulk"
+
+# Recent queue-wait samples kept per lane for the wait percentiles
+_WAIT_SAMPLES = 1024
+
+
+class LaneConfig(NamedTuple):
+    """Scheduling parameters of one lane."""
+
+    weight: float
+    max_concurrency: Optional[int] = None  # None = all workers
+    max_queue: Optional[int] = None  # None = unbounded
+
+
+class _Lane:
+    __slots__ = ("name", "rank", "weight", "max_concurrency", "max_queue", "queue",
+                 "vtime", "running", "submitted", "completed", "failed", "cancelled",
+                 "rejected", "max_depth", "waits")
+
+    def __init__(self, name: str, rank: int, config: LaneConfig, workers: int) -> None:
+        if config.weight <= 0:
+            raise ValueError(f"Lane '{name}' needs a positive weight, got {config.weight}.")
+        self.name = name
+        self.rank = rank
+        self.weight = float(config.weight)
+        self.max_concurrency = min(workers, config.max_concurrency or workers)
+        if self.max_concurrency < 1:
+            raise ValueError(f"Lane '{name}' needs max_concurrency >= 1.")
+        self.max_queue = config.max_queue
+        self.queue: Deque[Tuple[Future, Callable, tuple, dict, float]] = deque()
+        self.vtime = 0.0
+        self.running = 0
+        self.submitted = self.completed = self.failed = self.cancelled = 0
+        self.rejected = self.max_depth = 0
+        self.waits: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+
+
+class PriorityScheduler:
+    """
+    Weighted-fair, concurrency-limited lanes in front of an executor.
+
+    Usage
+    -----
+    >>> scheduler = PriorityScheduler(workers=4)
+    >>> future = scheduler.submit(INTERACTIVE, analyzer.analyze, text, model, vectorizer)
+    >>> future.result()["classification"]
+    >>> scheduler.metrics()
+    >>> scheduler.shutdown()
+    """
+
+    @staticmethod
+    def default_lanes(workers: int) -> Dict[str, LaneConfig]:
+        """Interactive 16 : near-real-time 4 : bulk 1, bulk leaving one worker free."""
+        return {
+            INTERACTIVE: LaneConfig(weight=16),
+            NEAR_REAL_TIME: LaneConfig(weight=4),
+            BULK: LaneConfig(weight=1, max_concurrency=max(1, workers - 1)),
+        }
+
+    def __init__(
+        self,
+        workers: int = 4,
+        lanes: Optional[Mapping[str, LaneConfig]] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Args:
+            workers: Maximum tasks running at once (give the executor at
+                least this many workers).
+            lanes: Lane name → ``LaneConfig``, in priority order (ties in
+                virtual time go to the earlier lane).  Default:
+                ``default_lanes(workers)``.
+            executor: Executor that runs the tasks.  Default: a thread
+                pool of *workers* threads, owned and shut down by the
+                scheduler.
+
+        Raises:
+            ValueError: If *workers* < 1 or a lane config is invalid.
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}.")
+        lanes = self.default_lanes(workers) if lanes is None else lanes
+        if not lanes:
+            raise ValueError("At least one lane is required.")
+        self.workers = workers
+        self._lanes: Dict[str, _Lane] = {
+            name: _Lane(name, rank, config, workers)
+            for rank, (name, config) in enumerate(lanes.items())
+        }
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(workers, thread_name_prefix="lane")
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._vtime = 0.0
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, lane: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Queue ``fn(*args, **kwargs)`` on *lane*.
+
+        Returns:
+            A ``Future`` for the call's result.
+
+        Raises:
+            ValueError: For an unknown lane.
+            queue.Full: If the lane's ``max_queue`` is reached.
+            RuntimeError: After ``shutdown()``.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit after shutdown().")
+            target = self._lanes.get(lane)
+            if target is None:
+                raise ValueError(f"Unknown lane '{lane}'; expected one of {list(self._lanes)}.")
+            if target.max_queue is not None and len(target.queue) >= target.max_queue:
+                target.rejected += 1
+                raise queue.Full(f"Lane '{lane}' has {target.max_queue} queued tasks.")
+            if not target.queue and not target.running:
+                # Returning from idle: no credit for the time spent idle
+                target.vtime = max(target.vtime, self._vtime)
+            target.queue.append((future, fn, args, kwargs, time.perf_counter()))
+            target.submitted += 1
+            target.max_depth = max(target.max_depth, len(target.queue))
+        future.add_done_callback(lambda f, lane=target: self._dequeue_cancelled(lane, f))
+        self._dispatch()
+        return future
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-lane counters and queue-wait percentiles (milliseconds).
+
+        Keys per lane: ``queued``, ``running``, ``submitted``, ``completed``,
+        ``failed``, ``cancelled``, ``rejected``, ``max_depth``, and
+        ``wait_p50_ms`` / ``wait_p95_ms`` / ``wait_max_ms`` over the last
+        1024 dispatches (``None`` before the first).
+        """
+        with self._lock:
+            report = {}
+            for lane in self._lanes.values():
+                waits = np.array(lane.waits) * 1e3
+                report[lane.name] = {
+                    "queued": len(lane.queue),
+                    "running": lane.running,
+                    "submitted": lane.submitted,
+                    "completed": lane.completed,
+                    "failed": lane.failed,
+                    "cancelled": lane.cancelled,
+                    "rejected": lane.rejected,
+                    "max_depth": lane.max_depth,
+                    "wait_p50_ms": float(np.percentile(waits, 50)) if len(waits) else None,
+                    "wait_p95_ms": float(np.percentile(waits, 95)) if len(waits) else None,
+                    "wait_max_ms": float(waits.max()) if len(waits) else None,
+                }
+            return report
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued and running task is done; ``False`` on timeout."""
+        with self._idle:
+            return self._idle.wait_for(
+                lambda: not self._in_flight and not any(l.queue for l in self._lanes.values()),
+                timeout,
+            )
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """
+        Stop accepting tasks.
+
+        Args:
+            wait: Block until queued (unless cancelled) and running tasks end.
+            cancel_pending: Cancel every task still queued.
+        """
+        pending: List[Future] = []
+        with self._lock:
+            self._closed = True
+            if cancel_pending:
+                for lane in self._lanes.values():
+                    pending.extend(entry[0] for entry in lane.queue)
+                    lane.cancelled += len(lane.queue)
+                    lane.queue.clear()
+                self._idle.notify_all()
+        # Outside the lock: cancel() runs the done-callbacks, which take it
+        for future in pending:
+            future.cancel()
+            # Wakes ``concurrent.futures.wait()`` callers, as executors do
+            future.set_running_or_notify_cancel()
+        if wait:
+            self.join()
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "PriorityScheduler":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _next_lane(self) -> Optional[_Lane]:
+        best = None
+        for lane in self._lanes.values():
+            if lane.queue and lane.running < lane.max_concurrency:
+                if best is None or (lane.vtime, lane.rank) < (best.vtime, best.rank):
+                    best = lane
+        return best
+
+    def _dispatch(self) -> None:
+        """Start queued tasks while workers and lane limits allow."""
+        started: List[Tuple[_Lane, Future, Callable, tuple, dict]] = []
+        with self._lock:
+            while self._in_flight < self.workers:
+                lane = self._next_lane()
+                if lane is None:
+                    break
+                future, fn, args, kwargs, enqueued = lane.queue.popleft()
+                if not future.set_running_or_notify_cancel():
+                    lane.cancelled += 1
+                    continue
+                self._vtime = lane.vtime
+                lane.vtime += 1.0 / lane.weight
+                lane.running += 1
+                lane.waits.append(time.perf_counter() - enqueued)
+                self._in_flight += 1
+                started.append((lane, future, fn, args, kwargs))
+            if not self._in_flight and not any(l.queue for l in self._lanes.values()):
+                self._idle.notify_all()
+
+        for lane, future, fn, args, kwargs in started:
+            try:
+                inner = self._executor.submit(fn, *args, **kwargs)
+            except BaseException as exc:  # executor shut down underneath us
+                self._finished(lane, future, None, exc)
+                continue
+            inner.add_done_callback(
+                lambda f, lane=lane, future=future: self._finished(lane, future, f)
+            )
+
+    def _dequeue_cancelled(self, lane: _Lane, future: Future) -> None:
+        """Drop *future* from *lane*'s queue if it was cancelled while queued."""
+        if not future.cancelled():
+            return
+        with self._lock:
+            for i, entry in enumerate(lane.queue):
+                if entry[0] is future:
+                    del lane.queue[i]
+                    break
+            else:
+                return  # already taken by _dispatch() or shutdown()
+            lane.cancelled += 1
+            if not self._in_flight and not any(l.queue for l in self._lanes.values()):
+                self._idle.notify_all()
+        # Wakes ``concurrent.futures.wait()`` callers, as executors do
+        future.set_running_or_notify_cancel()
+
+    def _finished(
+        self, lane: _Lane, future: Future, inner: Optional[Future],
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if inner is not None:
+            error = inner.exception()
+        with self._lock:
+            lane.running -= 1
+            self._in_flight -= 1
+            if error is None:
+                lane.completed += 1
+            else:
+                lane.failed += 1
+        if error is None:
+            future.set_result(inner.result())
+        else:
+            future.set_exception(error)
+        self._dispatch()
@@ -0,0 +1,414 @@
+"""
+Streaming analysis of arbitrarily large documents.
+
+``CredibilityAnalyzer.analyze_stream(file_like, model, vectorizer)`` reads a
+text (or UTF-8 binary) file object in chunks and returns the same result
+dict as ``analyze()`` on the concatenated text, while holding only a few
+chunks in memory — for multi-MB transcripts and PDF dumps.
+
+Design decisions
+----------------
+* The buffer is cut into segments at the start of its last sentence, so
+  every segment holds complete sentences (the boundaries of
+  ``iter_sentences``).  A buffer without a sentence boundary
+  that grows past ``max(4 × chunk_size, 16 384)`` characters is cut at
+  its last whitespace.
+* Pattern hits are additive over such cuts (see
+  ``PatternDetector.count_pattern_hits``) except for keywords straddling
+  a cut; those are recovered by matching a small window around the cut
+  and keeping only the hits that cross it.
+* TF-IDF counts are accumulated against the fitted vocabulary (memory ∝
+  distinct terms, at most the vocabulary size).  N-grams spanning a cut
+  are built from the last ``max_n - 1`` tokens of the previous segment,
+  and the final IDF weighting / normalisation reuse the vectorizer's
+  parameters (as in ``IncrementalAnalyzer``), so the feature row equals
+  ``vectorizer.transform``.  An HTML tag cut in two is held back until its
+  ``>`` arrives.
+* Claims are scored as their sentences complete and ``on_claim`` receives
+  each flagged sentence immediately.  Heuristic mode flags the first five
+  in document order, exactly like ``analyze()``; with ``ml_claims`` the
+  callback receives every sentence over the blend threshold and the result
+  keeps the five highest (a bounded heap).
+* Streams that end before the first cut, and vectorizers that are not
+  word-level ``TfidfVectorizer``s, are delegated to ``analyze()`` on the
+  full text.
+
+Caveats: a keyword that can overlap itself (e.g. "aa") straddling a cut may
+be counted once more than ``str.count`` would, and a sentence longer than
+that buffer limit is scored in pieces.
+"""
+
+from __future__ import annotations
+
+import codecs
+import heapq
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from sklearn.feature_extraction.text import TfidfTransformer
+
+from src.patterns import PatternDetector
+from src.utils import clean_text_for_model, iter_sentences
+
+if TYPE_CHECKING:
+    from .credibility_analyzer import CredibilityAnalyzer
+
+ClaimCallback = Callable[[str, Tuple[int, int]], None]
+
+# Buffer size past which a sentence-less buffer is force-cut: this many
+# chunks, but never fewer characters than the floor (keeps sentences whole)
+_MAX_BUFFER_CHUNKS = 4
+_MIN_MAX_BUFFER = 1 << 14
+
+_NON_SPACE_RUN = re.compile(r"\S*")
+_LAST_SPACE = re.compile(r"\s(?=\S*\Z)")
+
+
+def _last_whitespace(text: str) -> int:
+    match = _LAST_SPACE.search(text)
+    return match.start() if match else -1
+
+
+class _PatternStream:
+    """Running ``HIT_FIELDS`` totals with straddling-keyword recovery."""
+
+    def __init__(self, detector: PatternDetector) -> None:
+        self._detector = detector
+        self._matcher = detector._active_matcher()
+        self._window = 2 * max(self._matcher.max_keyword_length, 1)
+        self.totals = [0] * len(PatternDetector.HIT_FIELDS)
+        self._tail = ""   # lowercased end of the previous segment
+
+    def feed(self, segment: str) -> None:
+        self._add(self._detector.count_pattern_hits(segment))
+        if self._tail:
+            # Extend the head to a word end so no token is cut short
+            head_end = _NON_SPACE_RUN.match(segment, min(self._window, len(segment))).end()
+            window = self._tail + segment[:head_end].lower()
+            cut = len(self._tail)
+            straddling = [0] * self._matcher.n_families
+            for family, start, end in self._matcher.find(window):
+                if start < cut < end:
+                    straddling[family] += 1
+            if any(straddling):
+                self._add(self._detector._hits_tuple(straddling, 0, 0))
+
+        tail = segment[-self._window:].lower()
+        if len(segment) > self._window:
+            # Start the tail on a word boundary for the same reason
+            space = re.search(r"\s", tail)
+            tail = tail[space.start():] if space else tail
+        self._tail = tail
+
+    def _add(self, hits: Tuple[int, ...]) -> None:
+        totals = self.totals
+        for i, h in enumerate(hits):
+            totals[i] += h
+
+
+class _TermStream:
+    """Running vocabulary counts of a word-level ``TfidfVectorizer``."""
+
+    def __init__(self, vectorizer: Any) -> None:
+        self._vectorizer = vectorizer
+        self._transformer = TfidfTransformer(
+            norm=vectorizer.norm,
+            use_idf=vectorizer.use_idf,
+            smooth_idf=vectorizer.smooth_idf,
+            sublinear_tf=vectorizer.sublinear_tf,
+        )
+        self._transformer.idf_ = vectorizer.idf_
+        self._preprocess = vectorizer.build_preprocessor()
+        self._tokenize = vectorizer.build_tokenizer()
+        self._stop_words = vectorizer.get_stop_words() or frozenset()
+        self._min_n, self._max_n = vectorizer.ngram_range
+        self._vocabulary = vectorizer.vocabulary_
+        self._counts: Dict[int, int] = {}
+        self._window: List[str] = []   # last max_n - 1 tokens seen
+
+    @staticmethod
+    def supports(vectorizer: Any) -> bool:
+        return getattr(vectorizer, "analyzer", None) == "word" and hasattr(vectorizer, "idf_")
+
+    def feed(self, cleaned: str) -> None:
+        tokens = self._tokenize(self._preprocess(cleaned))
+        if self._stop_words:
+            tokens = [t for t in tokens if t not in self._stop_words]
+        if not tokens:
+            return
+
+        combined = self._window + tokens
+        first_new = len(self._window)
+        counts, vocabulary = self._counts, self._vocabulary
+        for n in range(self._min_n, self._max_n + 1):
+            # Every n-gram that ends on a new token
+            for i in range(max(0, first_new - n + 1), len(combined) - n + 1):
+                idx = vocabulary.get(" ".join(combined[i:i + n]))
+                if idx is not None:
+                    counts[idx] = counts.get(idx, 0) + 1
+        edge = self._max_n - 1
+        self._window = combined[-edge:] if edge else []
+
+    def features(self) -> csr_matrix:
+        counts = self._counts
+        indices = np.fromiter(sorted(counts), dtype=np.int64, count=len(counts))
+        data = np.fromiter((counts[i] for i in indices), dtype=np.int64, count=len(counts))
+        if getattr(self._vectorizer, "binary", False):
+            data = np.minimum(data, 1)
+        raw = csr_matrix(
+            (data, indices, np.array([0, len(indices)])),
+            shape=(1, len(self._transformer.idf_)),
+        )
+        return self._transformer.transform(raw).astype(self._vectorizer.dtype, copy=False)
+
+
+class _ClaimStream:
+    """Suspicious-claim selection over completed sentences."""
+
+    def __init__(
+        self,
+        analyzer: "CredibilityAnalyzer",
+        model: Any,
+        vectorizer: Any,
+        on_claim: Optional[ClaimCallback],
+    ) -> None:
+        self._highlighter = analyzer._claim_highlighter
+        self._model = model
+        self._vectorizer = vectorizer
+        self._ml = analyzer.ml_claims
+        self._on_claim = on_claim
+        self._flagged: List[Tuple[int, int, str]] = []
+        # ml_claims: min-heap of (blend, -sentence index, start, end, text)
+        self._heap: List[Tuple[float, int, int, int, str]] = []
+        self._n_sentences = 0
+
+    def feed(self, text: str, offset: int, spans: List[Tuple[int, int]]) -> None:
+        """Score the complete sentences *spans* of *text* (which starts at *offset*)."""
+        if not spans:
+            return
+        if self._ml and self._feed_blended(text, offset, spans):
+            return
+        highlighter = self._highlighter
+        for start, end in spans:
+            if len(self._flagged) == highlighter._MAX_CLAIMS:
+                break
+            sentence = text[start:end]
+            if highlighter.score_sentence(sentence) >= highlighter._THRESHOLD:
+                self._emit(sentence, offset + start, offset + end)
+
+    def _feed_blended(self, text: str, offset: int, spans: List[Tuple[int, int]]) -> bool:
+        highlighter = self._highlighter
+        sentences = [text[start:end] for start, end in spans]
+        suspicion = highlighter.sentence_model_suspicion(sentences, self._model, self._vectorizer)
+        if suspicion is None:
+            # Model cannot score sentences: heuristics only, as analyze() does
+            self._ml = False
+            return False
+
+        heuristic = np.fromiter(
+            map(highlighter.score_sentence, sentences), dtype=np.float64, count=len(sentences)
+        ) / highlighter._HEURISTIC_MAX
+        weight = highlighter._MODEL_WEIGHT
+        blend = weight * suspicion + (1.0 - weight) * heuristic
+
+        for i in np.flatnonzero(blend >= highlighter._BLEND_THRESHOLD).tolist():
+            start, end = spans[i]
+            entry = (float(blend[i]), -(self._n_sentences + i),
+                     offset + start, offset + end, sentences[i])
+            if len(self._heap) < highlighter._MAX_CLAIMS:
+                heapq.heappush(self._heap, entry)
+            elif entry[:2] > self._heap[0][:2]:
+                heapq.heapreplace(self._heap, entry)
+            if self._on_claim is not None:
+                self._on_claim(sentences[i], (offset + start, offset + end))
+        self._n_sentences += len(spans)
+        return True
+
+    def _emit(self, sentence: str, start: int, end: int) -> None:
+        self._flagged.append((start, end, sentence))
+        if self._on_claim is not None:
+            self._on_claim(sentence, (start, end))
+
+    def claims(self) -> Tuple[List[Tuple[int, int]], List[str]]:
+        """Return ``(spans, sentences)`` of the selected claims, in document order."""
+        if self._ml:
+            chosen = sorted((start, end, s) for _, _, start, end, s in self._heap)
+        else:
+            chosen = self._flagged
+        return [(start, end) for start, end, _ in chosen], [s for _, _, s in chosen]
+
+
+class _StreamRun:
+    """State of one ``analyze_stream`` call once the first segment is cut."""
+
+    def __init__(
+        self,
+        analyzer: "CredibilityAnalyzer",
+        model: Any,
+        vectorizer: Any,
+        max_buffer: int,
+        on_claim: Optional[ClaimCallback],
+    ) -> None:
+        self._analyzer = analyzer
+        self._model = model
+        self._vectorizer = vectorizer
+        self._max_buffer = max_buffer
+        self._patterns = _PatternStream(analyzer._pattern_detector)
+        self._terms = _TermStream(vectorizer)
+        self._claims = _ClaimStream(analyzer, model, vectorizer, on_claim)
+
+        self._offset = 0                  # absolute offset of the next segment
+        self._head = ""                   # first _MIN_TEXT_LENGTH characters
+        self._first_visible = self._last_visible = -1
+        self._html_pending = ""           # raw text from an unterminated "<"
+        self._sentence_pending = ""       # sentence cut short by a forced cut
+        self._sentence_pending_at = 0
+
+    def feed(
+        self,
+        segment: str,
+        spans: Optional[List[Tuple[int, int]]] = None,
+        complete: bool = True,
+    ) -> None:
+        """
+        Process the next *segment* of the stream.
+
+        Args:
+            segment: Text following everything fed so far.
+            spans: Its sentence spans, if the caller already split it.
+            complete: Whether *segment* ends on a sentence boundary.
+        """
+        min_length = self._analyzer._MIN_TEXT_LENGTH
+        if len(self._head) < min_length:
+            self._head += segment[:min_length - len(self._head)]
+        lead = len(segment) - len(segment.lstrip())
+        if lead < len(segment):
+            if self._first_visible < 0:
+                self._first_visible = self._offset + lead
+            self._last_visible = self._offset + len(segment.rstrip()) - 1
+
+        self._patterns.feed(segment)
+
+        raw = self._html_pending + segment
+        lt = raw.find("<", raw.rfind(">") + 1)
+        if lt != -1 and len(raw) - lt <= self._max_buffer:
+            self._html_pending, raw = raw[lt:], raw[:lt]
+        else:
+            self._html_pending = ""
+        self._terms.feed(clean_text_for_model(raw))
+
+        if self._sentence_pending:
+            text, text_at = self._sentence_pending + segment, self._sentence_pending_at
+            spans = list(iter_sentences(text))
+        else:
+            text, text_at = segment, self._offset
+            if spans is None:
+                spans = list(iter_sentences(text))
+        self._sentence_pending = ""
+        if not complete and spans and len(text) - spans[-1][0] <= self._max_buffer:
+            last_start = spans[-1][0]
+            self._sentence_pending = text[last_start:]
+            self._sentence_pending_at = text_at + last_start
+            spans = spans[:-1]
+        self._claims.feed(text, text_at, spans)
+        self._offset += len(segment)
+
+    def result(self) -> Dict[str, Any]:
+        analyzer = self._analyzer
+        if self._html_pending:
+            self._terms.feed(clean_text_for_model(self._html_pending))
+            self._html_pending = ""
+
+        visible = self._last_visible - self._first_visible + 1 if self._first_visible >= 0 else 0
+        if visible < analyzer._MIN_TEXT_LENGTH:
+            # Same placeholder analyze() returns for short / blank text
+            return analyzer._insufficient_input_result(" " if self._offset else "")
+
+        features = self._terms.features()
+        model_prediction, model_confidence = analyzer._model_inference(self._model, features)
+        top_terms = analyzer.term_attributions(features, self._model, self._vectorizer)
+        detected_patterns = analyzer._pattern_detector.patterns_from_hits(self._patterns.totals)
+        claim_spans, claims = self._claims.claims()
+        # With the claims given, _assemble_result accepts any prefix of
+        # _MIN_TEXT_LENGTH characters in place of the text
+        assert len(self._head) >= analyzer._MIN_TEXT_LENGTH
+        return analyzer._assemble_result(
+            self._head, model_prediction, model_confidence,
+            detected_patterns, claim_spans, top_terms, suspicious_claims=claims,
+        )
+
+
+def analyze_stream(
+    analyzer: "CredibilityAnalyzer",
+    file_like: Any,
+    model: Any,
+    vectorizer: Any,
+    chunk_size: int = 1 << 16,
+    on_claim: Optional[ClaimCallback] = None,
+) -> Dict[str, Any]:
+    """Implementation of ``CredibilityAnalyzer.analyze_stream``."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+    chunks = _iter_chunks(file_like, chunk_size)
+    if not _TermStream.supports(vectorizer):
+        return _delegate(analyzer, "".join(chunks), model, vectorizer, on_claim)
+
+    max_buffer = max(_MAX_BUFFER_CHUNKS * chunk_size, _MIN_MAX_BUFFER)
+    run: Optional[_StreamRun] = None
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        spans = list(iter_sentences(buffer))
+        if len(spans) >= 2:
+            # Everything before the last (possibly unfinished) sentence
+            cut, complete = spans[-1][0], True
+            spans = spans[:-1]
+        elif len(buffer) > max_buffer:
+            cut, complete, spans = _last_whitespace(buffer), False, None
+            if cut <= 0:
+                cut = len(buffer)
+        else:
+            continue
+        if run is None:
+            run = _StreamRun(analyzer, model, vectorizer, max_buffer, on_claim)
+        run.feed(buffer[:cut], spans, complete)
+        buffer = buffer[cut:]
+
+    if run is None:
+        return _delegate(analyzer, buffer, model, vectorizer, on_claim)
+    run.feed(buffer)
+    return run.result()
+
+
+def _iter_chunks(file_like: Any, chunk_size: int) -> Iterator[str]:
+    """Yield ``str`` chunks of *file_like*, decoding binary streams as UTF-8."""
+    decoder = None
+    while True:
+        chunk = file_like.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, bytes):
+            decoder = decoder or codecs.getincrementaldecoder("utf-8")(errors="replace")
+            chunk = decoder.decode(chunk)
+        yield chunk
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+
+def _delegate(
+    analyzer: "CredibilityAnalyzer",
+    text: str,
+    model: Any,
+    vectorizer: Any,
+    on_claim: Optional[ClaimCallback],
+) -> Dict[str, Any]:
+    """Run ``analyze()`` on the whole text and report its claims to *on_claim*."""
+    result = analyzer.analyze(text, model, vectorizer)
+    if on_claim is not None:
+        for claim, span in zip(result["suspicious_claims"], result["suspicious_claim_spans"]):
+            on_claim(claim, span)
+    return result
@@ -9,11 +9,14 @@ Design decisions
 * The public ``ModelLoader`` class provides a clean interface and a
   ``reload()`` helper for testing / hot-swap scenarios.
 * Supports both ``joblib`` (preferred) and ``pickle`` artefacts.
+* ``load_async()`` starts the (cached) load on a background thread so
+  interactive front-ends can render before the artefacts are ready.
 """
 
 import os
 import functools
 import pickle
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Tuple
 
 import joblib
@@ -56,12 +59,27 @@ class ModelLoader:
         """
         return _cached_load(self._model_dir)
 
+    def load_async(self) -> "Future[Tuple[Any, Any]]":
+        """
+        Start loading on a background thread and return immediately.
+
+        The returned future resolves to the same cached ``(model, vectorizer)``
+        tuple as :meth:`load`; exceptions raised by the load are re-raised by
+        ``future.result()``.
+        """
+        return _LOAD_EXECUTOR.submit(self.load)
+
     def reload(self) -> Tuple[Any, Any]:
         """Force a fresh load from disk (clears the cache)."""
         _cached_load.cache_clear()
         return self.load()
 
 
+# A single worker serialises background loads, so concurrent callers never
+# deserialise the same artefacts twice before the lru_cache is populated.
+_LOAD_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-loader")
+
+
 @functools.lru_cache(maxsize=None)
 def _cached_load(model_dir: str) -> Tuple[Any, Any]:
     """Module-level cached function so the cache survives across instances."""
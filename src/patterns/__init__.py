@@ -1,5 +1,12 @@
-from .pattern_detector import PatternDetector
+from .pattern_detector import PatternDetector, PatternSpans
 from .emotional_analyzer import EmotionalAnalyzer
 from .claim_highlighter import ClaimHighlighter
+from .lexicon import Lexicon
 
-__all__ = ["PatternDetector", "EmotionalAnalyzer", "ClaimHighlighter"]
+__all__ = [
+    "PatternDetector",
+    "PatternSpans",
+    "EmotionalAnalyzer",
+    "ClaimHighlighter",
+    "Lexicon",
+]
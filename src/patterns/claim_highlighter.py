@@ -1,17 +1,30 @@
 """
 Suspicious-claim identification — refactored into src/patterns/.
+
+Sentences are flagged by keyword heuristics whose term lists are the
+lexicon's claim families.  When a model and vectorizer are passed, every
+sentence of the article is also scored by the model in one batched
+``transform`` and one sparse matrix product, and sentences are ranked by
+a blend of model suspicion and heuristic score.
 """
 
-from typing import List
+from typing import Any, List, MutableMapping, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.special import expit
 
 from src.utils import (
-    split_into_sentences,
+    clean_text_for_model,
+    terms,
+    iter_sentences,
     contains_vague_source,
     contains_extreme_language,
     contains_evidence_markers,
     contains_conspiracy_markers,
 )
 
+from .lexicon import Lexicon
+
 
 class ClaimHighlighter:
     """
@@ -25,38 +38,194 @@ class ClaimHighlighter:
     * No evidence markers     → +1
 
     Sentences scoring ≥ 3 are flagged; the top 5 are returned.
+
+    Model-assisted mode (``model`` and ``vectorizer`` given)
+    --------------------------------------------------------
+    ``blend = 0.5 · P(misinformation | sentence) + 0.5 · heuristic / 6``;
+    sentences with ``blend ≥ 0.5`` are flagged and the 5 highest are
+    returned in document order.
+
+    The term lists below are the default lexicon's claim families; pass a
+    ``Lexicon`` to score with per-market lists instead.
     """
 
+    # ------------------------------------------------------------------
+    # Term lists (the default claim families, from src.utils.terms)
+    # ------------------------------------------------------------------
+
+    VAGUE_SOURCE_PATTERNS: Tuple[str, ...] = terms.CLAIM_VAGUE_SOURCES
+    CONSPIRACY_MARKERS: Tuple[str, ...] = terms.CLAIM_CONSPIRACY
+    EXTREME_WORDS: Tuple[str, ...] = terms.CLAIM_EXTREME
+    EXTREME_WORD_SET = frozenset(EXTREME_WORDS)
+    EVIDENCE_MARKERS: Tuple[str, ...] = terms.CLAIM_EVIDENCE
+
     _THRESHOLD = 3
     _MAX_CLAIMS = 5
 
-    def identify_suspicious_claims(self, text: str) -> List[str]:
+    _HEURISTIC_MAX = 6
+    _MODEL_WEIGHT = 0.5
+    _BLEND_THRESHOLD = 0.5
+
+    def __init__(self, lexicon: Optional[Lexicon] = None) -> None:
+        """
+        Args:
+            lexicon: Lexicon whose claim families replace the class lists.
+        """
+        self.lexicon = lexicon
+        if lexicon is None:
+            self._vague = self.VAGUE_SOURCE_PATTERNS
+            self._conspiracy = self.CONSPIRACY_MARKERS
+            self._extreme = self.EXTREME_WORD_SET
+            self._evidence = self.EVIDENCE_MARKERS
+        else:
+            self._vague = lexicon.families["claim_vague_sources"]
+            self._conspiracy = lexicon.families["claim_conspiracy"]
+            self._extreme = frozenset(lexicon.families["claim_extreme"])
+            self._evidence = lexicon.families["claim_evidence"]
+
+    def identify_suspicious_claims(
+        self,
+        text: str,
+        score_cache: Optional[MutableMapping[str, int]] = None,
+        model: Any = None,
+        vectorizer: Any = None,
+    ) -> List[str]:
         """
         Return up to ``_MAX_CLAIMS`` suspicious sentences from *text*.
 
         Args:
             text: Full article text.
+            score_cache: Optional mapping used to memoise ``score_sentence``
+                per sentence across calls (e.g. while an article is edited).
+            model: Optional trained classifier; enables model-assisted ranking.
+            vectorizer: Fitted TF-IDF vectorizer matching *model*.
 
         Returns:
             List of sentenced strings with high suspicion scores, capped at 5.
         """
+        return [
+            text[start:end]
+            for start, end in self.identify_suspicious_claim_spans(
+                text, score_cache, model, vectorizer
+            )
+        ]
+
+    def identify_suspicious_claim_spans(
+        self,
+        text: str,
+        score_cache: Optional[MutableMapping[str, int]] = None,
+        model: Any = None,
+        vectorizer: Any = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Return ``(start, end)`` offsets of up to ``_MAX_CLAIMS`` suspicious sentences.
+
+        The spans index into *text* and are in document order, so repeated
+        sentences are anchored to the occurrence that was actually flagged.
+
+        Args:
+            text: Full article text.
+            score_cache: See ``identify_suspicious_claims``.
+            model: See ``identify_suspicious_claims``.
+            vectorizer: See ``identify_suspicious_claims``.
+
+        Returns:
+            List of half-open character spans, capped at 5.
+        """
         if not text:
             return []
+        if model is not None and vectorizer is not None:
+            return self._blended_claim_spans(text, score_cache, model, vectorizer)
 
-        flagged: List[str] = []
-
-        for sentence in split_into_sentences(text):
-            score = 0
-            if contains_vague_source(sentence):
-                score += 2
-            if contains_conspiracy_markers(sentence):
-                score += 2
-            if contains_extreme_language(sentence):
-                score += 1
-            if not contains_evidence_markers(sentence):
-                score += 1
+        flagged: List[Tuple[int, int]] = []
 
+        for start, end in iter_sentences(text):
+            score = self._cached_score(text[start:end], score_cache)
             if score >= self._THRESHOLD:
-                flagged.append(sentence.strip())
+                flagged.append((start, end))
+                if len(flagged) == self._MAX_CLAIMS:
+                    break
+
+        return flagged
+
+    def sentence_model_suspicion(
+        self, sentences: Sequence[str], model: Any, vectorizer: Any
+    ) -> Optional[np.ndarray]:
+        """
+        Return ``P(misinformation)`` for every sentence in one batched pass.
+
+        Linear models (``coef_``) are scored with a single sparse
+        matrix-vector product and a sigmoid (label 0 = misinformation);
+        other models use one ``predict_proba`` call.
+
+        Returns:
+            Float array aligned with *sentences*, or ``None`` if the model
+            exposes neither ``coef_`` nor ``predict_proba``.
+        """
+        features = vectorizer.transform([clean_text_for_model(s) for s in sentences])
+
+        coef = getattr(model, "coef_", None)
+        if isinstance(coef, np.ndarray) and coef.ndim == 2 and coef.shape[0] == 1:
+            intercept = float(np.ravel(getattr(model, "intercept_", 0.0))[0])
+            decision = np.asarray(features @ coef[0]).ravel() + intercept
+            return expit(-decision)  # P(class 0), no overflow at large margins
 
-        return flagged[: self._MAX_CLAIMS]
+        if hasattr(model, "predict_proba"):
+            fake_column = list(model.classes_).index(0)
+            return np.asarray(model.predict_proba(features))[:, fake_column]
+        return None
+
+    def _blended_claim_spans(
+        self,
+        text: str,
+        score_cache: Optional[MutableMapping[str, int]],
+        model: Any,
+        vectorizer: Any,
+    ) -> List[Tuple[int, int]]:
+        spans = list(iter_sentences(text))
+        if not spans:
+            return []
+        sentences = [text[start:end] for start, end in spans]
+
+        suspicion = self.sentence_model_suspicion(sentences, model, vectorizer)
+        if suspicion is None:
+            return self.identify_suspicious_claim_spans(text, score_cache)
+
+        heuristic = np.fromiter(
+            (self._cached_score(s, score_cache) for s in sentences),
+            dtype=np.float64, count=len(sentences),
+        ) / self._HEURISTIC_MAX
+        blend = self._MODEL_WEIGHT * suspicion + (1.0 - self._MODEL_WEIGHT) * heuristic
+
+        flagged = np.flatnonzero(blend >= self._BLEND_THRESHOLD)
+        if len(flagged) > self._MAX_CLAIMS:
+            flagged = flagged[np.argsort(-blend[flagged], kind="stable")[: self._MAX_CLAIMS]]
+        return [spans[i] for i in np.sort(flagged)]
+
+    def _cached_score(
+        self, sentence: str, score_cache: Optional[MutableMapping[str, int]]
+    ) -> int:
+        if score_cache is None:
+            return self.score_sentence(sentence)
+        score = score_cache.get(sentence)
+        if score is None:
+            score = score_cache[sentence] = self.score_sentence(sentence)
+        return score
+
+    def score_sentence(self, sentence: str) -> int:
+        """
+        Return the suspicion score of a single *sentence*.
+
+        The score depends on the sentence alone, so callers may cache it
+        per sentence across edits of the surrounding article.
+        """
+        score = 0
+        if contains_vague_source(sentence, self._vague):
+            score += 2
+        if contains_conspiracy_markers(sentence, self._conspiracy):
+            score += 2
+        if contains_extreme_language(sentence, self._extreme):
+            score += 1
+        if not contains_evidence_markers(sentence, self._evidence):
+            score += 1
+        return score
@@ -0,0 +1,232 @@
+"""
+Keyword lexicons loaded from JSON / TOML files.
+
+The built-in keyword lists in ``src.utils.terms`` (pattern counts in
+``PatternDetector``, sentence scoring in ``ClaimHighlighter``) are the
+*default* lexicon.  Per-market lexicons are files that replace or extend
+its families, so they can be tuned without a code change:
+
+.. code-block:: toml
+
+    name = "en-GB"
+
+    [families]                      # replaces the default list
+    clickbait = ["you won't believe", "gobsmacked"]
+
+    [extend]                        # appended to the default list
+    conspiracy_framing = ["chemtrails", "new world order"]
+    claim_conspiracy = ["chemtrails"]
+
+JSON files use the same structure.
+
+Design decisions
+----------------
+* Terms are normalised (lowercased, stripped, de-duplicated, sorted) so
+  two lexicons that match the same way have the same ``content_hash``.
+  The hash is meant for cache keys of anything derived from pattern
+  counts or claim scores.
+* ``compile()`` builds the ``KeywordMatcher`` once.  With a ``cache_dir``
+  the compiled matcher is stored under its content hash, so large custom
+  lexicons load from disk instead of being rebuilt at every start-up.
+  The cache is plain JSON (``KeywordMatcher.to_data()``), never a pickle:
+  whoever can write to the directory can at worst spoil the counts, not
+  run code, and malformed files are rebuilt.  Word-mode matchers are
+  plain dicts that build as fast as they would load, so they are not
+  cached.
+* Claim families (``CLAIM_FAMILIES``) are kept apart from the pattern
+  families even where the default terms agree: they feed per-sentence
+  yes/no checks, not counts, and ``claim_extreme`` matches whole words.
+* TOML needs ``tomllib`` (Python ≥ 3.11); JSON always works.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Union
+
+from .matcher import KeywordMatcher, TokenMatcher
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover - Python < 3.11
+    tomllib = None
+
+
+# Keyword families in KeywordMatcher order (see PatternDetector._keyword_matcher)
+LEXICON_FAMILIES: Tuple[str, ...] = (
+    "sensational_phrases",
+    "vague_sources",
+    "conspiracy_framing",
+    "emotional_manipulation",
+    "balance",
+    "evidence",
+    "extreme_adjectives",
+    "clickbait",
+)
+
+# Sentence-level families scored by ClaimHighlighter
+CLAIM_FAMILIES: Tuple[str, ...] = (
+    "claim_vague_sources",
+    "claim_conspiracy",
+    "claim_extreme",
+    "claim_evidence",
+)
+
+_ALL_FAMILIES: Tuple[str, ...] = LEXICON_FAMILIES + CLAIM_FAMILIES
+
+
+def _normalise(terms: Sequence[str]) -> Tuple[str, ...]:
+    return tuple(sorted({t.strip().lower() for t in terms if t and t.strip()}))
+
+
+class Lexicon:
+    """
+    Immutable set of keyword families with a content hash.
+
+    Usage
+    -----
+    >>> lexicon = Lexicon.load("lexicons/en-GB.toml")
+    >>> detector = PatternDetector(lexicon=lexicon, cache_dir=".cache/lexicons")
+    >>> lexicon.content_hash
+    """
+
+    __slots__ = ("name", "families", "content_hash")
+
+    def __init__(self, families: Mapping[str, Sequence[str]], name: str = "custom") -> None:
+        """
+        Args:
+            families: Terms per family; every name in ``LEXICON_FAMILIES``
+                and ``CLAIM_FAMILIES`` must be present.
+            name: Human-readable label (not part of the hash).
+
+        Raises:
+            ValueError: If a family is missing or unknown.
+        """
+        unknown = sorted(set(families) - set(_ALL_FAMILIES))
+        missing = [f for f in _ALL_FAMILIES if f not in families]
+        if unknown or missing:
+            raise ValueError(
+                f"Invalid lexicon families (unknown: {unknown}, missing: {missing})."
+            )
+        self.name = name
+        self.families: Dict[str, Tuple[str, ...]] = {
+            f: _normalise(families[f]) for f in _ALL_FAMILIES
+        }
+        canonical = json.dumps(self.families, sort_keys=True, ensure_ascii=False)
+        self.content_hash = hashlib.blake2b(
+            canonical.encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_dict(cls, data: Mapping, base: Optional["Lexicon"] = None) -> "Lexicon":
+        """
+        Build a lexicon from parsed file content.
+
+        Families under ``families`` replace those of *base*; families under
+        ``extend`` are appended to them.  *base* defaults to the built-in
+        ``PatternDetector`` and ``ClaimHighlighter`` lists.
+
+        Raises:
+            ValueError: If the content names an unknown family.
+        """
+        if base is None:
+            from .pattern_detector import PatternDetector
+
+            base = PatternDetector.default_lexicon()
+
+        replace = dict(data.get("families", {}))
+        extend = dict(data.get("extend", {}))
+        unknown = sorted((set(replace) | set(extend)) - set(_ALL_FAMILIES))
+        if unknown:
+            raise ValueError(f"Unknown lexicon families: {', '.join(unknown)}")
+
+        families = {}
+        for family in _ALL_FAMILIES:
+            terms = list(replace.get(family, base.families[family]))
+            terms += extend.get(family, [])
+            families[family] = terms
+        return cls(families, name=str(data.get("name", "custom")))
+
+    @classmethod
+    def load(cls, path: str, base: Optional["Lexicon"] = None) -> "Lexicon":
+        """
+        Read a ``.json`` or ``.toml`` lexicon file.
+
+        Raises:
+            ValueError: For an unsupported extension, or ``.toml`` without
+                ``tomllib``.
+        """
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".json":
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        elif ext == ".toml":
+            if tomllib is None:
+                raise ValueError("TOML lexicons need Python 3.11+ (tomllib); use JSON.")
+            with open(path, "rb") as fh:
+                data = tomllib.load(fh)
+        else:
+            raise ValueError(f"Unsupported lexicon file type: {ext or path}")
+        return cls.from_dict(data, base=base)
+
+    def to_dict(self) -> Dict[str, object]:
+        """JSON-serialisable form (a complete lexicon, no ``extend``)."""
+        return {"name": self.name, "families": {f: list(t) for f, t in self.families.items()}}
+
+    def __len__(self) -> int:
+        return sum(len(terms) for terms in self.families.values())
+
+    def __repr__(self) -> str:
+        return f"Lexicon(name={self.name!r}, terms={len(self)}, hash={self.content_hash[:12]})"
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def compile(
+        self, cache_dir: Optional[str] = None, match_mode: str = "substring"
+    ) -> Union[KeywordMatcher, TokenMatcher]:
+        """
+        Return the matcher for this lexicon.
+
+        Args:
+            cache_dir: If given, load the compiled substring matcher from
+                ``<cache_dir>/lexicon-<hash>-substring-v<version>.json`` or
+                write it there after building.
+            match_mode: ``"substring"`` (``KeywordMatcher``) or ``"word"``
+                (``TokenMatcher``).
+        """
+        if cache_dir is None or match_mode == "word":
+            return self._build(match_mode)
+
+        path = os.path.join(
+            cache_dir,
+            f"lexicon-{self.content_hash}-{match_mode}-v{KeywordMatcher.CACHE_VERSION}.json",
+        )
+        try:
+            with open(path, encoding="utf-8") as fh:
+                cached = KeywordMatcher.from_data(json.load(fh))
+            if cached.n_families == len(LEXICON_FAMILIES):
+                return cached
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        matcher = self._build(match_mode)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(matcher.to_data(), fh, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+        return matcher
+
+    def _build(self, match_mode: str) -> Union[KeywordMatcher, TokenMatcher]:
+        families = [self.families[f] for f in LEXICON_FAMILIES]
+        if match_mode == "word":
+            return TokenMatcher(families)
+        return KeywordMatcher(families)
@@ -5,9 +5,54 @@ All keyword lists and detection logic live here; utility helpers are
 imported from src.utils to avoid duplication.
 """
 
-from typing import Dict
+import re
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from src.utils import count_keywords, count_phrases
+import numpy as np
+
+from src.utils import terms
+
+from .claim_highlighter import ClaimHighlighter
+from .lexicon import Lexicon
+from .matcher import KeywordMatcher, TokenMatcher
+
+_WORD_RE = re.compile(r"\S+")
+
+# Joins documents in detect_patterns_batch(): no keyword contains "\x00" and
+# the newlines keep the NUL a separate whitespace-delimited word
+_BATCH_SEP = "\n\x00\n"
+_BATCH_SEP_WORD = "\x00"
+
+class PatternSpans:
+    """
+    Compact record of where each pattern family fired in a text.
+
+    Stored as three parallel ``int32`` arrays (family index, start, end)
+    sorted by start offset, so memory is proportional to the number of hits.
+    Family indices refer to ``PatternDetector.SPAN_FAMILIES``.
+    """
+
+    __slots__ = ("family", "start", "end")
+
+    FAMILIES: Tuple[str, ...] = ()   # set below, once PatternDetector exists
+
+    def __init__(self, family: np.ndarray, start: np.ndarray, end: np.ndarray) -> None:
+        self.family = family
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def __iter__(self) -> Iterator[Tuple[str, int, int]]:
+        names = self.FAMILIES
+        for f, s, e in zip(self.family.tolist(), self.start.tolist(), self.end.tolist()):
+            yield names[f], s, e
+
+    def of(self, family: str) -> List[Tuple[int, int]]:
+        """Return the ``(start, end)`` spans of a single *family*."""
+        mask = self.family == self.FAMILIES.index(family)
+        return list(zip(self.start[mask].tolist(), self.end[mask].tolist()))
 
 
 class PatternDetector:
@@ -15,60 +60,149 @@ class PatternDetector:
     Detects linguistic patterns associated with misinformation in news articles.
 
     All keyword / phrase lists are class-level constants so they are created
-    once per import, not once per detect_patterns() call.
+    once per import, not once per detect_patterns() call.  They form the
+    default lexicon; pass a ``Lexicon`` to use per-market lists instead.
+
+    ``match_mode="substring"`` (default) counts keywords anywhere, as the
+    original ``count_keywords`` did; ``match_mode="word"`` counts whole
+    words and phrases only (see ``TokenMatcher``).
     """
 
     # ------------------------------------------------------------------
-    # Keyword / phrase lists (class-level constants)
+    # Keyword / phrase lists (class-level constants, from src.utils.terms)
     # ------------------------------------------------------------------
 
-    SENSATIONAL_KEYWORDS = [
-        "SHOCKING", "BREAKING", "UNBELIEVABLE", "EXPOSED",
-        "REVEALED", "SECRET", "HIDDEN", "TRUTH", "BOMBSHELL",
-        "EXPLOSIVE", "STUNNING", "INCREDIBLE",
-    ]
-
-    VAGUE_SOURCE_PATTERNS = [
-        "sources say", "experts claim", "reports suggest",
-        "allegedly", "rumored", "according to sources",
-        "insiders say", "it is believed", "some say", "many believe",
-    ]
-
-    CONSPIRACY_KEYWORDS = [
-        "cover-up", "cover up", "conspiracy", "they don't want you to know",
-        "mainstream media", "wake up", "sheeple", "hidden truth",
-        "secret agenda", "deep state", "false flag", "controlled by",
-    ]
-
-    EMOTIONAL_KEYWORDS = [
-        "outrage", "terrifying", "devastating", "horrifying",
-        "shocking", "disgusting", "appalling", "outrageous",
-        "scandalous", "alarming", "disturbing",
-    ]
-
-    BALANCE_INDICATORS = [
-        "however", "although", "on the other hand", "but",
-        "despite", "nevertheless", "yet", "while", "whereas",
-        "conversely", "alternatively",
-    ]
-
-    EVIDENCE_INDICATORS = [
-        "study", "research", "data", "statistics", "percent",
-        "according to", "published", "journal", "university",
-        "professor", "analysis", "survey", "report",
-    ]
-
-    EXTREME_ADJECTIVES = [
-        "always", "never", "every", "all", "none", "completely",
-        "totally", "absolutely", "definitely", "entirely",
-        "utterly", "wholly",
-    ]
-
-    CLICKBAIT_PATTERNS = [
-        "you won't believe", "what happened next",
-        "will shock you", "doctors hate", "one weird trick",
-        "this is why", "the reason why", "you need to see",
-    ]
+    SENSATIONAL_KEYWORDS = list(terms.SENSATIONAL_PHRASES)
+    VAGUE_SOURCE_PATTERNS = list(terms.VAGUE_SOURCES)
+    CONSPIRACY_KEYWORDS = list(terms.CONSPIRACY_FRAMING)
+    EMOTIONAL_KEYWORDS = list(terms.EMOTIONAL_MANIPULATION)
+    BALANCE_INDICATORS = list(terms.BALANCE)
+    EVIDENCE_INDICATORS = list(terms.EVIDENCE)
+    EXTREME_ADJECTIVES = list(terms.EXTREME_ADJECTIVES)
+    CLICKBAIT_PATTERNS = list(terms.CLICKBAIT)
+
+    # Keys of the detect_patterns() dict, in order
+    PATTERN_KEYS: Tuple[str, ...] = (
+        "sensational_phrases", "excessive_caps", "vague_sources",
+        "conspiracy_framing", "emotional_manipulation", "one_sided",
+        "no_evidence", "extreme_adjectives", "clickbait",
+    )
+
+    # Row type of detect_patterns_batch(): counts are ints, ratios floats
+    PATTERN_DTYPE = np.dtype([
+        ("sensational_phrases", np.int64),
+        ("excessive_caps", np.float64),
+        ("vague_sources", np.int64),
+        ("conspiracy_framing", np.int64),
+        ("emotional_manipulation", np.int64),
+        ("one_sided", np.float64),
+        ("no_evidence", np.float64),
+        ("extreme_adjectives", np.int64),
+        ("clickbait", np.int64),
+    ])
+
+    # Order of the raw counters returned by count_pattern_hits()
+    HIT_FIELDS: Tuple[str, ...] = (
+        "sensational_phrases", "caps_words", "words", "vague_sources",
+        "conspiracy_framing", "emotional_manipulation", "balance",
+        "evidence", "extreme_adjectives", "clickbait",
+    )
+
+    # Families reported by detect_patterns_with_spans(): HIT_FIELDS minus
+    # the plain word count
+    SPAN_FAMILIES: Tuple[str, ...] = (
+        "sensational_phrases", "caps_words", "vague_sources",
+        "conspiracy_framing", "emotional_manipulation", "balance",
+        "evidence", "extreme_adjectives", "clickbait",
+    )
+    _CAPS_FAMILY = 1
+    # SPAN_FAMILIES slot of each matcher family (see _keyword_matcher order)
+    _MATCHER_TO_SPAN: Tuple[int, ...] = (0, 2, 3, 4, 5, 6, 7, 8)
+
+    MATCH_MODES: Tuple[str, ...] = ("substring", "word")
+
+    # Compiled lazily on first use (one per match mode), shared by all instances
+    _matchers: Optional[Dict[str, Any]] = None
+    _default_lexicon: Optional[Lexicon] = None
+
+    def __init__(
+        self,
+        lexicon: Optional[Lexicon] = None,
+        cache_dir: Optional[str] = None,
+        match_mode: str = "substring",
+    ) -> None:
+        """
+        Args:
+            lexicon: Keyword families to match instead of the class lists.
+            cache_dir: Directory for the compiled-lexicon cache (see
+                ``Lexicon.compile``); only used with *lexicon*.
+            match_mode: ``"substring"`` or ``"word"``.
+
+        Raises:
+            ValueError: For an unknown *match_mode*.
+        """
+        if match_mode not in self.MATCH_MODES:
+            raise ValueError(f"match_mode must be one of {self.MATCH_MODES}.")
+        self.lexicon = lexicon
+        self.match_mode = match_mode
+        self._lexicon_matcher = (
+            lexicon.compile(cache_dir, match_mode=match_mode) if lexicon is not None else None
+        )
+
+    @classmethod
+    def default_lexicon(cls) -> Lexicon:
+        """
+        The class keyword lists as a ``Lexicon`` (built once per class).
+
+        The claim families are ``ClaimHighlighter``'s sentence-level lists.
+        """
+        if cls.__dict__.get("_default_lexicon") is None:
+            cls._default_lexicon = Lexicon({
+                "sensational_phrases":    cls.SENSATIONAL_KEYWORDS,
+                "vague_sources":          cls.VAGUE_SOURCE_PATTERNS,
+                "conspiracy_framing":     cls.CONSPIRACY_KEYWORDS,
+                "emotional_manipulation": cls.EMOTIONAL_KEYWORDS,
+                "balance":                cls.BALANCE_INDICATORS,
+                "evidence":               cls.EVIDENCE_INDICATORS,
+                "extreme_adjectives":     cls.EXTREME_ADJECTIVES,
+                "clickbait":              cls.CLICKBAIT_PATTERNS,
+                "claim_vague_sources":    ClaimHighlighter.VAGUE_SOURCE_PATTERNS,
+                "claim_conspiracy":       ClaimHighlighter.CONSPIRACY_MARKERS,
+                "claim_extreme":          ClaimHighlighter.EXTREME_WORDS,
+                "claim_evidence":         ClaimHighlighter.EVIDENCE_MARKERS,
+            }, name="default")
+        return cls._default_lexicon
+
+    @property
+    def lexicon_hash(self) -> str:
+        """Content hash of the active lexicon, for keying cached results."""
+        return (self.lexicon or self.default_lexicon()).content_hash
+
+    def _active_matcher(self) -> KeywordMatcher:
+        if self._lexicon_matcher is not None:
+            return self._lexicon_matcher
+        return self._keyword_matcher(self.match_mode)
+
+    @classmethod
+    def _keyword_matcher(cls, match_mode: str = "substring") -> KeywordMatcher:
+        """Return the compiled matcher for the keyword families (built once per mode)."""
+        if cls.__dict__.get("_matchers") is None:
+            cls._matchers = {}
+        matcher = cls._matchers.get(match_mode)
+        if matcher is None:
+            families = [
+                cls.SENSATIONAL_KEYWORDS,
+                cls.VAGUE_SOURCE_PATTERNS,
+                cls.CONSPIRACY_KEYWORDS,
+                cls.EMOTIONAL_KEYWORDS,
+                cls.BALANCE_INDICATORS,
+                cls.EVIDENCE_INDICATORS,
+                cls.EXTREME_ADJECTIVES,
+                cls.CLICKBAIT_PATTERNS,
+            ]
+            matcher = TokenMatcher(families) if match_mode == "word" else KeywordMatcher(families)
+            cls._matchers[match_mode] = matcher
+        return matcher
 
     # ------------------------------------------------------------------
     # Public API
@@ -108,38 +242,247 @@ class PatternDetector:
         if not text:
             return _empty
 
-        patterns: Dict[str, float] = {}
+        return self.patterns_from_hits(self.count_pattern_hits(text))
 
-        patterns["sensational_phrases"] = count_keywords(
-            text, self.SENSATIONAL_KEYWORDS
-        )
+    def count_pattern_hits(self, text: str) -> Tuple[int, ...]:
+        """
+        Return the raw hit counts behind ``detect_patterns()``.
+
+        The counts are in ``HIT_FIELDS`` order and are *additive*: for texts
+        joined on a newline (no keyword spans a line break) the hits of the
+        whole equal the element-wise sum of the hits of the parts.  This is
+        what lets callers cache counts per paragraph.
+
+        Args:
+            text: Article text (or a single line of it).
+
+        Returns:
+            Tuple of ints aligned with ``HIT_FIELDS``.
+        """
+        if not text:
+            return (0,) * len(self.HIT_FIELDS)
 
         words = text.split()
-        if words:
-            caps_words = [w for w in words if w.isupper() and len(w) > 2]
-            patterns["excessive_caps"] = len(caps_words) / len(words)
+        caps_words = sum(1 for w in words if w.isupper() and len(w) > 2)
+        return self._hits_tuple(
+            self._active_matcher().count(text.lower()), caps_words, len(words)
+        )
+
+    def detect_patterns_with_spans(
+        self, text: str
+    ) -> Tuple[Dict[str, float], PatternSpans]:
+        """
+        Like ``detect_patterns()``, but also report where each pattern fired.
+
+        Counts are derived from the located hits, so both outputs come from
+        the same scan and always agree.  Offsets index into *text* (they are
+        taken from ``text.lower()``, which has the same length for all but a
+        handful of exotic Unicode code points).
+
+        Args:
+            text: Article text to analyse.
+
+        Returns:
+            ``(patterns, spans)`` — the ``detect_patterns()`` dict and a
+            ``PatternSpans`` of ``(family, start, end)`` hits in
+            ``SPAN_FAMILIES`` terms, sorted by start offset.
+        """
+        if not text:
+            empty = np.empty(0, dtype=np.int32)
+            return self.detect_patterns(text), PatternSpans(empty, empty, empty)
+
+        matcher = self._active_matcher()
+        hits = matcher.find(text.lower())
+
+        slot = self._MATCHER_TO_SPAN
+        triples = [(slot[f], s, e) for f, s, e in hits]
+        n_words = 0
+        for word in _WORD_RE.finditer(text):
+            n_words += 1
+            w = word.group()
+            if w.isupper() and len(w) > 2:
+                triples.append((self._CAPS_FAMILY, word.start(), word.end()))
+
+        arr = np.array(triples, dtype=np.int32).reshape(-1, 3)
+        order = np.lexsort((arr[:, 0], arr[:, 1]))
+        arr = arr[order]
+        spans = PatternSpans(
+            np.ascontiguousarray(arr[:, 0]),
+            np.ascontiguousarray(arr[:, 1]),
+            np.ascontiguousarray(arr[:, 2]),
+        )
+
+        per_family = np.bincount(arr[:, 0], minlength=len(self.SPAN_FAMILIES)).tolist()
+        keyword_counts = [per_family[0]] + per_family[2:]
+        counts = self._hits_tuple(keyword_counts, per_family[self._CAPS_FAMILY], n_words)
+        return self.patterns_from_hits(counts), spans
+
+    def detect_patterns_batch(
+        self,
+        texts: Sequence[str],
+        n_jobs: int = -1,
+        chunk_size: int = 2000,
+        as_frame: bool = False,
+    ) -> Any:
+        """
+        Run ``detect_patterns()`` over a corpus, a chunk at a time.
+
+        Each chunk of *chunk_size* documents is joined into a single string
+        that the compiled matcher scans once (``count_documents()``, see
+        ``src.patterns.matcher``); words and caps words come from one
+        ``split()`` of the chunk.  Chunks can be spread over *n_jobs* worker
+        processes (``-1`` = all cores, sklearn-style), which is where the
+        larger speed-ups come from on multi-core machines.
+
+        Args:
+            texts: Article texts.
+            n_jobs: Number of worker processes.
+            chunk_size: Documents per chunk / task.
+            as_frame: Return a ``pandas.DataFrame`` instead of an array.
+
+        Returns:
+            Structured array of ``PATTERN_DTYPE`` (one row per text, columns
+            equal to the ``detect_patterns()`` keys and values), or the
+            equivalent DataFrame.
+        """
+        texts = list(texts)
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+        if len(chunks) > 1 and n_jobs != 1:
+            from joblib import Parallel, delayed
+
+            parts = Parallel(n_jobs=n_jobs)(
+                delayed(_batch_hits_chunk)(self, chunk) for chunk in chunks
+            )
         else:
-            patterns["excessive_caps"] = 0.0
+            parts = [_batch_hits_chunk(self, chunk) for chunk in chunks]
 
-        patterns["vague_sources"] = count_phrases(
-            text, self.VAGUE_SOURCE_PATTERNS
+        hits = (
+            np.concatenate(parts) if parts
+            else np.zeros((0, len(self.HIT_FIELDS)), dtype=np.int64)
         )
-        patterns["conspiracy_framing"] = count_keywords(
-            text, self.CONSPIRACY_KEYWORDS
+        empty = np.fromiter((not t for t in texts), dtype=bool, count=len(texts))
+        result = self._patterns_from_hit_matrix(hits, empty)
+
+        if as_frame:
+            import pandas as pd
+
+            return pd.DataFrame(result)
+        return result
+
+    def _batch_hits(self, texts: Sequence[str]) -> np.ndarray:
+        """Raw ``HIT_FIELDS`` matrix for *texts* (one row per text)."""
+        n = len(texts)
+        hits = np.zeros((n, len(self.HIT_FIELDS)), dtype=np.int64)
+
+        # Texts containing the separator (or empty ones) go the slow way
+        joinable = [i for i, t in enumerate(texts) if t and _BATCH_SEP_WORD not in t]
+        for i in set(range(n)).difference(joinable):
+            if texts[i]:
+                hits[i] = self.count_pattern_hits(texts[i])
+        if not joinable:
+            return hits
+
+        docs = [texts[i] for i in joinable]
+        joined = _BATCH_SEP.join(docs)
+        lowered = joined.lower()
+        if len(lowered) != len(joined):
+            # Case mapping changed the length, so offsets no longer line up
+            for i in joinable:
+                hits[i] = self.count_pattern_hits(texts[i])
+            return hits
+
+        lengths = np.fromiter(map(len, docs), dtype=np.int64, count=len(docs))
+        starts = np.zeros(len(docs), dtype=np.int64)
+        np.cumsum(lengths[:-1] + len(_BATCH_SEP), out=starts[1:])
+
+        keyword_counts = self._active_matcher().count_documents(lowered, starts)
+
+        words = joined.split()
+        n_words = len(words)
+        is_sep = np.fromiter(map(_BATCH_SEP_WORD.__eq__, words), dtype=bool, count=n_words)
+        is_caps = np.fromiter(map(str.isupper, words), dtype=bool, count=n_words)
+        upper_idx = np.flatnonzero(is_caps)
+        is_caps[upper_idx[[len(words[i]) <= 2 for i in upper_idx.tolist()]]] = False
+        doc_of_word = np.cumsum(is_sep)
+        word_counts = np.bincount(doc_of_word[~is_sep], minlength=len(docs))
+        caps_counts = np.bincount(doc_of_word[is_caps], minlength=len(docs))
+
+        rows = np.asarray(joinable)
+        (sensational, vague, conspiracy, emotional,
+         balance, evidence, extreme, clickbait) = keyword_counts
+        hits[rows] = np.column_stack((
+            sensational, caps_counts, word_counts, vague, conspiracy,
+            emotional, balance, evidence, extreme, clickbait,
+        ))
+        return hits
+
+    def _patterns_from_hit_matrix(
+        self, hits: np.ndarray, empty: np.ndarray
+    ) -> np.ndarray:
+        """Vectorised ``patterns_from_hits`` (rows flagged *empty* stay zero)."""
+        (sensational, caps_words, words, vague, conspiracy, emotional,
+         balance_count, evidence_count, extreme, clickbait) = hits.T
+
+        out = np.zeros(len(hits), dtype=self.PATTERN_DTYPE)
+        out["sensational_phrases"] = sensational
+        out["excessive_caps"] = np.divide(
+            caps_words, words, out=np.zeros(len(hits)), where=words > 0
         )
-        patterns["emotional_manipulation"] = count_keywords(
-            text, self.EMOTIONAL_KEYWORDS
+        out["vague_sources"] = vague
+        out["conspiracy_framing"] = conspiracy
+        out["emotional_manipulation"] = emotional
+        out["one_sided"] = np.maximum(0.0, 1.0 - np.minimum(1.0, balance_count / 3.0))
+        out["no_evidence"] = np.maximum(0.0, 1.0 - np.minimum(1.0, evidence_count / 5.0))
+        out["extreme_adjectives"] = extreme
+        out["clickbait"] = clickbait
+
+        if empty.any():
+            out[empty] = np.zeros(1, dtype=self.PATTERN_DTYPE)
+        return out
+
+    @staticmethod
+    def _hits_tuple(
+        keyword_counts: Sequence[int], caps_words: int, words: int
+    ) -> Tuple[int, ...]:
+        """Interleave matcher counts (keyword families) with the caps counters."""
+        (sensational, vague, conspiracy, emotional,
+         balance, evidence, extreme, clickbait) = keyword_counts
+        return (
+            sensational, caps_words, words, vague, conspiracy,
+            emotional, balance, evidence, extreme, clickbait,
         )
 
-        balance_count = count_phrases(text, self.BALANCE_INDICATORS)
-        patterns["one_sided"] = max(0.0, 1.0 - min(1.0, balance_count / 3.0))
+    def patterns_from_hits(self, hits: Sequence[int]) -> Dict[str, float]:
+        """
+        Convert raw hits (see ``count_pattern_hits``) into the pattern dict.
 
-        evidence_count = count_keywords(text, self.EVIDENCE_INDICATORS)
-        patterns["no_evidence"] = max(0.0, 1.0 - min(1.0, evidence_count / 5.0))
+        Args:
+            hits: Counts aligned with ``HIT_FIELDS`` for a non-empty text.
 
-        patterns["extreme_adjectives"] = count_keywords(
-            text, self.EXTREME_ADJECTIVES
-        )
-        patterns["clickbait"] = count_phrases(text, self.CLICKBAIT_PATTERNS)
+        Returns:
+            The same dictionary ``detect_patterns()`` returns for that text.
+        """
+        (sensational, caps_words, words, vague, conspiracy, emotional,
+         balance_count, evidence_count, extreme, clickbait) = hits
+
+        patterns: Dict[str, float] = {}
+        patterns["sensational_phrases"] = sensational
+        patterns["excessive_caps"] = caps_words / words if words else 0.0
+        patterns["vague_sources"] = vague
+        patterns["conspiracy_framing"] = conspiracy
+        patterns["emotional_manipulation"] = emotional
+        patterns["one_sided"] = max(0.0, 1.0 - min(1.0, balance_count / 3.0))
+        patterns["no_evidence"] = max(0.0, 1.0 - min(1.0, evidence_count / 5.0))
+        patterns["extreme_adjectives"] = extreme
+        patterns["clickbait"] = clickbait
 
         return patterns
+
+
+PatternSpans.FAMILIES = PatternDetector.SPAN_FAMILIES
+
+
+def _batch_hits_chunk(detector: PatternDetector, texts: Sequence[str]) -> np.ndarray:
+    """Module-level worker so chunks can be shipped to joblib processes."""
+    return detector._batch_hits(texts)
@@ -0,0 +1,4 @@
+from .columnar import ColumnarResultReader, ColumnarResultWriter
+from .result_store import ResultStore
+
+__all__ = ["ColumnarResultReader", "ColumnarResultWriter", "ResultStore"]
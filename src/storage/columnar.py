@@ -0,0 +1,410 @@
+"""
+Columnar result files for batch runs.
+
+``ColumnarResultWriter`` buffers ``analyze()`` results into column batches
+and writes them as Parquet (when ``pyarrow`` is installed) or as NumPy
+``.npz`` files otherwise; ``ColumnarResultReader`` reads them back lazily
+for dashboards.
+
+Design decisions
+----------------
+* **One directory, many parts.**  Results go to ``part-NNNNN.<ext>`` files
+  in a directory.  Re-opening the directory appends new parts after the
+  existing ones; Parquet parts rotate after ``max_rows_per_file`` rows.
+* **Typed columns.**  Scores and counts are integer / float columns, the
+  nine pattern values use ``PatternDetector.PATTERN_DTYPE``, labels are
+  string columns and indicators / claims are list-of-string columns.
+  Narrative strings (summary, explanation) are optional because they can
+  be regenerated from the other columns.
+* **Bounded memory.**  At most ``batch_size`` rows are buffered; each
+  flush becomes one Parquet row group or one ``.npz`` part.
+* **Readers never see partial files.**  Parts are written under a
+  ``.tmp`` name and renamed once complete.
+* ``.npz`` stores strings Arrow-style — UTF-8 bytes plus ``int64``
+  offsets — so the files load without ``allow_pickle``.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.patterns import PatternDetector
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = pq = None
+
+
+STR = "str"
+STR_LIST = "list<str>"
+
+# (column, numpy dtype or STR / STR_LIST), in file order
+RESULT_COLUMNS: Tuple[Tuple[str, Any], ...] = (
+    ("doc_id",              STR),
+    ("classification",      STR),
+    ("credibility_score",   np.dtype(np.int16)),
+    ("risk_level",          STR),
+    ("confidence",          np.dtype(np.int16)),
+    ("model_prediction",    np.dtype(np.int8)),
+    ("pattern_score",       np.dtype(np.float64)),
+    ("pattern_consistency", np.dtype(np.float64)),
+    ("emotional_tone",      STR),
+) + tuple(
+    (key, PatternDetector.PATTERN_DTYPE[key]) for key in PatternDetector.PATTERN_KEYS
+) + (
+    ("key_indicators",      STR_LIST),
+    ("suspicious_claims",   STR_LIST),
+)
+
+NARRATIVE_COLUMNS: Tuple[Tuple[str, Any], ...] = (
+    ("analysis_summary",    STR),
+    ("recommended_action",  STR),
+    ("explanation",         STR),
+)
+
+_PATTERN_KEYS = frozenset(PatternDetector.PATTERN_KEYS)
+
+
+def _available_format() -> str:
+    return "parquet" if pa is not None else "npz"
+
+
+def _part_number(path: str) -> int:
+    """The NNNNN of ``part-NNNNN.<ext>`` (wider than five digits past 99999)."""
+    return int(os.path.basename(path).split(".")[0][len("part-"):])
+
+
+def _part_paths(directory: str) -> List[str]:
+    """Completed part files in *directory*, in write order."""
+    paths = glob.glob(os.path.join(directory, "part-*.parquet"))
+    paths += glob.glob(os.path.join(directory, "part-*.npz"))
+    return sorted(paths, key=_part_number)
+
+
+# ---------------------------------------------------------------------------
+# Writer
+# ---------------------------------------------------------------------------
+
+class ColumnarResultWriter:
+    """
+    Append ``analyze()`` results to a directory of columnar part files.
+
+    Usage
+    -----
+    >>> with ColumnarResultWriter("out/results") as writer:
+    ...     for doc_id, text in articles:
+    ...         writer.write(analyzer.analyze(text, model, vec), doc_id=doc_id)
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        batch_size: int = 10_000,
+        max_rows_per_file: int = 1_000_000,
+        format: str = "auto",
+        include_narrative: bool = False,
+        append: bool = True,
+    ) -> None:
+        """
+        Args:
+            directory: Output directory (created if missing).
+            batch_size: Rows buffered before a flush.
+            max_rows_per_file: Rows per part before rotating.  A Parquet
+                part holds several row groups; an ``.npz`` part holds one
+                batch (so at most ``min(batch_size, max_rows_per_file)``).
+            format: ``"parquet"``, ``"npz"`` or ``"auto"`` (Parquet if
+                ``pyarrow`` is importable).
+            include_narrative: Also store the summary, recommended action
+                and explanation strings.
+            append: Add parts after existing ones; if ``False`` an existing
+                non-empty directory raises ``FileExistsError``.
+
+        Raises:
+            ValueError: If *format* is unknown or Parquet is unavailable.
+        """
+        if format == "auto":
+            format = _available_format()
+        if format not in ("parquet", "npz"):
+            raise ValueError(f"Unknown format: {format!r}")
+        if format == "parquet" and pa is None:
+            raise ValueError("Parquet output requires pyarrow; use format='npz'.")
+        if batch_size < 1 or max_rows_per_file < 1:
+            raise ValueError("batch_size and max_rows_per_file must be positive.")
+
+        os.makedirs(directory, exist_ok=True)
+        existing = _part_paths(directory)
+        if existing and not append:
+            raise FileExistsError(f"{directory} already contains result parts.")
+
+        self.directory = directory
+        self.format = format
+        self.batch_size = batch_size
+        self.max_rows_per_file = max_rows_per_file
+        self.columns = RESULT_COLUMNS + (NARRATIVE_COLUMNS if include_narrative else ())
+
+        self._next_part = (
+            _part_number(existing[-1]) + 1 if existing else 0
+        )
+        self._buffer: Dict[str, list] = {name: [] for name, _ in self.columns}
+        self._buffered = 0
+        self._part_rows = 0
+        self._parquet_writer: Any = None
+        self._tmp_path: Optional[str] = None
+        self.rows_written = 0
+
+    # -- Public API ----------------------------------------------------------
+
+    def write(self, result: Any, doc_id: Optional[str] = None) -> None:
+        """
+        Buffer one result (dict, ``LazyAnalysisResult`` or ``AnalysisResult``).
+
+        Args:
+            result: Output of ``CredibilityAnalyzer.analyze()``.
+            doc_id: Optional identifier stored in the ``doc_id`` column.
+        """
+        get = result.__getitem__ if isinstance(result, Mapping) else result.__getattribute__
+        patterns = get("patterns") or {}
+        buffer = self._buffer
+        for name, _ in self.columns:
+            if name == "doc_id":
+                value = "" if doc_id is None else str(doc_id)
+            elif name in _PATTERN_KEYS:
+                value = patterns.get(name, 0)
+            else:
+                value = get(name)
+            buffer[name].append(value)
+
+        self._buffered += 1
+        if (
+            self._buffered >= self.batch_size
+            or self._part_rows + self._buffered >= self.max_rows_per_file
+        ):
+            self.flush()
+
+    def write_many(
+        self, results: Iterable[Any], doc_ids: Optional[Iterable[str]] = None
+    ) -> None:
+        """Buffer every result in *results* (optionally paired with *doc_ids*)."""
+        if doc_ids is None:
+            for result in results:
+                self.write(result)
+        else:
+            for result, doc_id in zip(results, doc_ids):
+                self.write(result, doc_id)
+
+    def flush(self) -> None:
+        """Write buffered rows as one row group / part file."""
+        if not self._buffered:
+            return
+        n = self._buffered
+        if self.format == "parquet":
+            self._flush_parquet()
+        else:
+            self._flush_npz()
+        self.rows_written += n
+        self._buffer = {name: [] for name, _ in self.columns}
+        self._buffered = 0
+
+    def rotate(self) -> None:
+        """Flush and close the current part; the next write starts a new one."""
+        self.flush()
+        self._close_part()
+
+    def close(self) -> None:
+        """Flush everything and finalise the current part."""
+        self.rotate()
+
+    def __enter__(self) -> "ColumnarResultWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # -- Backends ------------------------------------------------------------
+
+    def _close_part(self) -> None:
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+            os.replace(self._tmp_path, self._tmp_path[: -len(".tmp")])
+            self._tmp_path = None
+        self._part_rows = 0
+
+    def _new_part_path(self, ext: str) -> str:
+        path = os.path.join(self.directory, f"part-{self._next_part:05d}.{ext}")
+        self._next_part += 1
+        return path
+
+    def _flush_parquet(self) -> None:
+        arrays, fields = [], []
+        for name, kind in self.columns:
+            values = self._buffer[name]
+            if kind == STR:
+                arrow_type = pa.string()
+            elif kind == STR_LIST:
+                arrow_type = pa.list_(pa.string())
+                values = [list(v) for v in values]
+            else:
+                arrow_type = pa.from_numpy_dtype(kind)
+                values = np.asarray(values, dtype=kind)
+            arrays.append(pa.array(values, type=arrow_type))
+            fields.append(pa.field(name, arrow_type))
+        table = pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+        if self._parquet_writer is None:
+            self._tmp_path = self._new_part_path("parquet") + ".tmp"
+            self._parquet_writer = pq.ParquetWriter(self._tmp_path, table.schema)
+        self._parquet_writer.write_table(table)
+        self._part_rows += table.num_rows
+        if self._part_rows >= self.max_rows_per_file:
+            self._close_part()
+
+    def _flush_npz(self) -> None:
+        payload: Dict[str, np.ndarray] = {}
+        for name, kind in self.columns:
+            values = self._buffer[name]
+            if kind == STR:
+                payload[f"{name}.data"], payload[f"{name}.offsets"] = _encode_strings(values)
+            elif kind == STR_LIST:
+                flat = [s for row in values for s in row]
+                payload[f"{name}.data"], payload[f"{name}.offsets"] = _encode_strings(flat)
+                payload[f"{name}.list_offsets"] = _offsets([len(row) for row in values])
+            else:
+                payload[name] = np.asarray(values, dtype=kind)
+
+        path = self._new_part_path("npz")
+        with open(path + ".tmp", "wb") as fh:
+            np.savez(fh, **payload)
+        os.replace(path + ".tmp", path)
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+class ColumnarResultReader:
+    """
+    Lazy reader for a directory written by ``ColumnarResultWriter``.
+
+    Only the requested columns of one row group / part are materialised at
+    a time by ``iter_batches()``; ``read()`` concatenates them.
+
+    Usage
+    -----
+    >>> reader = ColumnarResultReader("out/results")
+    >>> len(reader)
+    >>> df = reader.read(["classification", "credibility_score"])
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    @property
+    def parts(self) -> List[str]:
+        """Completed part files, re-listed on every access."""
+        return _part_paths(self.directory)
+
+    def __len__(self) -> int:
+        total = 0
+        for path in self.parts:
+            if path.endswith(".parquet"):
+                total += pq.ParquetFile(path).metadata.num_rows
+            else:
+                with np.load(path) as npz:
+                    total += len(npz["credibility_score"])
+        return total
+
+    def iter_batches(
+        self, columns: Optional[Sequence[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield one ``DataFrame`` per Parquet row group / ``.npz`` part.
+
+        String columns are ``object`` columns of ``str``; list columns hold
+        Python lists.
+
+        Args:
+            columns: Column names to load (all if ``None``).
+        """
+        for path in self.parts:
+            if path.endswith(".parquet"):
+                parquet = pq.ParquetFile(path)
+                for i in range(parquet.num_row_groups):
+                    yield _arrow_to_frame(parquet.read_row_group(i, columns=columns))
+            else:
+                yield _npz_to_frame(path, columns)
+
+    def read(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Load *columns* of every part into one ``DataFrame``."""
+        frames = list(self.iter_batches(columns))
+        if not frames:
+            return pd.DataFrame(columns=list(columns) if columns else None)
+        return pd.concat(frames, ignore_index=True)
+
+
+# ---------------------------------------------------------------------------
+# Encoding helpers
+# ---------------------------------------------------------------------------
+
+def _offsets(lengths: List[int]) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _encode_strings(values: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [v.encode("utf-8") for v in values]
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return data, _offsets([len(b) for b in encoded])
+
+
+def _decode_strings(data: np.ndarray, offsets: np.ndarray) -> List[str]:
+    buf = data.tobytes()
+    bounds = offsets.tolist()
+    return [buf[bounds[i]:bounds[i + 1]].decode("utf-8") for i in range(len(bounds) - 1)]
+
+
+def _npz_to_frame(path: str, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    # np.load on an .npz is lazy: only the arrays accessed below are read
+    with np.load(path) as npz:
+        stored = {key.split(".")[0] for key in npz.files}
+        names = [n for n, _ in RESULT_COLUMNS + NARRATIVE_COLUMNS if n in stored]
+        if columns is not None:
+            missing = set(columns) - stored
+            if missing:
+                raise KeyError(f"Columns not in {path}: {', '.join(sorted(missing))}")
+            names = list(columns)
+
+        data: Dict[str, Any] = {}
+        for name in names:
+            if name in npz.files:
+                data[name] = npz[name]
+                continue
+            strings = _decode_strings(npz[f"{name}.data"], npz[f"{name}.offsets"])
+            if f"{name}.list_offsets" in npz.files:
+                bounds = npz[f"{name}.list_offsets"].tolist()
+                data[name] = [strings[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+            else:
+                data[name] = np.array(strings, dtype=object)
+    return pd.DataFrame(data, columns=names)
+
+
+def _arrow_to_frame(table: Any) -> pd.DataFrame:
+    data: Dict[str, Any] = {}
+    for name, column in zip(table.column_names, table.columns):
+        kind = column.type
+        if pa.types.is_list(kind) or pa.types.is_large_list(kind):
+            data[name] = column.to_pylist()
+        elif pa.types.is_string(kind) or pa.types.is_large_string(kind):
+            data[name] = np.array(column.to_pylist(), dtype=object)
+        else:
+            data[name] = column.to_numpy()
+    return pd.DataFrame(data, columns=table.column_names)
@@ -2,7 +2,9 @@ from .text_utils import (
     clean_text_for_model,
     count_keywords,
     count_phrases,
+    iter_sentences,
     split_into_sentences,
+    split_into_sentence_spans,
     contains_vague_source,
     contains_extreme_language,
     contains_evidence_markers,
@@ -13,7 +15,9 @@ __all__ = [
     "clean_text_for_model",
     "count_keywords",
     "count_phrases",
+    "iter_sentences",
     "split_into_sentences",
+    "split_into_sentence_spans",
     "contains_vague_source",
     "contains_extreme_language",
     "contains_evidence_markers",
@@ -0,0 +1,115 @@
+"""
+Built-in keyword lists — the default lexicon.
+
+One tuple per lexicon family (``LEXICON_FAMILIES`` and ``CLAIM_FAMILIES``
+in src/patterns/lexicon.py), under the family's name in upper case.
+``PatternDetector``, ``ClaimHighlighter``, the sentence helpers in
+``text_utils`` and the legacy top-level modules all read their defaults
+from here.
+
+Design decisions
+----------------
+* A leaf module (no imports from the package), so ``src.utils`` does not
+  depend on ``src.patterns`` for its defaults.
+* Pattern families and claim families are kept apart even where their
+  terms agree: the former feed counts, the latter per-sentence checks,
+  and they are tuned separately.
+"""
+
+from typing import Dict, Tuple
+
+# ---------------------------------------------------------------------------
+# Pattern families (counted by PatternDetector)
+# ---------------------------------------------------------------------------
+
+SENSATIONAL_PHRASES: Tuple[str, ...] = (
+    "SHOCKING", "BREAKING", "UNBELIEVABLE", "EXPOSED",
+    "REVEALED", "SECRET", "HIDDEN", "TRUTH", "BOMBSHELL",
+    "EXPLOSIVE", "STUNNING", "INCREDIBLE",
+)
+
+VAGUE_SOURCES: Tuple[str, ...] = (
+    "sources say", "experts claim", "reports suggest",
+    "allegedly", "rumored", "according to sources",
+    "insiders say", "it is believed", "some say", "many believe",
+)
+
+CONSPIRACY_FRAMING: Tuple[str, ...] = (
+    "cover-up", "cover up", "conspiracy", "they don't want you to know",
+    "mainstream media", "wake up", "sheeple", "hidden truth",
+    "secret agenda", "deep state", "false flag", "controlled by",
+)
+
+EMOTIONAL_MANIPULATION: Tuple[str, ...] = (
+    "outrage", "terrifying", "devastating", "horrifying",
+    "shocking", "disgusting", "appalling", "outrageous",
+    "scandalous", "alarming", "disturbing",
+)
+
+BALANCE: Tuple[str, ...] = (
+    "however", "although", "on the other hand", "but",
+    "despite", "nevertheless", "yet", "while", "whereas",
+    "conversely", "alternatively",
+)
+
+EVIDENCE: Tuple[str, ...] = (
+    "study", "research", "data", "statistics", "percent",
+    "according to", "published", "journal", "university",
+    "professor", "analysis", "survey", "report",
+)
+
+EXTREME_ADJECTIVES: Tuple[str, ...] = (
+    "always", "never", "every", "all", "none", "completely",
+    "totally", "absolutely", "definitely", "entirely",
+    "utterly", "wholly",
+)
+
+CLICKBAIT: Tuple[str, ...] = (
+    "you won't believe", "what happened next",
+    "will shock you", "doctors hate", "one weird trick",
+    "this is why", "the reason why", "you need to see",
+)
+
+# ---------------------------------------------------------------------------
+# Claim families (sentence checks of ClaimHighlighter)
+# ---------------------------------------------------------------------------
+
+CLAIM_VAGUE_SOURCES: Tuple[str, ...] = (
+    "sources say", "experts claim", "reports suggest", "allegedly",
+    "rumored", "according to sources", "insiders say", "it is believed",
+    "some say", "many believe",
+)
+
+CLAIM_CONSPIRACY: Tuple[str, ...] = (
+    "cover-up", "cover up", "conspiracy", "they don't want you to know",
+    "mainstream media", "wake up", "sheeple", "hidden truth",
+    "secret agenda", "deep state", "false flag", "controlled by",
+)
+
+CLAIM_EXTREME: Tuple[str, ...] = (
+    "always", "never", "every", "all", "none", "completely", "totally",
+    "absolutely", "definitely", "shocking", "unbelievable", "terrifying",
+    "devastating", "horrifying", "disgusting", "appalling",
+)
+
+CLAIM_EVIDENCE: Tuple[str, ...] = (
+    "study", "research", "data", "statistics", "percent", "according to",
+    "published", "journal", "university", "professor", "dr.", "phd",
+    "analysis", "survey", "report",
+)
+
+# Every family by its lexicon name
+DEFAULT_FAMILIES: Dict[str, Tuple[str, ...]] = {
+    "sensational_phrases":    SENSATIONAL_PHRASES,
+    "vague_sources":          VAGUE_SOURCES,
+    "conspiracy_framing":     CONSPIRACY_FRAMING,
+    "emotional_manipulation": EMOTIONAL_MANIPULATION,
+    "balance":                BALANCE,
+    "evidence":               EVIDENCE,
+    "extreme_adjectives":     EXTREME_ADJECTIVES,
+    "clickbait":              CLICKBAIT,
+    "claim_vague_sources":    CLAIM_VAGUE_SOURCES,
+    "claim_conspiracy":       CLAIM_CONSPIRACY,
+    "claim_extreme":          CLAIM_EXTREME,
+    "claim_evidence":         CLAIM_EVIDENCE,
+}
@@ -7,7 +7,9 @@ these functions.
 """
 
 import re
-from typing import List
+from typing import Collection, Iterator, List, Optional, Tuple
+
+from . import terms
 
 
 # ---------------------------------------------------------------------------
@@ -79,6 +81,56 @@ def count_phrases(text: str, phrases: List[str]) -> int:
 # Sentence splitter
 # ---------------------------------------------------------------------------
 
+_SENTENCE_BOUNDARY = re.compile(r"[.!?]+\s+|\n+")
+
+# Words whose trailing "." does not end a sentence ("Dr. Chen", "e.g. this")
+_ABBREVIATIONS = (
+    "dr", "mr", "mrs", "ms", "prof", "sr", "jr", "st", "mt", "gen", "gov",
+    "sen", "rep", "rev", "capt", "col", "lt", "sgt", "vs", "approx",
+    "fig", "vol", "inc", "ltd", "corp", "dept", "univ",
+    "jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep", "sept", "oct",
+    "nov", "dec",
+)
+_ABBREVIATION_SET = frozenset(_ABBREVIATIONS)
+# Dotted initialisms before the final "." ("U.S", "e.g", "i.e")
+_DOTTED_INITIALISM = re.compile(r"(?:[A-Za-z]\.)+[A-Za-z]")
+_ABBREVIATION_LOOKBACK = 8
+
+
+def iter_sentences(text: str) -> Iterator[Tuple[int, int]]:
+    """
+    Lazily yield the ``(start, end)`` offsets of the sentences in *text*.
+
+    Sentences end at ``.``, ``!`` or ``?`` followed by whitespace, and at
+    line breaks.  A single ``.`` after a common abbreviation ("Dr.",
+    "e.g."), a capital initial or a dotted initialism ("U.S.") does not end
+    a sentence unless a line break follows; decimals ("0.1%") never do,
+    since a boundary needs whitespace after the punctuation.  Spans are
+    trimmed of surrounding whitespace and never empty; no substrings are
+    created.
+
+    Args:
+        text: Full article text.
+
+    Yields:
+        Half-open spans into *text*, in document order.
+    """
+    if not text:
+        return
+    pos = 0
+    for boundary in _SENTENCE_BOUNDARY.finditer(text):
+        end = boundary.start()
+        if _is_abbreviation_stop(text, end, boundary.end()):
+            continue
+        span = _stripped_span(text, pos, end)
+        if span is not None:
+            yield span
+        pos = boundary.end()
+    span = _stripped_span(text, pos, len(text))
+    if span is not None:
+        yield span
+
+
 def split_into_sentences(text: str) -> List[str]:
     """
     Split *text* into sentences using punctuation heuristics.
@@ -87,70 +139,112 @@ def split_into_sentences(text: str) -> List[str]:
         text: Full article text.
 
     Returns:
-        List of non-empty sentence strings.
+        List of non-empty sentence strings (see ``iter_sentences``).
     """
-    if not text:
-        return []
-    parts = re.split(r"[.!?]+\s+|\n+", text)
-    return [s.strip() for s in parts if s.strip()]
+    return [text[start:end] for start, end in iter_sentences(text)]
+
+
+def split_into_sentence_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    Return ``(start, end)`` character offsets of the sentences in *text*.
+
+    List form of ``iter_sentences``, so
+    ``[text[s:e] for s, e in split_into_sentence_spans(text)]`` equals
+    ``split_into_sentences(text)``.
+
+    Args:
+        text: Full article text.
+
+    Returns:
+        List of half-open spans into *text*, in document order.
+    """
+    return list(iter_sentences(text))
+
+
+def _is_abbreviation_stop(text: str, start: int, end: int) -> bool:
+    """
+    True if the boundary ``text[start:end]`` is the period of an abbreviation.
+
+    That is a single ``.`` (no line break after it) following a listed
+    abbreviation, a capital initial ("J. Smith") or a dotted initialism
+    ("U.S.", "e.g.").
+    """
+    if text[start] != "." or text[start + 1] == "." or text.find("\n", start, end) != -1:
+        return False
+    # Walk back over the word; abbreviations are short, so stop early
+    i, lo = start, max(0, start - _ABBREVIATION_LOOKBACK)
+    while i > lo and (text[i - 1].isalpha() or text[i - 1] == "."):
+        i -= 1
+    if i == start or (i > 0 and (text[i - 1].isalnum() or text[i - 1] in "._")):
+        return False
+    word = text[i:start]
+    return (
+        word.lower() in _ABBREVIATION_SET
+        or (len(word) == 1 and word.isupper())
+        or _DOTTED_INITIALISM.fullmatch(word) is not None
+    )
+
+
+def _stripped_span(text: str, start: int, end: int) -> Optional[Tuple[int, int]]:
+    """Return ``(start, end)`` trimmed of surrounding whitespace, or ``None`` if empty."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return (start, end) if start < end else None
 
 
 # ---------------------------------------------------------------------------
 # Sentence-level detectors (used by ClaimHighlighter)
 # ---------------------------------------------------------------------------
 
-_VAGUE_SOURCE_PATTERNS: List[str] = [
-    "sources say", "experts claim", "reports suggest", "allegedly",
-    "rumored", "according to sources", "insiders say", "it is believed",
-    "some say", "many believe",
-]
-
-_EXTREME_WORDS: List[str] = [
-    "always", "never", "every", "all", "none", "completely", "totally",
-    "absolutely", "definitely", "shocking", "unbelievable", "terrifying",
-    "devastating", "horrifying", "disgusting", "appalling",
-]
-
-_EVIDENCE_MARKERS: List[str] = [
-    "study", "research", "data", "statistics", "percent", "according to",
-    "published", "journal", "university", "professor", "dr.", "phd",
-    "analysis", "survey", "report",
-]
-
-_CONSPIRACY_MARKERS: List[str] = [
-    "cover-up", "cover up", "conspiracy", "they don't want you to know",
-    "mainstream media", "wake up", "sheeple", "hidden truth",
-    "secret agenda", "deep state", "false flag", "controlled by",
-]
-
-
-def contains_vague_source(sentence: str) -> bool:
-    """Return True if *sentence* contains a vague source reference."""
+# The term lists are part of the lexicon schema (``CLAIM_FAMILIES`` in
+# src.patterns.lexicon).  Each helper takes the terms to check, defaulting
+# to the built-in claim families in ``terms``.
+
+_WORD_TOKEN = re.compile(r"\w+")
+_CLAIM_EXTREME_SET = frozenset(terms.CLAIM_EXTREME)
+
+
+def contains_vague_source(sentence: str, patterns: Optional[Collection[str]] = None) -> bool:
+    """Return True if *sentence* contains a vague source reference (default: built-in list)."""
     if not sentence:
         return False
+    if patterns is None:
+        patterns = terms.CLAIM_VAGUE_SOURCES
     sl = sentence.lower()
-    return any(p in sl for p in _VAGUE_SOURCE_PATTERNS)
+    return any(p in sl for p in patterns)
+
 
+def contains_extreme_language(sentence: str, words: Optional[Collection[str]] = None) -> bool:
+    """
+    Return True if *sentence* contains extreme / sensational language.
 
-def contains_extreme_language(sentence: str) -> bool:
-    """Return True if *sentence* contains extreme / sensational language."""
+    *words* are matched as whole words; pass a set for large lists.
+    """
     if not sentence:
         return False
-    sl = sentence.lower()
-    return any(re.search(r"\b" + re.escape(w) + r"\b", sl) for w in _EXTREME_WORDS)
+    if words is None:
+        words = _CLAIM_EXTREME_SET
+    # One tokenisation + membership tests (same \b semantics as per-word regexes)
+    return any(token in words for token in _WORD_TOKEN.findall(sentence.lower()))
 
 
-def contains_evidence_markers(sentence: str) -> bool:
-    """Return True if *sentence* contains evidence-based markers."""
+def contains_evidence_markers(sentence: str, markers: Optional[Collection[str]] = None) -> bool:
+    """Return True if *sentence* contains evidence-based markers (default: built-in list)."""
     if not sentence:
         return False
+    if markers is None:
+        markers = terms.CLAIM_EVIDENCE
     sl = sentence.lower()
-    return any(m in sl for m in _EVIDENCE_MARKERS)
+    return any(m in sl for m in markers)
 
 
-def contains_conspiracy_markers(sentence: str) -> bool:
-    """Return True if *sentence* contains conspiracy-framing language."""
+def contains_conspiracy_markers(sentence: str, markers: Optional[Collection[str]] = None) -> bool:
+    """Return True if *sentence* contains conspiracy-framing language (default: built-in list)."""
     if not sentence:
         return False
+    if markers is None:
+        markers = terms.CLAIM_CONSPIRACY
     sl = sentence.lower()
-    return any(m in sl for m in _CONSPIRACY_MARKERS)
+    return any(m in sl for m in markers)
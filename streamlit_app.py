@@ -4,10 +4,25 @@ ML-Based Credibility Analysis · Streamlit UI
 """
 
 import os
+from concurrent.futures import Future
+from typing import Tuple, Dict, List, Any, Optional
+
 import streamlit as st
-import joblib
-from typing import Tuple, Dict, List, Any
-from credibility_analyzer import CredibilityAnalyzer
+
+from src.analyzer import CachedIncrementalAnalyzer, IncrementalAnalyzer
+from src.models import ModelLoader
+from src.patterns import Lexicon
+from src.storage import ResultStore
+
+# ── deployment settings (environment variables) ────────────────────────────
+# EL_MATADOR_LEXICON        market lexicon file (.json / .toml); default lists if unset
+# EL_MATADOR_LEXICON_CACHE  directory caching the compiled lexicon
+# EL_MATADOR_MATCH_MODE     "substring" (default) or "word"
+# EL_MATADOR_RESULT_STORE   SQLite file keeping results across sessions; off if unset
+LEXICON_PATH = os.environ.get("EL_MATADOR_LEXICON")
+LEXICON_CACHE_DIR = os.environ.get("EL_MATADOR_LEXICON_CACHE")
+MATCH_MODE = os.environ.get("EL_MATADOR_MATCH_MODE", "substring")
+RESULT_STORE_PATH = os.environ.get("EL_MATADOR_RESULT_STORE")
 
 # ── page config (must be first Streamlit call) ─────────────────────────────
 st.set_page_config(
@@ -448,20 +463,54 @@ button[data-testid="stTabsTab"][aria-selected="true"] {
 # ══════════════════════════════════════════════════════════════════════════════
 
 @st.cache_resource
-def load_model():
-    model_dir = os.path.join(os.path.dirname(__file__), "models")
-    mp = os.path.join(model_dir, "best_model.joblib")
-    vp = os.path.join(model_dir, "tfidf_vectorizer.joblib")
-    if not os.path.exists(mp) or not os.path.exists(vp):
-        raise FileNotFoundError(
-            "Model files not found in models/. Run `python train_model.py` first."
-        )
-    return joblib.load(mp), joblib.load(vp)
+def start_model_load() -> Future:
+    """Kick off the artefact load once per server process (non-blocking)."""
+    return ModelLoader().load_async()
+
+
+def wait_for_model(pending: Future) -> Tuple[Any, Any]:
+    """Return (model, vectorizer), showing a spinner only if still loading."""
+    try:
+        if pending.done():
+            return pending.result()
+        with st.spinner("Loading model…"):
+            return pending.result()
+    except Exception:
+        # Drop the failed future so the next session retries the load
+        # instead of re-raising this error until the server restarts
+        start_model_load.clear()
+        raise
 
 
 @st.cache_resource
-def load_analyzer():
-    return CredibilityAnalyzer()
+def analyzer_options() -> Dict[str, Any]:
+    """Analyzer settings from the environment (lexicon file read once per process)."""
+    return {
+        "lexicon": Lexicon.load(LEXICON_PATH) if LEXICON_PATH else None,
+        "lexicon_cache_dir": LEXICON_CACHE_DIR,
+        "match_mode": MATCH_MODE,
+    }
+
+
+@st.cache_resource
+def result_store() -> Optional[ResultStore]:
+    """Result store shared by all sessions, or ``None`` if not configured."""
+    if not RESULT_STORE_PATH:
+        return None
+    # Interactive results are few; write each one at once so a restart loses none
+    return ResultStore(RESULT_STORE_PATH, batch_size=1)
+
+
+def session_analyzer() -> IncrementalAnalyzer:
+    """Per-session analyzer; its caches track this user's successive edits."""
+    if "analyzer" not in st.session_state:
+        store = result_store()
+        if store is None:
+            analyzer = IncrementalAnalyzer(**analyzer_options())
+        else:
+            analyzer = CachedIncrementalAnalyzer(store, memory_entries=64, **analyzer_options())
+        st.session_state.analyzer = analyzer
+    return st.session_state.analyzer
 
 
 EXAMPLES = {
@@ -612,13 +661,19 @@ def plevel(v: float, lo=.35, hi=.65) -> str:
     return "ok"
 
 
-def build_article_html(text: str, suspicious: List[str]) -> str:
+def build_article_html(text: str, spans: List[Tuple[int, int]]) -> str:
+    """Escape *text* and wrap the claim *spans* in one left-to-right pass."""
     import html as hl
-    safe = hl.escape(text)
-    for claim in suspicious:
-        sc = hl.escape(claim.strip())
-        if sc and sc in safe:
-            safe = safe.replace(sc, f'<span class="hl suspicious">{sc}</span>', 1)
+    parts: List[str] = []
+    pos = 0
+    for start, end in sorted(spans):
+        if start < pos:
+            continue
+        parts.append(hl.escape(text[pos:start]))
+        parts.append(f'<span class="hl suspicious">{hl.escape(text[start:end])}</span>')
+        pos = end
+    parts.append(hl.escape(text[pos:]))
+    safe = "".join(parts)
     paras = safe.split("\n\n") if "\n\n" in safe else safe.split("\n")
     return "".join(f"<p>{p.strip()}</p>" for p in paras if p.strip())
 
@@ -763,7 +818,7 @@ def render_results(result: Dict, text: str):
 
     # ── Highlighted Article ───────────────────────────────────────────────
     with t2:
-        body = build_article_html(text, susp)
+        body = build_article_html(text, result.get("suspicious_claim_spans", []))
         st.markdown(f"""<div class="em-article-card">
   <div class="em-legend-row">
     <span class="em-legend-lbl">Legend:</span>
@@ -871,22 +926,28 @@ def main():
     st.markdown('<div class="em-page">', unsafe_allow_html=True)
     render_hero()
 
-    try:
-        with st.spinner("Loading model…"):
-            model, vectorizer = load_model()
-            analyzer = load_analyzer()
-    except FileNotFoundError as e:
-        st.error(f"**Model not found** — {e}")
-        st.info("Run `python train_model.py` to train the model, then restart the app.")
-        st.markdown("</div>", unsafe_allow_html=True)
-        return
+    # Artefacts load on a background thread; the input renders immediately
+    # and we only block (behind a spinner) once an analysis is requested.
+    pending = start_model_load()
+    analyzer = session_analyzer()
 
     text, clicked = render_input()
+    if not pending.done():
+        st.markdown('<div class="em-char">Loading model in the background…</div>',
+                    unsafe_allow_html=True)
 
     if "results" not in st.session_state:
         st.session_state.results = None
 
     if clicked and text.strip():
+        try:
+            model, vectorizer = wait_for_model(pending)
+        except (FileNotFoundError, RuntimeError) as e:
+            st.error(f"**Model not found** — {e}")
+            st.info("Run `python train_model.py` to train the model, then analyze again.")
+            st.markdown("</div>", unsafe_allow_html=True)
+            return
+
         with st.spinner("Analyzing…"):
             try:
                 st.session_state.results = analyzer.analyze(text, model, vectorizer)
@@ -0,0 +1,66 @@
+"""
+Shared fixtures
+===============
+A tiny real TF-IDF + logistic-regression pair, fitted once per module.
+
+Modules that need different settings override ``fitted_pair_options``;
+single tests can parametrise ``fitted_pair`` indirectly with a dict of
+the same options.  ``fit_pair`` builds extra pairs inside a test.
+"""
+
+from typing import Any, Dict
+
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from src.utils import clean_text_for_model
+
+
+CORPUS = [
+    ("Scientists at the university published a peer reviewed study with data.", 1),
+    ("The research team reported results in a journal after a long survey.", 1),
+    ("Officials confirmed the budget report and released the statistics.", 1),
+    ("SHOCKING cover up exposed wake up the deep state hides the truth", 0),
+    ("Sources say a secret agenda is controlled by the mainstream media", 0),
+    ("You won't believe the hidden truth they don't want you to know", 0),
+]
+
+
+def _fit_pair(
+    corpus=CORPUS,
+    C: float = 1.0,
+    ngram_range=(1, 2),
+    stop_words="english",
+    sublinear_tf: bool = True,
+    clean: bool = True,
+):
+    texts = [clean_text_for_model(t) if clean else t for t, _ in corpus]
+    vec = TfidfVectorizer(stop_words=stop_words, ngram_range=ngram_range,
+                          sublinear_tf=sublinear_tf)
+    X = vec.fit_transform(texts)
+    return LogisticRegression(C=C).fit(X, [y for _, y in corpus]), vec
+
+
+@pytest.fixture(scope="session")
+def corpus():
+    """The labelled ``(text, label)`` training corpus (1 = credible)."""
+    return CORPUS
+
+
+@pytest.fixture(scope="session")
+def fit_pair():
+    """Factory: ``fit_pair(**options)`` → ``(model, vectorizer)``."""
+    return _fit_pair
+
+
+@pytest.fixture(scope="module")
+def fitted_pair_options() -> Dict[str, Any]:
+    """Keyword options of ``fitted_pair``; override per module."""
+    return {}
+
+
+@pytest.fixture(scope="module")
+def fitted_pair(request, fitted_pair_options):
+    """``(model, vectorizer)`` fitted on ``CORPUS`` (or the options' corpus)."""
+    return _fit_pair(**{**fitted_pair_options, **getattr(request, "param", {})})
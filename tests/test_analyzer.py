@@ -8,7 +8,12 @@ import pytest
 from unittest.mock import MagicMock
 import numpy as np
 
-from src.analyzer.credibility_analyzer import CredibilityAnalyzer
+from src.analyzer import (
+    AnalysisResult,
+    CredibilityAnalyzer,
+    LazyAnalysisResult,
+    PatternCounts,
+)
 
 
 @pytest.fixture
@@ -251,3 +256,234 @@ class TestFormatJsonOutput:
         result["risk_level"] = "Super Risk"
         with pytest.raises(ValueError):
             analyzer.format_json_output(result)
+
+
+# ── Vectorised scoring ────────────────────────────────────────────────────────
+
+class TestScoreBatch:
+    TEXTS = [CREDIBLE_TEXT, FAKE_TEXT, CREDIBLE_TEXT + " " + FAKE_TEXT, SHORT_TEXT]
+
+    def _inputs(self):
+        from src.patterns import PatternDetector
+        detector = PatternDetector()
+        patterns = [detector.detect_patterns(t) for t in self.TEXTS]
+        conf = np.array([0.95, 0.76, 0.5, 0.3])
+        pred = np.array([1, 0, 1, 0])
+        return detector, patterns, conf, pred
+
+    def test_matches_scalar_helpers(self, analyzer):
+        _, patterns, conf, pred = self._inputs()
+        lengths = np.array([len(t) for t in self.TEXTS])
+        out = analyzer.score_batch(patterns, conf, pred, lengths)
+        for i, p in enumerate(patterns):
+            ps = analyzer.calculate_pattern_score(p)
+            cs = analyzer.calculate_credibility_score(conf[i], pred[i], ps)
+            assert out["pattern_score"][i] == ps
+            assert out["credibility_score"][i] == cs
+            assert out["risk_level"][i] == analyzer.determine_risk_level(cs)
+            assert out["classification"][i] == analyzer.classify_credibility(
+                self.TEXTS[i], pred[i], conf[i], p
+            )
+
+    def test_matches_analyze(self, analyzer):
+        model = _make_model(prediction=1, proba=[0.1, 0.9])
+        result = analyzer.analyze(CREDIBLE_TEXT, model, _make_vectorizer())
+        out = analyzer.score_batch([result["patterns"]], np.array([0.9]), np.array([1]))
+        assert out["confidence"][0] == result["confidence"]
+        assert out["credibility_score"][0] == result["credibility_score"]
+        assert out["classification"][0] == result["classification"]
+
+    def test_accepts_structured_batch_output(self, analyzer):
+        detector, patterns, conf, pred = self._inputs()
+        rows = detector.detect_patterns_batch(self.TEXTS, n_jobs=1)
+        from_dicts = analyzer.score_batch(patterns, conf, pred)
+        from_rows = analyzer.score_batch(rows, conf, pred)
+        for key in from_dicts:
+            assert (from_dicts[key] == from_rows[key]).all()
+
+    def test_model_inference_batch_decision_function(self, analyzer):
+        model = MagicMock()
+        del model.predict_proba
+        model.predict.return_value = np.array([1, 0])
+        model.decision_function.return_value = np.array([2.0, -7.0])
+        pred, conf = analyzer.model_inference_batch(model, None)
+        assert pred.tolist() == [1, 0]
+        assert conf.tolist() == [0.7, 1.0]
+
+
+# ── PatternFeatures ───────────────────────────────────────────────────────────
+
+class TestPatternFeatures:
+    PATTERNS = {
+        "sensational_phrases": 4, "excessive_caps": 0.2,
+        "vague_sources": 3, "conspiracy_framing": 1,
+        "emotional_manipulation": 3, "one_sided": 0.8,
+        "no_evidence": 0.9, "extreme_adjectives": 7, "clickbait": 1,
+    }
+
+    def test_score_matches_dict_path(self, analyzer):
+        features = analyzer.pattern_features(self.PATTERNS)
+        assert features.score == analyzer.calculate_pattern_score(self.PATTERNS)
+        assert analyzer.calculate_pattern_score(features) == features.score
+
+    def test_normalized_values_saturate(self, analyzer):
+        norm = analyzer.pattern_features(self.PATTERNS).normalized_dict()
+        assert norm["extreme_adjectives"] == 1.0
+        assert norm["sensational_phrases"] == pytest.approx(0.8)
+        assert all(0.0 <= v <= 1.0 for v in norm.values())
+
+    def test_behaves_like_raw_dict(self, analyzer):
+        features = analyzer.pattern_features(self.PATTERNS)
+        assert dict(features) == self.PATTERNS
+        assert analyzer.extract_key_indicators(features, "") == \
+            analyzer.extract_key_indicators(self.PATTERNS, "")
+
+    def test_exposed_in_result(self, analyzer):
+        model = _make_model(prediction=0, proba=[0.92, 0.08])
+        result = analyzer.analyze(FAKE_TEXT, model, _make_vectorizer())
+        features = analyzer.pattern_features(result["patterns"])
+        assert result["normalized_patterns"] == features.normalized_dict()
+        assert result["pattern_consistency"] == features.consistency
+        assert result["pattern_score"] == features.score
+
+
+# ── Lazy results and field selection ──────────────────────────────────────────
+
+class TestLazyResult:
+    def test_to_dict_matches_eager(self, analyzer):
+        model = _make_model(prediction=0, proba=[0.92, 0.08])
+        eager = analyzer.analyze(FAKE_TEXT, model, _make_vectorizer())
+        lazy = analyzer.analyze(FAKE_TEXT, model, _make_vectorizer(), lazy=True)
+        assert lazy.to_dict() == eager
+        assert list(lazy.to_dict()) == list(eager)
+
+    def test_narrative_fields_deferred(self, analyzer):
+        model = _make_model(prediction=1, proba=[0.1, 0.9])
+        result = analyzer.analyze(CREDIBLE_TEXT, model, _make_vectorizer(), lazy=True)
+        assert isinstance(result, LazyAnalysisResult)
+        assert result.credibility_score == result["credibility_score"]
+        assert "explanation" not in repr(result)
+        assert result.explanation.startswith("The article received")
+        assert "explanation" in repr(result)
+
+    def test_format_json_output_accepts_to_dict(self, analyzer):
+        model = _make_model(prediction=0, proba=[0.92, 0.08])
+        result = analyzer.analyze(FAKE_TEXT, model, _make_vectorizer(), lazy=True)
+        assert analyzer.format_json_output(result.to_dict())["classification"] == \
+            result.classification
+
+    def test_insufficient_input(self, analyzer):
+        result = analyzer.analyze("short", _make_model(), _make_vectorizer(), lazy=True)
+        assert result.classification == "UNVERIFIED"
+        assert result.to_dict() == analyzer.analyze("short", _make_model(), _make_vectorizer())
+
+    def test_fields_restrict_keys(self, analyzer):
+        model = _make_model(prediction=0, proba=[0.92, 0.08])
+        result = analyzer.analyze(
+            FAKE_TEXT, model, _make_vectorizer(),
+            fields=["credibility_score", "classification"],
+        )
+        eager = analyzer.analyze(FAKE_TEXT, model, _make_vectorizer())
+        assert result == {
+            "classification": eager["classification"],
+            "credibility_score": eager["credibility_score"],
+        }
+
+    def test_fields_skip_model_stage(self, analyzer):
+        model, vectorizer = _make_model(), _make_vectorizer()
+        result = analyzer.analyze(
+            FAKE_TEXT, model, vectorizer, lazy=True,
+            fields=["patterns", "suspicious_claims"],
+        )
+        vectorizer.transform.assert_not_called()
+        model.predict.assert_not_called()
+        assert result["patterns"] == analyzer._pattern_detector.detect_patterns(FAKE_TEXT)
+        assert "classification" not in result
+        with pytest.raises(AttributeError, match="model"):
+            result.classification
+
+    def test_unknown_field_raises(self, analyzer):
+        with pytest.raises(ValueError, match="Unknown result fields"):
+            analyzer.analyze(FAKE_TEXT, _make_model(), _make_vectorizer(), fields=["nope"])
+
+
+# ── Compact records ───────────────────────────────────────────────────────────
+
+class TestRecords:
+    def test_round_trip(self, analyzer):
+        for text, proba in ((FAKE_TEXT, [0.92, 0.08]), (CREDIBLE_TEXT, [0.1, 0.9])):
+            result = analyzer.analyze(text, _make_model(1, proba), _make_vectorizer())
+            record = AnalysisResult.from_dict(result)
+            assert record.to_dict() == result
+            assert list(record.to_dict()) == list(result)
+
+    def test_round_trip_insufficient_input(self, analyzer):
+        result = analyzer.analyze(SHORT_TEXT, _make_model(), _make_vectorizer())
+        record = AnalysisResult.from_dict(result)
+        assert record.patterns is None
+        assert record.to_dict() == result
+
+    def test_from_lazy_result(self, analyzer):
+        model = _make_model(prediction=0, proba=[0.92, 0.08])
+        lazy = analyzer.analyze(FAKE_TEXT, model, _make_vectorizer(), lazy=True)
+        assert AnalysisResult.from_dict(lazy).to_dict() == lazy.to_dict()
+
+    def test_no_instance_dict(self, analyzer):
+        result = analyzer.analyze(FAKE_TEXT, _make_model(0, [0.9, 0.1]), _make_vectorizer())
+        record = AnalysisResult.from_dict(result)
+        assert not hasattr(record, "__dict__")
+        assert not hasattr(record.patterns, "__dict__")
+
+    def test_pattern_counts_is_a_pattern_mapping(self, analyzer):
+        patterns = analyzer._pattern_detector.detect_patterns(FAKE_TEXT)
+        counts = PatternCounts.from_dict(patterns)
+        assert counts == patterns
+        assert counts.vague_sources == patterns["vague_sources"]
+        assert analyzer.calculate_pattern_score(counts) == \
+            analyzer.calculate_pattern_score(patterns)
+        with pytest.raises(KeyError):
+            counts["missing"]
+
+
+# ── Term attribution ──────────────────────────────────────────────────────────
+
+class TestTermAttributions:
+    def test_matches_dense_product(self, analyzer, fitted_pair):
+        model, vec = fitted_pair
+        row = vec.transform(["the deep state cover up shocked the research team"])
+        terms = analyzer.term_attributions(row, model, vec, k=3)
+
+        dense = row.toarray()[0] * model.coef_[0]
+        names = dict(zip(vec.get_feature_names_out(), dense))
+        expected = [round(v, 4) for v in np.sort(dense)[:3]]
+        assert [w for _, w in terms["suspicious"]] == expected
+        assert all(round(names[t], 4) == w for t, w in terms["suspicious"])
+        assert all(w < 0 for _, w in terms["suspicious"])
+        assert all(w > 0 for _, w in terms["credible"])
+        assert len(terms["credible"]) <= 3
+
+    def test_batch_matches_single(self, analyzer, fitted_pair):
+        model, vec = fitted_pair
+        X = vec.transform(["deep state study", "journal data", "nothing relevant"])
+        batch = analyzer.term_attributions_batch(X, model, vec)
+        assert batch == [analyzer.term_attributions(X[i], model, vec) for i in range(3)]
+        assert batch[2] == {"credible": [], "suspicious": []}
+
+    def test_non_linear_model_gives_empty(self, analyzer):
+        terms = analyzer.term_attributions(MagicMock(), _make_model(), _make_vectorizer())
+        assert terms == {"credible": [], "suspicious": []}
+
+    def test_in_result_and_explanation(self, analyzer, fitted_pair):
+        model, vec = fitted_pair
+        result = analyzer.analyze(FAKE_TEXT, model, vec)
+        assert result["top_terms"]["suspicious"]
+        assert "driven most by the terms" in result["explanation"]
+
+    def test_ml_claims_option(self, fitted_pair):
+        model, vec = fitted_pair
+        text = FAKE_TEXT + " The hidden truth they hide from you."
+        eager = CredibilityAnalyzer(ml_claims=True).analyze(text, model, vec)
+        lazy = CredibilityAnalyzer(ml_claims=True).analyze(text, model, vec, lazy=True)
+        assert lazy.to_dict() == eager
+        assert eager["suspicious_claims"] == CredibilityAnalyzer()._claim_highlighter \
+            .identify_suspicious_claims(text, model=model, vectorizer=vec)
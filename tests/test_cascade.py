@@ -0,0 +1,246 @@
+"""
+Unit tests for src.analyzer.CascadeAnalyzer
+============================================
+Checks the first-tier score against the model, routing and metrics,
+that escalated articles get exactly the full-pipeline result, and that a
+calibrated cascade over the shipped model uses every route.
+"""
+
+import math
+import random
+import warnings
+
+import numpy as np
+import pytest
+from sklearn.tree import DecisionTreeClassifier
+
+from src.analyzer import CascadeAnalyzer, CredibilityAnalyzer, LazyAnalysisResult
+from src.analyzer.lazy_result import RESULT_FIELDS
+from src.models import ModelLoader
+from src.utils import clean_text_for_model
+
+pytestmark = pytest.mark.filterwarnings("ignore:CascadeAnalyzer is not calibrated")
+
+
+ARTICLES = [
+    "Scientists at Stanford University published a study in a journal. "
+    "The research data was analysed by professors over six months.",
+    "Sources say the deep state is covering up the false flag operation! "
+    "SHOCKING: mainstream media will never report the hidden truth.",
+    "Officials confirmed the budget report on Monday and released statistics "
+    "from the survey, according to the research team.",
+    "Wake up! They don't want you to know the secret agenda behind the cover up "
+    "that the mainstream media hides.",
+]
+
+
+@pytest.fixture(scope="module")
+def fitted_pair_options():
+    return {"C": 10.0}
+
+
+@pytest.fixture(scope="module")
+def unigram(fit_pair):
+    return fit_pair(C=10.0, ngram_range=(1, 1))
+
+
+class TestFirstTierScore:
+    def test_matches_model_margin_on_unigrams(self, unigram):
+        model, vec = unigram
+        cascade = CascadeAnalyzer(vocabulary_size=len(vec.vocabulary_))
+        scorer = cascade._scorer_for_pair(model, vec)
+        cleaned = [clean_text_for_model(t) for t in ARTICLES]
+        expected = model.decision_function(vec.transform(cleaned))
+        got = [scorer.raw_margin(c)[0] for c in cleaned]
+        assert np.allclose(got, expected)
+
+    def test_vocabulary_is_pruned(self, fitted_pair):
+        model, vec = fitted_pair
+        scorer = CascadeAnalyzer(vocabulary_size=5)._scorer_for_pair(model, vec)
+        assert len(scorer._weights) == 5
+        assert all(" " not in term for term in scorer._weights)
+
+    def test_non_linear_model_escalates(self, fitted_pair, corpus):
+        _, vec = fitted_pair
+        X = vec.transform([clean_text_for_model(t) for t, _ in corpus])
+        tree = DecisionTreeClassifier().fit(X, [y for _, y in corpus])
+        cascade = CascadeAnalyzer(margin_tolerance=0.0)
+        for text in ARTICLES:
+            assert cascade.screen(text, tree, vec).route == "escalate"
+            assert cascade.analyze(text, tree, vec) == CredibilityAnalyzer().analyze(text, tree, vec)
+
+
+class TestRouting:
+    def test_escalated_matches_full_analysis(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer(margin_tolerance=math.inf)
+        full = CredibilityAnalyzer()
+        for text in ARTICLES:
+            assert cascade.analyze(text, model, vec) == full.analyze(text, model, vec)
+        assert cascade.metrics.escalated == len(ARTICLES)
+        assert cascade.metrics.first_tier_share == 0.0
+
+    def test_first_tier_result_shape(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer(margin_tolerance=0.0)
+        result = cascade.analyze(ARTICLES[0], model, vec)
+        assert list(result) == list(RESULT_FIELDS)
+        assert result["classification"] == "REAL"
+        assert cascade.format_json_output(result)
+        assert cascade.metrics.clean == 1
+
+    def test_routes_by_label(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer(margin_tolerance=0.0)
+        for text in ARTICLES:
+            decision = cascade.screen(text, model, vec)
+            expected = {"REAL": "clean", "UNVERIFIED": "escalate"}.get(
+                decision.classification, "suspicious"
+            )
+            assert decision.route == expected
+        routes = [cascade.screen(text, model, vec).route for text in ARTICLES]
+        assert routes == ["clean", "suspicious", "clean", "suspicious"]
+
+    def test_label_change_within_tolerance_escalates(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer(margin_tolerance=0.0)
+        decision = cascade.screen(ARTICLES[0], model, vec)
+        margin = cascade._scorer_for_pair(model, vec).margin(clean_text_for_model(ARTICLES[0]))[0]
+        # Far enough past the decision boundary for a confident "fake" prediction
+        cascade.margin_tolerance = abs(margin) + 2.0
+        assert decision.route == "clean"
+        assert cascade.screen(ARTICLES[0], model, vec).route == "escalate"
+        assert cascade.screen(ARTICLES[0], model, vec).classification == decision.classification
+
+    def test_metrics_add_up(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer(margin_tolerance=0.5)
+        for text in ARTICLES:
+            cascade.analyze(text, model, vec)
+        m = cascade.metrics
+        assert m.screened == len(ARTICLES) == m.clean + m.suspicious + m.escalated
+        assert m.to_dict()["first_tier_share"] == pytest.approx(
+            (m.clean + m.suspicious) / m.screened
+        )
+
+    def test_lazy_result(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer(margin_tolerance=0.0)
+        result = cascade.analyze(ARTICLES[1], model, vec, lazy=True)
+        assert isinstance(result, LazyAnalysisResult)
+        assert result.to_dict() == cascade.analyze(ARTICLES[1], model, vec)
+
+    @pytest.mark.parametrize("tolerance", [0.0, math.inf])
+    def test_fields_forwarded(self, fitted_pair, tolerance):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer(margin_tolerance=tolerance)
+        fields = ["classification", "credibility_score"]
+        result = cascade.analyze(ARTICLES[1], model, vec, fields=fields)
+        complete = cascade.analyze(ARTICLES[1], model, vec)
+        assert list(result) == fields
+        assert result == {k: complete[k] for k in fields}
+        assert cascade.metrics.screened == 2
+
+    def test_fields_without_model_skip_tier(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer()
+        result = cascade.analyze(ARTICLES[1], model, vec, fields=["patterns"])
+        assert result == CredibilityAnalyzer().analyze(ARTICLES[1], model, vec, fields=["patterns"])
+        assert cascade.metrics.screened == 0
+
+    def test_profile_forwarded(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer(margin_tolerance=0.0)
+        result = cascade.analyze(ARTICLES[0], model, vec, profile=True)
+        assert result["profile"].total_seconds >= 0.0
+        assert result["classification"] == "REAL"
+        assert cascade.metrics.clean == 1
+        with pytest.raises(ValueError):
+            cascade.analyze(ARTICLES[0], model, vec, lazy=True, profile=True)
+
+    def test_short_text_not_screened(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer()
+        assert cascade.analyze("Too short.", model, vec)["classification"] == "UNVERIFIED"
+        assert cascade.metrics.screened == 0
+
+    def test_verification_measures_agreement(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer(margin_tolerance=0.0, verify_rate=1.0)
+        for text in ARTICLES:
+            cascade.analyze(text, model, vec)
+        m = cascade.metrics
+        assert m.verified == len(ARTICLES)
+        assert 0.0 <= m.agreement <= 1.0
+        assert m.mean_score_error >= 0.0
+
+    @pytest.mark.parametrize("kwargs", [
+        {"margin_tolerance": -0.1},
+        {"verify_rate": 1.5},
+    ])
+    def test_invalid_configuration(self, kwargs):
+        with pytest.raises(ValueError):
+            CascadeAnalyzer(**kwargs)
+
+
+class TestCalibrate:
+    def test_sets_tolerance_that_meets_target(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer()
+        report = cascade.calibrate(ARTICLES * 3, model, vec, target_agreement=0.9)
+        assert cascade.margin_tolerance == report["margin_tolerance"] >= 0.0
+        assert report["first_tier_share"] == pytest.approx(
+            report["clean_share"] + report["suspicious_share"]
+        )
+        if report["agreement"] is not None:
+            assert report["agreement"] >= 0.9
+
+    def test_warns_until_calibrated(self, fitted_pair):
+        model, vec = fitted_pair
+        cascade = CascadeAnalyzer()
+        with pytest.warns(RuntimeWarning, match="calibrate"):
+            cascade.analyze(ARTICLES[0], model, vec)
+        cascade.calibrate(ARTICLES, model, vec)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            cascade.analyze(ARTICLES[0], model, vec)
+
+    def test_rejects_non_linear_model(self, fitted_pair, corpus):
+        _, vec = fitted_pair
+        X = vec.transform([clean_text_for_model(t) for t, _ in corpus])
+        tree = DecisionTreeClassifier().fit(X, [y for _, y in corpus])
+        with pytest.raises(ValueError):
+            CascadeAnalyzer().calibrate(ARTICLES, tree, vec)
+
+
+def _stream(corpus, n, seed):
+    """Wire copy, suspicious articles and a share mixing both."""
+    wire = [t for t, label in corpus if label == 1] + [ARTICLES[0], ARTICLES[2]]
+    suspicious = [t for t, label in corpus if label == 0] + [ARTICLES[1], ARTICLES[3]]
+    rng = random.Random(seed)
+    articles = []
+    for i in range(n):
+        pools = [(wire, 3), (suspicious, 3), (wire, 2)][i % 3]
+        sentences = rng.sample(pools[0], pools[1])
+        if i % 3 == 2:
+            sentences += rng.sample(suspicious, 1)
+        articles.append(" ".join(sentences))
+    return articles
+
+
+@pytest.fixture(scope="module")
+def shipped():
+    try:
+        return ModelLoader().load()
+    except FileNotFoundError:
+        pytest.skip("No trained artefacts in models/")
+
+
+class TestShippedModel:
+    def test_calibrated_cascade_uses_every_route(self, shipped, corpus):
+        model, vec = shipped
+        cascade = CascadeAnalyzer()
+        report = cascade.calibrate(_stream(corpus, 150, seed=0), model, vec)
+        assert report["clean_share"] > 0 and report["suspicious_share"] > 0
+        routes = {cascade.screen(text, model, vec).route for text in _stream(corpus, 300, seed=1)}
+        assert routes == {"clean", "suspicious", "escalate"}
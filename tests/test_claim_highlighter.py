@@ -60,3 +60,104 @@ class TestClaimHighlighterBasic:
         result = highlighter.identify_suspicious_claims(text)
         for claim in result:
             assert claim == claim.strip()
+
+
+class TestClaimSpans:
+    def test_spans_match_claims(self, highlighter):
+        text = (
+            "A normal sentence about weather. "
+            "Sources say the deep state is covering up the false flag operation."
+        )
+        spans = highlighter.identify_suspicious_claim_spans(text)
+        claims = highlighter.identify_suspicious_claims(text)
+        assert [text[s:e] for s, e in spans] == claims
+
+    def test_repeated_claims_anchor_each_occurrence(self, highlighter):
+        text = "Sources say the deep state cover-up is real! " * 3
+        spans = highlighter.identify_suspicious_claim_spans(text)
+        assert len(spans) == 3
+        assert len({s for s, _ in spans}) == 3
+
+    def test_abbreviation_keeps_sentence_whole(self, highlighter):
+        # "Dr." no longer splits the sentence, and counts as an evidence marker
+        text = "Insiders say Dr. Chen is part of the cover-up, and it is totally hidden."
+        assert highlighter.identify_suspicious_claims(text) == [text]
+        assert highlighter.score_sentence(text) == 5
+
+    def test_score_cache_is_populated(self, highlighter):
+        cache = {}
+        text = "Sources say the cover-up is massive and absolutely shocking."
+        first = highlighter.identify_suspicious_claims(text, score_cache=cache)
+        assert cache
+        assert highlighter.identify_suspicious_claims(text, score_cache=cache) == first
+
+
+# ── Model-assisted ranking ────────────────────────────────────────────────────
+
+# Sentence-sized corpus: "elites ... control everything" is only learnable here
+@pytest.fixture(scope="module")
+def fitted_pair_options():
+    corpus = [
+        ("scientists published a peer reviewed study with data", 1),
+        ("the research team reported results in a journal", 1),
+        ("officials confirmed the budget report", 1),
+        ("shocking cover up exposed by the deep state", 0),
+        ("wake up the hidden truth they hide from you", 0),
+        ("the elites control everything and hide the truth", 0),
+    ]
+    return {"corpus": corpus, "C": 10.0, "ngram_range": (1, 1), "stop_words": None,
+            "sublinear_tf": False, "clean": False}
+
+
+ARTICLE = (
+    "Scientists published a peer reviewed study with data in a journal. "
+    "The elites hide the truth and control everything. "
+    "Officials confirmed the budget report on Monday."
+)
+
+
+class TestModelAssistedClaims:
+    def test_one_transform_per_article(self, highlighter, fitted_pair):
+        from unittest.mock import patch
+
+        model, vec = fitted_pair
+        with patch.object(vec, "transform", wraps=vec.transform) as spy:
+            highlighter.identify_suspicious_claim_spans(ARTICLE, model=model, vectorizer=vec)
+        assert spy.call_count == 1
+        assert len(spy.call_args[0][0]) == 3
+
+    def test_suspicion_matches_predict_proba(self, highlighter, fitted_pair):
+        import numpy as np
+
+        model, vec = fitted_pair
+        sentences = ["The elites hide the truth.", "Officials confirmed the report."]
+        got = highlighter.sentence_model_suspicion(sentences, model, vec)
+        expected = model.predict_proba(vec.transform([s.lower().rstrip(".") for s in sentences]))[:, 0]
+        assert np.allclose(got, expected)
+
+    def test_suspicion_stable_at_large_margins(self, highlighter, fitted_pair):
+        import warnings
+
+        import numpy as np
+
+        model, vec = fitted_pair
+        big = type("Big", (), {"coef_": model.coef_ * 1e4, "intercept_": model.intercept_})()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            got = highlighter.sentence_model_suspicion(
+                ["The elites hide the truth.", "Officials confirmed the report."], big, vec
+            )
+        assert np.allclose(got, [1.0, 0.0])
+
+    def test_model_flags_sentence_heuristics_miss(self, highlighter, fitted_pair):
+        model, vec = fitted_pair
+        assert highlighter.identify_suspicious_claims(ARTICLE) == []
+        claims = highlighter.identify_suspicious_claims(ARTICLE, model=model, vectorizer=vec)
+        assert claims == ["The elites hide the truth and control everything"]
+
+    def test_spans_in_document_order_and_capped(self, highlighter, fitted_pair):
+        model, vec = fitted_pair
+        text = "The elites hide the truth. Sources say the deep state cover-up is real! " * 6
+        spans = highlighter.identify_suspicious_claim_spans(text, model=model, vectorizer=vec)
+        assert len(spans) == 5
+        assert spans == sorted(spans)
@@ -0,0 +1,83 @@
+"""
+Unit tests for src.analyzer.IncrementalAnalyzer
+================================================
+Checks that memoised re-analysis matches a full CredibilityAnalyzer run
+after a sequence of edits, using a tiny real TF-IDF + linear model.
+"""
+
+from src.analyzer import CredibilityAnalyzer, IncrementalAnalyzer
+from src.patterns import Lexicon
+from src.utils import clean_text_for_model
+
+
+ARTICLE = (
+    "Scientists at Stanford University published a study in a journal.\n"
+    "Sources say the deep state is covering up the false flag operation!\n"
+    "\n"
+    "The research data was analysed by professors over six months.\n"
+    "SHOCKING: mainstream media will never report the hidden truth."
+)
+
+
+def _edits(text):
+    lines = text.split("\n")
+    yield text
+    yield "\n".join(lines + ["Wake up, the cover-up is real and totally shocking."])
+    yield "\n".join(lines[:1] + lines[2:])
+    yield "\n".join([lines[0] + " Published data survey report."] + lines[1:])
+    yield "\n".join(lines + lines)
+
+
+class TestIncrementalMatchesFull:
+    def test_results_match_after_edits(self, fitted_pair):
+        model, vec = fitted_pair
+        full, inc = CredibilityAnalyzer(), IncrementalAnalyzer()
+        for text in _edits(ARTICLE):
+            assert inc.analyze(text, model, vec) == full.analyze(text, model, vec)
+
+    def test_features_match_transform(self, fitted_pair):
+        model, vec = fitted_pair
+        inc = IncrementalAnalyzer()
+        for text in _edits(ARTICLE):
+            inc.analyze(text, model, vec)
+            expected = vec.transform([clean_text_for_model(text)])
+            got = inc._features_from_counts(text.split("\n"))
+            assert abs(expected - got).max() < 1e-12
+
+    def test_small_cache_still_exact(self, fitted_pair):
+        model, vec = fitted_pair
+        full, inc = CredibilityAnalyzer(), IncrementalAnalyzer(max_cached_segments=2)
+        for text in _edits(ARTICLE):
+            assert inc.analyze(text, model, vec) == full.analyze(text, model, vec)
+
+    def test_short_text_unverified(self, fitted_pair):
+        model, vec = fitted_pair
+        result = IncrementalAnalyzer().analyze("Too short.", model, vec)
+        assert result["classification"] == "UNVERIFIED"
+
+    def test_model_ranked_claims_match(self, fitted_pair):
+        model, vec = fitted_pair
+        full = CredibilityAnalyzer(ml_claims=True)
+        inc = IncrementalAnalyzer(ml_claims=True)
+        for text in _edits(ARTICLE):
+            assert inc.analyze(text, model, vec) == full.analyze(text, model, vec)
+
+    def test_analyzer_options_forwarded(self, fitted_pair):
+        model, vec = fitted_pair
+        lexicon = Lexicon.from_dict({"extend": {"conspiracy_framing": ["professors"]}})
+        options = dict(lexicon=lexicon, match_mode="word")
+        full, inc = CredibilityAnalyzer(**options), IncrementalAnalyzer(**options)
+        assert inc._pattern_detector.match_mode == "word"
+        assert inc._claim_highlighter.lexicon is lexicon
+        for text in _edits(ARTICLE):
+            assert inc.analyze(text, model, vec) == full.analyze(text, model, vec)
+
+    def test_fields_and_lazy_use_plain_pipeline(self, fitted_pair):
+        model, vec = fitted_pair
+        full, inc = CredibilityAnalyzer(), IncrementalAnalyzer()
+        fields = ["classification", "patterns"]
+        assert inc.analyze(ARTICLE, model, vec, fields=fields) == \
+            full.analyze(ARTICLE, model, vec, fields=fields)
+        assert inc.analyze(ARTICLE, model, vec, lazy=True).to_dict() == \
+            full.analyze(ARTICLE, model, vec)
+        assert not inc._doc_lines
@@ -0,0 +1,195 @@
+"""
+Unit tests for src.patterns.Lexicon
+=====================================
+Covers JSON/TOML loading, content hashing, the compiled-matcher disk cache
+and PatternDetector / ClaimHighlighter integration.
+"""
+
+import json
+import os
+import pickle
+
+import pytest
+
+from src.analyzer import CredibilityAnalyzer
+from src.patterns import ClaimHighlighter, Lexicon, PatternDetector
+from src.patterns.lexicon import CLAIM_FAMILIES, LEXICON_FAMILIES
+from src.patterns.matcher import KeywordMatcher
+
+CACHE_SUFFIX = f"-v{KeywordMatcher.CACHE_VERSION}.json"
+
+SAMPLE_TEXT = (
+    "SHOCKING: sources say the chemtrails cover-up is real. "
+    "You won't believe what they found. Gobsmacked readers react."
+)
+
+
+@pytest.fixture
+def lexicon_files(tmp_path):
+    data = {
+        "name": "en-GB",
+        "families": {"clickbait": ["gobsmacked"]},
+        "extend": {"conspiracy_framing": ["chemtrails"]},
+    }
+    json_path = tmp_path / "en-GB.json"
+    json_path.write_text(json.dumps(data), encoding="utf-8")
+    toml_path = tmp_path / "en-GB.toml"
+    toml_path.write_text(
+        'name = "en-GB"\n'
+        "[families]\n"
+        'clickbait = ["gobsmacked"]\n'
+        "[extend]\n"
+        'conspiracy_framing = ["chemtrails"]\n',
+        encoding="utf-8",
+    )
+    return json_path, toml_path
+
+
+class TestLexiconLoading:
+    def test_json_and_toml_agree(self, lexicon_files):
+        json_path, toml_path = lexicon_files
+        from_json = Lexicon.load(str(json_path))
+        from_toml = Lexicon.load(str(toml_path))
+        assert from_json.name == "en-GB"
+        assert from_json.content_hash == from_toml.content_hash
+
+    def test_families_replace_and_extend(self, lexicon_files):
+        lexicon = Lexicon.load(str(lexicon_files[0]))
+        default = PatternDetector.default_lexicon()
+        assert lexicon.families["clickbait"] == ("gobsmacked",)
+        assert "chemtrails" in lexicon.families["conspiracy_framing"]
+        assert set(default.families["conspiracy_framing"]) < set(
+            lexicon.families["conspiracy_framing"]
+        )
+        assert lexicon.families["evidence"] == default.families["evidence"]
+
+    def test_unknown_family_rejected(self):
+        with pytest.raises(ValueError, match="Unknown lexicon families"):
+            Lexicon.from_dict({"extend": {"rumours": ["allegedly"]}})
+
+    def test_missing_family_rejected(self):
+        with pytest.raises(ValueError, match="missing"):
+            Lexicon({"clickbait": ["gobsmacked"]})
+
+    def test_unsupported_extension(self, tmp_path):
+        path = tmp_path / "lexicon.yaml"
+        path.write_text("{}", encoding="utf-8")
+        with pytest.raises(ValueError, match="Unsupported"):
+            Lexicon.load(str(path))
+
+
+class TestLexiconHash:
+    def test_hash_ignores_order_case_and_duplicates(self):
+        families = LEXICON_FAMILIES + CLAIM_FAMILIES
+        base = {f: ["alpha", "beta"] for f in families}
+        shuffled = {f: [" BETA", "Alpha", "beta"] for f in families}
+        assert Lexicon(base).content_hash == Lexicon(shuffled).content_hash
+
+    def test_hash_changes_with_terms(self):
+        default = PatternDetector.default_lexicon()
+        extended = Lexicon.from_dict({"extend": {"clickbait": ["gobsmacked"]}})
+        assert default.content_hash != extended.content_hash
+
+    def test_name_not_hashed(self):
+        a = Lexicon.from_dict({"name": "a"})
+        b = Lexicon.from_dict({"name": "b"})
+        assert a.content_hash == b.content_hash
+
+    def test_round_trip(self, lexicon_files):
+        lexicon = Lexicon.load(str(lexicon_files[0]))
+        again = Lexicon(lexicon.to_dict()["families"], name=lexicon.name)
+        assert again.content_hash == lexicon.content_hash
+
+
+class TestLexiconCache:
+    def test_cache_file_written_and_reused(self, tmp_path, lexicon_files):
+        lexicon = Lexicon.load(str(lexicon_files[0]))
+        cache_dir = tmp_path / "cache"
+        first = lexicon.compile(str(cache_dir))
+        files = os.listdir(cache_dir)
+        assert files == [f"lexicon-{lexicon.content_hash}-substring{CACHE_SUFFIX}"]
+
+        mtime = os.path.getmtime(cache_dir / files[0])
+        second = lexicon.compile(str(cache_dir))
+        assert os.path.getmtime(cache_dir / files[0]) == mtime
+        assert second.count(SAMPLE_TEXT.lower()) == first.count(SAMPLE_TEXT.lower())
+
+    def test_corrupt_cache_rebuilt(self, tmp_path, lexicon_files):
+        lexicon = Lexicon.load(str(lexicon_files[0]))
+        path = tmp_path / f"lexicon-{lexicon.content_hash}-substring{CACHE_SUFFIX}"
+        path.write_bytes(b"not json")
+        matcher = lexicon.compile(str(tmp_path))
+        assert matcher.count("gobsmacked")[LEXICON_FAMILIES.index("clickbait")] == 1
+
+    def test_pickle_in_cache_never_loaded(self, tmp_path, lexicon_files):
+        lexicon = Lexicon.load(str(lexicon_files[0]))
+        path = tmp_path / f"lexicon-{lexicon.content_hash}-substring{CACHE_SUFFIX}"
+        path.write_bytes(pickle.dumps(KeywordMatcher([["planted"]] * len(LEXICON_FAMILIES))))
+        matcher = lexicon.compile(str(tmp_path))
+        assert matcher.count("planted gobsmacked") == lexicon.compile().count("planted gobsmacked")
+
+    def test_out_of_range_state_rebuilt(self, tmp_path, lexicon_files):
+        lexicon = Lexicon.load(str(lexicon_files[0]))
+        data = KeywordMatcher([["gobsmacked", "chemtrails"]], engine="automaton").to_data()
+        data["automaton"]["fail"][1] = 10**6
+        with pytest.raises(ValueError):
+            KeywordMatcher.from_data(data)
+        path = tmp_path / f"lexicon-{lexicon.content_hash}-substring{CACHE_SUFFIX}"
+        path.write_text(json.dumps(data), encoding="utf-8")
+        assert lexicon.compile(str(tmp_path)).n_families == len(LEXICON_FAMILIES)
+
+    def test_automaton_round_trip(self):
+        families = [["wake up", "cover-up", "up"], ["cover", "over"]]
+        matcher = KeywordMatcher(families, engine="automaton")
+        again = KeywordMatcher.from_data(json.loads(json.dumps(matcher.to_data())))
+        text = "cover-up? wake up, look over the cover"
+        assert again.engine == "automaton"
+        assert again.find(text) == matcher.find(text)
+
+
+class TestDetectorWithLexicon:
+    def test_default_lexicon_matches_builtin_lists(self):
+        builtin = PatternDetector()
+        explicit = PatternDetector(lexicon=PatternDetector.default_lexicon())
+        assert explicit.detect_patterns(SAMPLE_TEXT) == builtin.detect_patterns(SAMPLE_TEXT)
+        assert explicit.lexicon_hash == builtin.lexicon_hash
+
+    def test_custom_lexicon_changes_counts(self, lexicon_files, tmp_path):
+        lexicon = Lexicon.load(str(lexicon_files[0]))
+        builtin = PatternDetector().detect_patterns(SAMPLE_TEXT)
+        custom = PatternDetector(lexicon=lexicon, cache_dir=str(tmp_path)).detect_patterns(
+            SAMPLE_TEXT
+        )
+        assert custom["conspiracy_framing"] > builtin["conspiracy_framing"]
+        assert custom["clickbait"] == 1
+
+    def test_batch_uses_lexicon(self, lexicon_files):
+        detector = PatternDetector(lexicon=Lexicon.load(str(lexicon_files[0])))
+        rows = detector.detect_patterns_batch([SAMPLE_TEXT, "plain text here"])
+        assert rows[0]["clickbait"] == detector.detect_patterns(SAMPLE_TEXT)["clickbait"]
+
+
+class TestClaimHighlighterWithLexicon:
+    CLAIM = "Chemtrails are spraying the whole country, wake up."
+
+    def test_default_lexicon_matches_builtin_lists(self):
+        builtin = ClaimHighlighter()
+        explicit = ClaimHighlighter(PatternDetector.default_lexicon())
+        for sentence in (self.CLAIM, SAMPLE_TEXT, "A university study published data."):
+            assert explicit.score_sentence(sentence) == builtin.score_sentence(sentence)
+
+    def test_claim_families_change_scores(self):
+        lexicon = Lexicon.from_dict({
+            "families": {"claim_conspiracy": ["chemtrails"], "claim_extreme": ["whole"]},
+        })
+        # Built-in: "wake up" (+2) and no evidence (+1)
+        assert ClaimHighlighter().score_sentence(self.CLAIM) == 3
+        # Market lists: "chemtrails" (+2), "whole" (+1), no evidence (+1)
+        assert ClaimHighlighter(lexicon).score_sentence(self.CLAIM) == 4
+        assert lexicon.content_hash != PatternDetector.default_lexicon().content_hash
+
+    def test_analyzer_passes_lexicon_to_highlighter(self):
+        lexicon = Lexicon.from_dict({"families": {"claim_evidence": ["chemtrails"]}})
+        analyzer = CredibilityAnalyzer(lexicon=lexicon)
+        assert analyzer._claim_highlighter.lexicon is lexicon
+        assert analyzer._claim_highlighter.score_sentence(self.CLAIM) == 2
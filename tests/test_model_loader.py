@@ -0,0 +1,51 @@
+"""
+Unit tests for src.models.ModelLoader
+======================================
+Checks that the background load resolves to the cached artefacts and
+surfaces load errors through the future.
+"""
+
+import joblib
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from src.models import ModelLoader
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    vec = TfidfVectorizer()
+    X = vec.fit_transform(["credible study data", "shocking hidden truth"])
+    joblib.dump(LogisticRegression().fit(X, [1, 0]), tmp_path / "best_model.joblib")
+    joblib.dump(vec, tmp_path / "tfidf_vectorizer.joblib")
+    return str(tmp_path)
+
+
+class TestLoadAsync:
+    def test_resolves_to_cached_load(self, model_dir):
+        loader = ModelLoader(model_dir)
+        model, vectorizer = loader.load_async().result(timeout=30)
+        cached = loader.load()
+        assert model is cached[0] and vectorizer is cached[1]
+        assert ModelLoader(model_dir).load_async().result(timeout=30)[0] is model
+
+    def test_missing_artefacts_raise_from_result(self, tmp_path):
+        future = ModelLoader(str(tmp_path)).load_async()
+        with pytest.raises(FileNotFoundError):
+            future.result(timeout=30)
+
+    def test_corrupt_artefact_raises_runtime_error(self, model_dir, tmp_path):
+        (tmp_path / "best_model.joblib").write_bytes(b"not a joblib file")
+        with pytest.raises(RuntimeError):
+            ModelLoader(model_dir).load_async().result(timeout=30)
+
+    def test_failed_load_is_retried(self, tmp_path):
+        loader = ModelLoader(str(tmp_path))
+        with pytest.raises(FileNotFoundError):
+            loader.load_async().result(timeout=30)
+        vec = TfidfVectorizer()
+        X = vec.fit_transform(["credible study data", "shocking hidden truth"])
+        joblib.dump(LogisticRegression().fit(X, [1, 0]), tmp_path / "best_model.joblib")
+        joblib.dump(vec, tmp_path / "tfidf_vectorizer.joblib")
+        assert loader.load_async().result(timeout=30)[1].vocabulary_
@@ -0,0 +1,125 @@
+"""
+Unit tests for src.analyzer.near_duplicates
+============================================
+MinHash-LSH lookup of syndicated copies and the analyzer that reuses or
+flags their results.
+"""
+
+import random
+import string
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.analyzer import NearDuplicateAnalyzer, NearDuplicateIndex
+from src.patterns import Lexicon
+
+_rng = random.Random(0)
+BODY = " ".join(
+    "".join(_rng.choice(string.ascii_lowercase) for _ in range(6)) for _ in range(300)
+) + ". SHOCKING: sources say the deep state is covering up the truth! Wake up."
+
+WIRE_A = "By Jane Doe, Reuters. " + BODY + " Copyright Reuters."
+WIRE_B = "AP WASHINGTON -- " + BODY + " Subscribe to our newsletter."
+OTHER = (
+    "Scientists at Stanford University have published a peer-reviewed study "
+    "showing 89% efficacy in clinical trials. Dr. Jane Smith confirmed the data."
+)
+
+
+def _model():
+    model = MagicMock()
+    model.predict.return_value = np.array([0])
+    model.predict_proba.return_value = np.array([[0.9, 0.1]])
+    return model
+
+
+class TestNearDuplicateIndex:
+    def test_finds_syndicated_copy(self):
+        index = NearDuplicateIndex(threshold=0.85)
+        index.add(index.signature(WIRE_A), "result-a", key="a")
+        key, value, similarity = index.query(index.signature(WIRE_B))
+        assert (key, value) == ("a", "result-a")
+        assert similarity >= 0.85
+
+    def test_ignores_unrelated_text(self):
+        index = NearDuplicateIndex(threshold=0.85)
+        index.add(index.signature(WIRE_A), "result-a", key="a")
+        assert index.query(index.signature(OTHER)) is None
+
+    def test_signature_ignores_case_and_punctuation(self):
+        index = NearDuplicateIndex()
+        assert (index.signature(OTHER) == index.signature(OTHER.upper() + "!!!")).all()
+        assert index.signature("123 !!!") is None
+
+    def test_memory_is_bounded(self):
+        index = NearDuplicateIndex(max_entries=2)
+        for key, text in (("a", WIRE_A), ("other", OTHER), ("b", WIRE_B + " extra words")):
+            index.add(index.signature(text), key, key=key)
+        assert len(index) == 2
+        assert "a" not in index
+        assert sum(len(keys) for bucket in index._buckets for keys in bucket.values()) \
+            == 2 * index.bands
+
+    def test_invalid_threshold(self):
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(threshold=0.0)
+
+
+class TestNearDuplicateAnalyzer:
+    def test_reuses_earlier_result(self):
+        dedup, model, vec = NearDuplicateAnalyzer(threshold=0.85), _model(), MagicMock()
+        first = dedup.analyze(WIRE_A, model, vec, doc_id="a")
+        assert first["near_duplicate_of"] is None
+
+        second = dedup.analyze(WIRE_B, model, vec, doc_id="b")
+        assert second["near_duplicate_of"] == "a"
+        assert second["near_duplicate_similarity"] >= 0.85
+        assert second["classification"] == first["classification"]
+        assert vec.transform.call_count == 1
+        for claim, (start, end) in zip(second["suspicious_claims"],
+                                       second["suspicious_claim_spans"]):
+            assert WIRE_B[start:end] == claim
+
+    def test_flag_mode_still_runs_pipeline(self):
+        dedup, model, vec = NearDuplicateAnalyzer(on_duplicate="flag"), _model(), MagicMock()
+        dedup.analyze(WIRE_A, model, vec, doc_id="a")
+        second = dedup.analyze(WIRE_B, model, vec, doc_id="b")
+        assert second["near_duplicate_of"] == "a"
+        assert vec.transform.call_count == 2
+
+    def test_new_model_invalidates_index(self):
+        dedup, vec = NearDuplicateAnalyzer(), MagicMock()
+        dedup.analyze(WIRE_A, _model(), vec)
+        assert dedup.analyze(WIRE_A, _model(), vec)["near_duplicate_of"] is None
+
+    def test_cached_result_not_shared(self):
+        dedup, model, vec = NearDuplicateAnalyzer(), _model(), MagicMock()
+        dedup.analyze(WIRE_A, model, vec)["key_indicators"].append("mutated")
+        assert "mutated" not in dedup.analyze(WIRE_A, model, vec)["key_indicators"]
+
+    def test_analyzer_options_forwarded(self):
+        lexicon = Lexicon.from_dict({"extend": {"clickbait": ["subscribe"]}})
+        assert NearDuplicateAnalyzer(ml_claims=True).ml_claims
+        dedup = NearDuplicateAnalyzer(lexicon=lexicon, match_mode="word")
+        assert dedup._pattern_detector.match_mode == "word"
+        result = dedup.analyze(WIRE_B, _model(), MagicMock())
+        assert result["patterns"]["clickbait"] == 1
+
+    def test_uncached_modes_fall_through(self):
+        dedup, model, vec = NearDuplicateAnalyzer(), _model(), MagicMock()
+        fields = ["classification", "patterns"]
+        assert list(dedup.analyze(WIRE_A, model, vec, fields=fields)) == fields
+        assert dedup.analyze(WIRE_A, model, vec, lazy=True).classification
+        assert len(dedup.index) == 0
+
+        profiled = dedup.analyze(WIRE_A, model, vec, profile=True)
+        assert profiled["near_duplicate_of"] is None and "profile" in profiled
+        assert len(dedup.index) == 1
+
+    def test_index_keeps_model_pair_alive(self):
+        dedup, model, vec = NearDuplicateAnalyzer(), _model(), MagicMock()
+        dedup.analyze(WIRE_A, model, vec)
+        # Held (not its id()), so a later model cannot take over its address
+        assert dedup._bound[0] is model and dedup._bound[1] is vec
@@ -4,8 +4,10 @@ Unit tests for src.patterns.PatternDetector
 Covers detect_patterns() output structure, value ranges, and key detections.
 """
 
+import numpy as np
 import pytest
 
+from src.patterns.matcher import KeywordMatcher
 from src.patterns.pattern_detector import PatternDetector
 
 
@@ -119,3 +121,184 @@ class TestClickbaitDetection:
         text = "The annual report was released by the treasury department."
         result = detector.detect_patterns(text)
         assert result["clickbait"] == 0
+
+
+class TestDetectPatternsWithSpans:
+    TEXT = (
+        "SHOCKING: Sources say the deep state cover-up is the hidden truth. "
+        "However, a published study shows otherwise. You won't believe it!"
+    )
+
+    def test_counts_match_detect_patterns(self, detector):
+        patterns, _ = detector.detect_patterns_with_spans(self.TEXT)
+        assert patterns == detector.detect_patterns(self.TEXT)
+
+    def test_spans_point_at_keywords(self, detector):
+        _, spans = detector.detect_patterns_with_spans(self.TEXT)
+        found = {(fam, self.TEXT[s:e].lower()) for fam, s, e in spans}
+        assert ("vague_sources", "sources say") in found
+        assert ("conspiracy_framing", "hidden truth") in found
+        assert ("sensational_phrases", "hidden") in found
+        assert ("caps_words", "shocking:") in found
+
+    def test_spans_sorted_and_compact(self, detector):
+        _, spans = detector.detect_patterns_with_spans(self.TEXT)
+        assert list(spans.start) == sorted(spans.start)
+        assert spans.start.dtype.itemsize == 4
+        assert len(spans) == len(spans.family) == len(spans.end)
+
+    def test_of_filters_family(self, detector):
+        _, spans = detector.detect_patterns_with_spans(self.TEXT)
+        assert spans.of("clickbait") == [(self.TEXT.index("You won't"), self.TEXT.index(" it!"))]
+
+    def test_empty_text(self, detector):
+        patterns, spans = detector.detect_patterns_with_spans("")
+        assert patterns == detector.detect_patterns("")
+        assert len(spans) == 0
+
+
+class TestDetectPatternsBatch:
+    TEXTS = [
+        "SHOCKING: Sources say the deep state cover-up is the hidden truth.",
+        "",
+        "   ",
+        "A peer-reviewed study published in a journal found modest results.",
+        "all lowercase text without any capitals at all",
+        "Embedded\x00separator with BREAKING news",
+    ]
+
+    def test_rows_match_detect_patterns(self, detector):
+        rows = detector.detect_patterns_batch(self.TEXTS, n_jobs=1)
+        assert len(rows) == len(self.TEXTS)
+        for text, row in zip(self.TEXTS, rows):
+            expected = detector.detect_patterns(text)
+            assert {k: row[k].item() for k in detector.PATTERN_KEYS} == expected
+
+    def test_columns_are_pattern_keys(self, detector):
+        rows = detector.detect_patterns_batch(self.TEXTS[:1], n_jobs=1)
+        assert rows.dtype.names == detector.PATTERN_KEYS
+        assert set(rows.dtype.names) == EXPECTED_KEYS
+
+    def test_chunking_does_not_change_results(self, detector):
+        whole = detector.detect_patterns_batch(self.TEXTS, n_jobs=1)
+        chunked = detector.detect_patterns_batch(self.TEXTS, n_jobs=1, chunk_size=2)
+        assert (whole == chunked).all()
+
+    def test_non_ascii_rows_match(self, detector):
+        texts = [
+            "BREAKING\u00a0NEWS: \u201cSources say\u201d it\u2019s a COVER-UP!",
+            "\u00c9T\u00c9 CAF\u00c9 \u01c5ZZ d\u00e9j\u00e0 vu \u2014 the data, the statistics",
+            "emoji \U0001f600 HIDDEN\u3000TRUTH",
+        ]
+        rows = detector.detect_patterns_batch(texts, n_jobs=1)
+        for text, row in zip(texts, rows):
+            assert {k: row[k].item() for k in detector.PATTERN_KEYS} == detector.detect_patterns(text)
+
+    def test_empty_corpus(self, detector):
+        assert len(detector.detect_patterns_batch([], n_jobs=1)) == 0
+
+    def test_as_frame(self, detector):
+        frame = detector.detect_patterns_batch(self.TEXTS, n_jobs=1, as_frame=True)
+        assert list(frame.columns) == list(detector.PATTERN_KEYS)
+        assert len(frame) == len(self.TEXTS)
+
+
+class TestKeywordMatcherEngines:
+    FAMILIES = [["aa", "aaa", "cover-up", "cover"], ["aa", "truth"], ["a"]]
+    TEXTS = [
+        "aaaaaaa",
+        "the cover-up covers the truth; aa aaa",
+        "",
+        "no matches here",
+    ]
+
+    @pytest.fixture
+    def engines(self):
+        return (
+            KeywordMatcher(self.FAMILIES, engine="scan"),
+            KeywordMatcher(self.FAMILIES, engine="automaton"),
+        )
+
+    def test_counts_identical(self, engines):
+        scan, automaton = engines
+        for text in self.TEXTS:
+            assert automaton.count(text) == scan.count(text)
+
+    def test_spans_identical(self, engines):
+        scan, automaton = engines
+        for text in self.TEXTS:
+            assert sorted(automaton.find(text)) == sorted(scan.find(text))
+
+    def test_count_documents_identical(self, engines):
+        scan, automaton = engines
+        joined = "\x00".join(self.TEXTS)
+        starts = np.cumsum([0] + [len(t) + 1 for t in self.TEXTS[:-1]]).astype(np.int64)
+        assert (automaton.count_documents(joined, starts)
+                == scan.count_documents(joined, starts)).all()
+
+    def test_count_documents_matches_count(self):
+        families = [["a", "aa", "statistics", "\u00fcberraschung"], ["cover-up", "the truth is out"]]
+        texts = self.TEXTS + [
+            "statisticstatistics \u00fcberraschung! the truth is out",
+            "\u201ccover-up\u201d \u00fcberraschung\u00fcberraschung",
+        ]
+        matcher = KeywordMatcher(families, engine="scan")
+        joined = "\x00".join(texts)
+        starts = np.cumsum([0] + [len(t) + 1 for t in texts[:-1]]).astype(np.int64)
+        expected = np.array([matcher.count(t) for t in texts]).T
+        assert (matcher.count_documents(joined, starts) == expected).all()
+
+    def test_auto_switches_on_size(self):
+        terms = [f"term{i}" for i in range(KeywordMatcher.AUTOMATON_MIN_KEYWORDS)]
+        small = KeywordMatcher([["alpha", "beta"]])
+        large = KeywordMatcher([terms])
+        assert small.engine == "scan"
+        assert large.engine == "automaton"
+        text = "term1 term12 term499"
+        # term1 x2, term12, term4, term49, term499
+        assert large.count(text) == KeywordMatcher([terms], engine="scan").count(text) == [6]
+
+    def test_unknown_engine(self):
+        with pytest.raises(ValueError):
+            KeywordMatcher([["x"]], engine="regex")
+
+
+class TestWordMatchMode:
+    @pytest.fixture
+    def word_detector(self):
+        return PatternDetector(match_mode="word")
+
+    def test_substrings_do_not_fire(self, detector, word_detector):
+        text = "The ball rolled down the hallway into the database room."
+        assert detector.detect_patterns(text)["extreme_adjectives"] == 2
+        assert word_detector.detect_patterns(text)["extreme_adjectives"] == 0
+        assert word_detector.detect_patterns(text)["no_evidence"] == 1.0
+
+    def test_whole_words_and_phrases_fire(self, word_detector):
+        text = "All of it is a cover-up. Wake up! They don't want you to know."
+        patterns = word_detector.detect_patterns(text)
+        assert patterns["extreme_adjectives"] == 1
+        assert patterns["conspiracy_framing"] == 3
+
+    def test_phrase_does_not_span_lines(self, word_detector):
+        assert word_detector.detect_patterns("wake\nup")["conspiracy_framing"] == 0
+        assert word_detector.detect_patterns("wake  up")["conspiracy_framing"] == 1
+
+    def test_hits_additive_over_lines(self, word_detector):
+        lines = ["Sources say it is ALL a cover up", "wake up, the data is hidden"]
+        whole = word_detector.count_pattern_hits("\n".join(lines))
+        parts = [word_detector.count_pattern_hits(line) for line in lines]
+        assert list(whole) == [a + b for a, b in zip(*parts)]
+
+    def test_spans_and_batch_agree(self, word_detector):
+        texts = TestDetectPatternsBatch.TEXTS + ["wake", "up all"]
+        rows = word_detector.detect_patterns_batch(texts, n_jobs=1)
+        for text, row in zip(texts, rows):
+            expected = word_detector.detect_patterns(text)
+            assert {k: row[k].item() for k in word_detector.PATTERN_KEYS} == expected
+            if text:
+                assert word_detector.detect_patterns_with_spans(text)[0] == expected
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            PatternDetector(match_mode="regex")
@@ -0,0 +1,129 @@
+"""
+Unit tests for src.analyzer.profiling and the ``profile`` CLI command
+=====================================================================
+Profiles a real analysis with a tiny TF-IDF + linear model and checks the
+collapsed-stack output, the hot-function table and the CLI wiring.
+"""
+
+import joblib
+import pytest
+
+from src.analyzer import CredibilityAnalyzer
+from src.analyzer.profiling import ProfileReport, _module_name, profile_call
+from src.cli import main
+
+
+ARTICLE = (
+    "Sources say the deep state is covering up the false flag operation! "
+    "Scientists at Stanford University published a study in a journal. "
+) * 20
+
+
+@pytest.fixture(scope="module")
+def profiled(fitted_pair):
+    model, vec = fitted_pair
+    return CredibilityAnalyzer().analyze(ARTICLE, model, vec, profile=True)
+
+
+class TestAnalyzeProfile:
+    def test_result_unchanged_apart_from_report(self, fitted_pair, profiled):
+        model, vec = fitted_pair
+        plain = CredibilityAnalyzer().analyze(ARTICLE, model, vec)
+        report = profiled.pop("profile")
+        try:
+            assert profiled == plain
+        finally:
+            profiled["profile"] = report
+        assert isinstance(report, ProfileReport)
+        assert report.wall_seconds > 0
+
+    def test_fields_are_respected(self, fitted_pair):
+        model, vec = fitted_pair
+        result = CredibilityAnalyzer().analyze(
+            ARTICLE, model, vec, fields=["patterns"], profile=True
+        )
+        assert set(result) == {"patterns", "profile"}
+
+    def test_lazy_rejected(self, fitted_pair):
+        model, vec = fitted_pair
+        with pytest.raises(ValueError):
+            CredibilityAnalyzer().analyze(ARTICLE, model, vec, lazy=True, profile=True)
+
+
+class TestCollapsedStacks:
+    def test_line_format(self, profiled):
+        lines = profiled["profile"].collapsed_stacks()
+        assert lines
+        for line in lines:
+            stack, _, micros = line.rpartition(" ")
+            assert stack and int(micros) > 0
+
+    def test_rooted_at_analyze(self, profiled):
+        roots = {line.split(";", 1)[0] for line in profiled["profile"].collapsed_stacks()}
+        assert any(r.startswith("src.analyzer.credibility_analyzer:analyze:") for r in roots)
+
+    def test_paths_reach_pattern_detector(self, profiled):
+        lines = profiled["profile"].collapsed_stacks()
+        assert any("src.patterns.pattern_detector:detect_patterns:" in l for l in lines)
+
+    def test_total_close_to_profiled_time(self, profiled):
+        report = profiled["profile"]
+        total_us = sum(int(l.rsplit(" ", 1)[1]) for l in report.collapsed_stacks())
+        assert total_us == pytest.approx(report.total_seconds * 1e6, rel=0.05)
+
+    def test_recursion_terminates(self):
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        _, report = profile_call(fib, 15)
+        lines = report.collapsed_stacks()
+        assert all(l.count(":fib:") == 1 for l in lines)
+
+    def test_write_collapsed(self, profiled, tmp_path):
+        path = tmp_path / "out.folded"
+        n = profiled["profile"].write_collapsed(str(path))
+        assert n == len(path.read_text(encoding="utf-8").splitlines())
+
+
+class TestHotFunctions:
+    def test_restricted_to_modules(self, profiled):
+        rows = profiled["profile"].hot_functions(["src.patterns"], top=50)
+        assert rows
+        assert all(r.function.startswith("src.patterns.") for r in rows)
+
+    def test_ranked_by_self_time(self, profiled):
+        rows = profiled["profile"].hot_functions(top=50)
+        times = [r.self_seconds for r in rows]
+        assert times == sorted(times, reverse=True)
+
+    def test_top_limits_rows(self, profiled):
+        assert len(profiled["profile"].hot_functions(top=3)) <= 3
+
+    def test_vectorizer_module_in_table(self, fitted_pair, profiled):
+        _, vec = fitted_pair
+        table = profiled["profile"].format_hot_table(
+            extra_modules=[type(vec).__module__]
+        )
+        assert "sklearn.feature_extraction.text:" in table
+
+    def test_module_name(self, tmp_path):
+        path = tmp_path / "pkg" / "sub" / "__init__.py"
+        assert _module_name(str(path), [str(tmp_path)]) == "pkg.sub"
+        assert _module_name(str(tmp_path / "pkg" / "m.py"), [str(tmp_path)]) == "pkg.m"
+
+
+class TestProfileCommand:
+    def test_writes_stacks_and_prints_table(self, fitted_pair, tmp_path, capsys):
+        model, vec = fitted_pair
+        joblib.dump(model, tmp_path / "best_model.joblib")
+        joblib.dump(vec, tmp_path / "tfidf_vectorizer.joblib")
+        article = tmp_path / "article.txt"
+        article.write_text(ARTICLE, encoding="utf-8")
+
+        code = main(["profile", str(article), "--model-dir", str(tmp_path), "--top", "5"])
+
+        assert code == 0
+        folded = tmp_path / "article.txt.folded"
+        assert folded.read_text(encoding="utf-8").strip()
+        out = capsys.readouterr().out
+        assert "self ms" in out and "collapsed stacks" in out
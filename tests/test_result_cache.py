@@ -0,0 +1,126 @@
+"""
+Unit tests for src.analyzer.CachedAnalyzer
+===========================================
+Checks the memory / store lookup order, that cached results equal fresh
+ones, that results are not reused across models, and that lazy /
+fields calls fall through to the pipeline.
+"""
+
+import pytest
+
+from src.analyzer import (
+    CachedAnalyzer,
+    CachedIncrementalAnalyzer,
+    CredibilityAnalyzer,
+    LazyAnalysisResult,
+)
+from src.storage import ResultStore
+
+
+ARTICLE = (
+    "Sources say the deep state is covering up the false flag operation! "
+    "SHOCKING: mainstream media will never report the hidden truth."
+)
+
+
+@pytest.fixture(scope="module")
+def fitted_pair_options():
+    return {"C": 10.0}
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultStore(str(tmp_path / "results.db")) as store:
+        yield store
+
+
+class TestCachedAnalyzer:
+    def test_memory_then_store_then_pipeline(self, fitted_pair, store):
+        model, vec = fitted_pair
+        expected = CredibilityAnalyzer().analyze(ARTICLE, model, vec)
+
+        first = CachedAnalyzer(store)
+        assert first.analyze(ARTICLE, model, vec, url="https://example.com/a") == expected
+        assert first.analyze(ARTICLE, model, vec) == expected
+        assert first.cache_info() == {
+            "memory_hits": 1, "store_hits": 0, "misses": 1, "memory_entries": 1,
+        }
+
+        # A new process: empty memory, same store
+        second = CachedAnalyzer(store)
+        assert second.analyze(ARTICLE, model, vec) == expected
+        assert second.cache_info()["store_hits"] == 1
+        assert store.get_by_url("https://example.com/a") == expected
+
+    def test_returns_independent_copies(self, fitted_pair):
+        model, vec = fitted_pair
+        cached = CachedAnalyzer()
+        cached.analyze(ARTICLE, model, vec)["key_indicators"].append("mutated")
+        assert "mutated" not in cached.analyze(ARTICLE, model, vec)["key_indicators"]
+
+    def test_results_not_shared_across_models(self, fitted_pair, fit_pair, store):
+        model, vec = fitted_pair
+        other_model, other_vec = fit_pair(C=0.01)
+        cached = CachedAnalyzer(store)
+        cached.analyze(ARTICLE, model, vec)
+        assert cached.analyze(ARTICLE, other_model, other_vec) == \
+            CredibilityAnalyzer().analyze(ARTICLE, other_model, other_vec)
+        assert cached.cache_info()["misses"] == 2
+        assert cached.model_version(model, vec) != cached.model_version(other_model, other_vec)
+        # The bound pair is held (not its id()), so its address cannot be reused
+        assert cached._bound[0] is other_model and cached._bound[1] is other_vec
+
+    def test_fingerprint_is_stable_and_overridable(self, fitted_pair):
+        model, vec = fitted_pair
+        assert CachedAnalyzer().model_version(model, vec) == CachedAnalyzer().model_version(model, vec)
+        assert CachedAnalyzer(match_mode="word").model_version(model, vec) != \
+            CachedAnalyzer().model_version(model, vec)
+        assert CachedAnalyzer(model_version="prod-3").model_version(model, vec) == "prod-3"
+
+    def test_memory_lru_is_bounded(self, fitted_pair):
+        model, vec = fitted_pair
+        cached = CachedAnalyzer(memory_entries=2)
+        for i in range(4):
+            cached.analyze(f"{ARTICLE} Update {i}.", model, vec)
+        assert cached.cache_info()["memory_entries"] == 2
+
+    def test_short_text_not_cached(self, fitted_pair, store):
+        model, vec = fitted_pair
+        cached = CachedAnalyzer(store)
+        assert cached.analyze("Too short.", model, vec)["classification"] == "UNVERIFIED"
+        assert len(store) == 0 and cached.cache_info()["misses"] == 0
+
+    def test_invalid_memory_entries(self):
+        with pytest.raises(ValueError):
+            CachedAnalyzer(memory_entries=-1)
+
+    def test_uncached_modes_fall_through(self, fitted_pair, store):
+        model, vec = fitted_pair
+        cached = CachedAnalyzer(store)
+        fields = ["classification", "patterns"]
+        assert cached.analyze(ARTICLE, model, vec, fields=fields) == \
+            CredibilityAnalyzer().analyze(ARTICLE, model, vec, fields=fields)
+        assert isinstance(cached.analyze(ARTICLE, model, vec, lazy=True), LazyAnalysisResult)
+        assert len(store) == 0 and cached.cache_info()["misses"] == 0
+
+        # Profiling covers the cached call
+        profiled = cached.analyze(ARTICLE, model, vec, profile=True)
+        assert profiled.pop("profile").total_seconds >= 0.0
+        assert profiled == cached.analyze(ARTICLE, model, vec)
+        assert cached.cache_info()["misses"] == 1 and cached.cache_info()["memory_hits"] == 1
+
+
+class TestCachedIncrementalAnalyzer:
+    def test_misses_computed_incrementally_and_stored(self, fitted_pair, store):
+        model, vec = fitted_pair
+        edited = f"{ARTICLE}\nOfficials published the data."
+        session = CachedIncrementalAnalyzer(store, memory_entries=4, match_mode="word")
+        full = CredibilityAnalyzer(match_mode="word")
+        assert session.analyze(ARTICLE, model, vec) == full.analyze(ARTICLE, model, vec)
+        assert session.analyze(edited, model, vec) == full.analyze(edited, model, vec)
+        assert len(store) == 2 and session._doc_lines
+
+        # Another session over the same store
+        other = CachedIncrementalAnalyzer(store, match_mode="word")
+        assert other.analyze(edited, model, vec) == full.analyze(edited, model, vec)
+        assert other.cache_info()["store_hits"] == 1
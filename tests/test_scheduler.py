@@ -0,0 +1,213 @@
+"""
+Unit tests for src.analyzer.PriorityScheduler
+==============================================
+A manual executor runs tasks only when the test says so, which makes the
+dispatch order, lane limits and queue depths deterministic.
+"""
+
+import queue
+import threading
+from concurrent.futures import Future, wait
+
+import pytest
+
+from src.analyzer import BULK, INTERACTIVE, NEAR_REAL_TIME, CredibilityAnalyzer, LaneConfig, PriorityScheduler
+
+
+class ManualExecutor:
+    """Records submissions; ``run_next()`` runs the oldest one."""
+
+    def __init__(self):
+        self.pending = []
+        self.started = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.pending.append((future, fn, args, kwargs))
+        self.started.append(args[0] if args else None)
+        return future
+
+    def run_next(self):
+        future, fn, args, kwargs = self.pending.pop(0)
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+
+    def drain(self):
+        while self.pending:
+            self.run_next()
+
+    def shutdown(self, wait=True):
+        pass
+
+
+def _tag(tag):
+    return tag
+
+
+@pytest.fixture
+def manual():
+    return ManualExecutor()
+
+
+def _scheduler(manual, workers=1, **lanes):
+    lanes = lanes or {
+        INTERACTIVE: LaneConfig(weight=8),
+        NEAR_REAL_TIME: LaneConfig(weight=2),
+        BULK: LaneConfig(weight=1),
+    }
+    return PriorityScheduler(workers=workers, lanes=lanes, executor=manual)
+
+
+class TestDispatch:
+    def test_results_and_errors_propagate(self, manual):
+        scheduler = _scheduler(manual)
+        ok = scheduler.submit(INTERACTIVE, _tag, "a")
+        bad = scheduler.submit(BULK, lambda: 1 / 0)
+        manual.drain()
+        assert ok.result() == "a"
+        with pytest.raises(ZeroDivisionError):
+            bad.result()
+        m = scheduler.metrics()
+        assert m[INTERACTIVE]["completed"] == 1 and m[BULK]["failed"] == 1
+
+    def test_weighted_fair_order(self, manual):
+        scheduler = _scheduler(manual)
+        blocker = scheduler.submit(BULK, _tag, "blocker")
+        for i in range(20):
+            scheduler.submit(BULK, _tag, f"b{i}")
+            scheduler.submit(INTERACTIVE, _tag, f"i{i}")
+        manual.drain()
+        assert blocker.done()
+        # While both lanes are backlogged, 8 interactive tasks run per bulk task
+        order = manual.started
+        assert order.index("b1") - order.index("b0") == 9
+        assert order[order.index("b0") + 1:order.index("b1")] == [f"i{i}" for i in range(9, 17)]
+
+    def test_bulk_gets_every_worker_when_alone(self, manual):
+        scheduler = _scheduler(manual, workers=3)
+        for i in range(5):
+            scheduler.submit(BULK, _tag, i)
+        assert len(manual.pending) == 3
+        assert scheduler.metrics()[BULK]["queued"] == 2
+
+    def test_idle_lane_banks_no_credit(self, manual):
+        scheduler = _scheduler(manual)
+        for i in range(80):
+            scheduler.submit(INTERACTIVE, _tag, f"i{i}")
+        manual.drain()
+        scheduler.submit(INTERACTIVE, _tag, "blocker")
+        for i in range(5):
+            scheduler.submit(BULK, _tag, f"b{i}")
+        for i in range(20):
+            scheduler.submit(INTERACTIVE, _tag, f"j{i}")
+        manual.drain()
+        # Bulk was idle while interactive ran 80 tasks; it re-enters at the
+        # current virtual time instead of jumping ahead with 10 dispatches
+        after = manual.started[81:90]
+        assert sum(tag.startswith("b") for tag in after) == 1
+
+    def test_cancelled_while_queued_is_skipped(self, manual):
+        scheduler = _scheduler(manual)
+        scheduler.submit(INTERACTIVE, _tag, "running")
+        queued = scheduler.submit(INTERACTIVE, _tag, "cancelled")
+        assert queued.cancel()
+        manual.drain()
+        assert manual.started == ["running"]
+        assert scheduler.metrics()[INTERACTIVE]["cancelled"] == 1
+
+
+class TestLimits:
+    def test_lane_concurrency_limit(self, manual):
+        scheduler = _scheduler(
+            manual, workers=3,
+            interactive=LaneConfig(weight=8), bulk=LaneConfig(weight=1, max_concurrency=1),
+        )
+        for i in range(3):
+            scheduler.submit("bulk", _tag, f"b{i}")
+        assert manual.started == ["b0"]
+        scheduler.submit("interactive", _tag, "i0")
+        assert manual.started == ["b0", "i0"]
+        assert scheduler.metrics()["bulk"]["running"] == 1
+
+    def test_default_lanes_keep_a_worker_free_of_bulk(self, manual):
+        scheduler = PriorityScheduler(workers=4, executor=manual)
+        for i in range(10):
+            scheduler.submit(BULK, _tag, i)
+        assert len(manual.pending) == 3
+        scheduler.submit(INTERACTIVE, _tag, "i")
+        assert manual.started[-1] == "i"
+
+    def test_queue_depth_and_backpressure(self, manual):
+        scheduler = _scheduler(manual, bulk=LaneConfig(weight=1, max_queue=2))
+        for i in range(3):
+            scheduler.submit("bulk", _tag, i)
+        with pytest.raises(queue.Full):
+            scheduler.submit("bulk", _tag, 3)
+        m = scheduler.metrics()["bulk"]
+        assert (m["queued"], m["running"], m["rejected"], m["max_depth"]) == (2, 1, 1, 2)
+        manual.drain()
+        m = scheduler.metrics()["bulk"]
+        assert m["queued"] == 0 and m["completed"] == 3
+        assert m["wait_max_ms"] >= m["wait_p95_ms"] >= m["wait_p50_ms"] >= 0.0
+
+    def test_cancelled_tasks_free_the_queue(self, manual):
+        scheduler = _scheduler(manual, bulk=LaneConfig(weight=1, max_queue=2))
+        scheduler.submit("bulk", _tag, "running")
+        queued = [scheduler.submit("bulk", _tag, i) for i in range(2)]
+        assert all(future.cancel() for future in queued)
+        m = scheduler.metrics()["bulk"]
+        assert (m["queued"], m["cancelled"]) == (0, 2)
+        assert wait(queued, timeout=1).not_done == set()
+
+        scheduler.submit("bulk", _tag, "next")
+        manual.drain()
+        assert manual.started == ["running", "next"]
+        assert scheduler.metrics()["bulk"]["cancelled"] == 2
+        assert scheduler.join(timeout=1)
+
+    @pytest.mark.parametrize("kwargs", [
+        {"workers": 0},
+        {"lanes": {}},
+        {"lanes": {"bulk": LaneConfig(weight=0)}},
+        {"lanes": {"bulk": LaneConfig(weight=1, max_concurrency=-1)}},
+    ])
+    def test_invalid_configuration(self, kwargs):
+        with pytest.raises(ValueError):
+            PriorityScheduler(**kwargs)
+
+    def test_unknown_lane(self, manual):
+        with pytest.raises(ValueError):
+            _scheduler(manual).submit("realtime", _tag, 1)
+
+
+class TestLifecycle:
+    def test_shutdown_cancels_pending_and_rejects_new(self, manual):
+        scheduler = _scheduler(manual)
+        scheduler.submit(BULK, _tag, "running")
+        queued = scheduler.submit(BULK, _tag, "queued")
+        manual.run_next()
+        # run_next completed "running" and dispatched "queued"
+        later = scheduler.submit(BULK, _tag, "later")
+        scheduler.shutdown(wait=False, cancel_pending=True)
+        assert later.cancelled() and not queued.cancelled()
+        assert later in wait([later], timeout=0).done
+        with pytest.raises(RuntimeError):
+            scheduler.submit(BULK, _tag, "late")
+
+    def test_thread_pool_runs_analyzer(self, fitted_pair, corpus):
+        model, vec = fitted_pair
+        analyzer = CredibilityAnalyzer()
+        text = corpus[0][0] + " The research team reported results after a long survey."
+        gate = threading.Event()
+
+        with PriorityScheduler(workers=2) as scheduler:
+            bulk = [scheduler.submit(BULK, gate.wait) for _ in range(4)]
+            fast = scheduler.submit(INTERACTIVE, analyzer.analyze, text, model, vec)
+            assert fast.result(timeout=10) == analyzer.analyze(text, model, vec)
+            assert scheduler.metrics()[BULK]["queued"] == 3
+            gate.set()
+            assert scheduler.join(timeout=10)
+        assert all(f.result() for f in bulk)
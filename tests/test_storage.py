@@ -0,0 +1,195 @@
+"""
+Unit tests for src.storage
+===========================
+Round-trips analysis results through the columnar writer / reader in both
+the Parquet and the .npz format, and through the SQLite result store.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.analyzer import AnalysisResult, CredibilityAnalyzer
+from src.patterns import PatternDetector
+from src.storage import ColumnarResultReader, ColumnarResultWriter, ResultStore
+from src.storage.columnar import _part_paths, pa
+
+needs_pyarrow = pytest.mark.skipif(pa is None, reason="pyarrow not installed")
+
+ARTICLES = [
+    "SHOCKING: Government scientists EXPOSED! Sources say the deep state is "
+    "covering up a massive false flag operation. Wake up!",
+    "Scientists at Stanford University have published a peer-reviewed study "
+    "showing 89% efficacy in clinical trials. Dr. Jane Smith confirmed the data.",
+    "Too short.",
+]
+
+
+@pytest.fixture(scope="module")
+def results():
+    analyzer = CredibilityAnalyzer()
+    out = []
+    for i, text in enumerate(ARTICLES * 5):
+        model = MagicMock()
+        model.predict.return_value = np.array([i % 2])
+        model.predict_proba.return_value = np.array([[0.2, 0.8]])
+        out.append(analyzer.analyze(text, model, MagicMock()))
+    return out
+
+
+@pytest.fixture(params=[pytest.param("parquet", marks=needs_pyarrow), "npz"])
+def fmt(request):
+    return request.param
+
+
+class TestColumnarRoundTrip:
+    def test_scalars_patterns_and_lists(self, tmp_path, results, fmt):
+        with ColumnarResultWriter(str(tmp_path), batch_size=4, format=fmt) as writer:
+            writer.write_many(results, doc_ids=[f"doc-{i}" for i in range(len(results))])
+
+        df = ColumnarResultReader(str(tmp_path)).read()
+        assert len(df) == len(results)
+        assert df["doc_id"].tolist() == [f"doc-{i}" for i in range(len(results))]
+        for row, result in zip(df.itertuples(index=False), results):
+            assert row.classification == result["classification"]
+            assert row.credibility_score == result["credibility_score"]
+            assert row.pattern_score == result["pattern_score"]
+            assert list(row.key_indicators) == result["key_indicators"]
+            assert list(row.suspicious_claims) == result["suspicious_claims"]
+            for key in PatternDetector.PATTERN_KEYS:
+                assert getattr(row, key) == result["patterns"].get(key, 0)
+        assert df["credibility_score"].dtype == np.int16
+        assert df["vague_sources"].dtype == np.int64
+
+    def test_lazy_column_selection(self, tmp_path, results, fmt):
+        with ColumnarResultWriter(str(tmp_path), batch_size=4, format=fmt) as writer:
+            writer.write_many(results)
+
+        reader = ColumnarResultReader(str(tmp_path))
+        batches = list(reader.iter_batches(["classification", "credibility_score"]))
+        assert [len(b) for b in batches] == [4, 4, 4, 3]
+        assert list(batches[0].columns) == ["classification", "credibility_score"]
+        assert len(reader) == len(results)
+
+    def test_accepts_records(self, tmp_path, results, fmt):
+        with ColumnarResultWriter(str(tmp_path), format=fmt, include_narrative=True) as writer:
+            writer.write_many(AnalysisResult.from_dict(r) for r in results)
+        df = ColumnarResultReader(str(tmp_path)).read(["explanation"])
+        assert df["explanation"].tolist() == [r["explanation"] for r in results]
+
+
+class TestRotationAndAppend:
+    @needs_pyarrow
+    def test_rotates_parquet_parts(self, tmp_path, results):
+        with ColumnarResultWriter(
+            str(tmp_path), batch_size=4, max_rows_per_file=6, format="parquet"
+        ) as writer:
+            writer.write_many(results)
+        reader = ColumnarResultReader(str(tmp_path))
+        assert len(reader.parts) == 3
+        assert len(reader) == len(results)
+
+    def test_append_continues_numbering(self, tmp_path, results, fmt):
+        for _ in range(2):
+            with ColumnarResultWriter(str(tmp_path), format=fmt) as writer:
+                writer.write_many(results)
+        reader = ColumnarResultReader(str(tmp_path))
+        assert [p.rsplit("/", 1)[1].split(".")[0] for p in reader.parts] == \
+            ["part-00000", "part-00001"]
+        assert len(reader) == 2 * len(results)
+
+    def test_parts_sort_numerically_past_five_digits(self, tmp_path):
+        for name in ("part-100000.npz", "part-99999.npz", "part-00002.parquet"):
+            (tmp_path / name).touch()
+        assert [p.rsplit("/", 1)[1] for p in _part_paths(str(tmp_path))] == \
+            ["part-00002.parquet", "part-99999.npz", "part-100000.npz"]
+
+    def test_refuses_existing_without_append(self, tmp_path, results, fmt):
+        with ColumnarResultWriter(str(tmp_path), format=fmt) as writer:
+            writer.write(results[0])
+        with pytest.raises(FileExistsError):
+            ColumnarResultWriter(str(tmp_path), format=fmt, append=False)
+
+    def test_unflushed_part_not_visible(self, tmp_path, results, fmt):
+        writer = ColumnarResultWriter(str(tmp_path), format=fmt)
+        writer.write(results[0])
+        assert ColumnarResultReader(str(tmp_path)).parts == []
+        writer.close()
+        assert len(ColumnarResultReader(str(tmp_path))) == 1
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            ColumnarResultWriter(str(tmp_path), format="csv")
+
+
+class TestResultStore:
+    @pytest.fixture
+    def store(self, tmp_path):
+        with ResultStore(str(tmp_path / "results.db"), batch_size=4) as store:
+            yield store
+
+    def test_round_trip_is_exact(self, store, results):
+        keys = [ResultStore.content_hash(f"article {i}") for i in range(len(results))]
+        store.put_many(zip(keys, results), model_version="v1")
+        for key, result in zip(keys, results):
+            assert store.get(key, "v1") == result
+        assert store.get(keys[0], "v2") is None
+        assert len(store) == len(results)
+
+    def test_buffered_rows_are_visible_and_batched(self, store, results):
+        key = ResultStore.content_hash("a")
+        store.put(key, results[0])
+        assert store._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 0
+        assert store.get(key) == results[0]
+        store.put_many((ResultStore.content_hash(str(i)), results[0]) for i in range(3))
+        assert store._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 4
+
+    def test_same_key_replaces_row_and_keeps_url(self, store, results):
+        key = ResultStore.content_hash("a")
+        store.put(key, results[0], url="https://example.com/a")
+        store.flush()
+        store.put(key, results[1])
+        assert len(store) == 1
+        assert store.get(key) == results[1]
+        assert store.get_by_url("https://example.com/a") == results[1]
+        assert store.get_by_url("https://example.com/missing") is None
+
+    def test_query_filters(self, store, results):
+        now = datetime(2026, 10, 19, 12, 0)
+        for i, result in enumerate(results):
+            store.put(ResultStore.content_hash(str(i)), result,
+                      analyzed_at=now - timedelta(days=i))
+        week = store.query(since=now - timedelta(days=7))
+        assert len(week) == 8
+        assert week["analyzed_at"].is_monotonic_decreasing
+        label = results[0]["classification"]
+        low = store.query(classification=label, max_score=50)
+        expected = sum(
+            r["classification"] == label and r["credibility_score"] <= 50 for r in results
+        )
+        assert len(low) == expected == store.count(classification=label, max_score=50)
+        assert set(low["risk_level"]) <= {r["risk_level"] for r in results}
+        assert len(store.query(limit=3)) == 3
+        assert all(len(h) == 32 for h in week["content_hash"])
+
+    def test_label_time_score_query_uses_index(self, store):
+        plan = store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM results WHERE classification = ? "
+            "AND analyzed_at >= ? AND credibility_score < ?", ("FAKE", 0.0, 20),
+        ).fetchall()
+        assert "idx_results_classification" in " ".join(row[-1] for row in plan)
+
+    def test_wal_mode_and_reopen(self, tmp_path, results):
+        path = str(tmp_path / "results.db")
+        with ResultStore(path) as store:
+            store.put(ResultStore.content_hash("a"), results[0])
+        assert sqlite3.connect(path).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        with ResultStore(path) as store:
+            assert store.get(ResultStore.content_hash("a")) == results[0]
+
+    def test_invalid_batch_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            ResultStore(str(tmp_path / "results.db"), batch_size=0)
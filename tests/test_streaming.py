@@ -0,0 +1,131 @@
+"""
+Unit tests for CredibilityAnalyzer.analyze_stream
+===================================================
+Checks that chunked analysis of a long document matches analyze() on the
+concatenated text, for text and binary streams and awkward chunk sizes.
+"""
+
+import io
+
+import pytest
+
+from src.analyzer import CredibilityAnalyzer
+from src.patterns import PatternDetector
+
+
+PARAGRAPHS = [
+    "Scientists at Stanford University published a study in a journal.",
+    "Sources say the deep state is covering up the false flag operation!",
+    "The research data was analysed by professors over six months, and the "
+    "<b>survey</b> results were <a\nhref='x'>published</a> in full.",
+    "SHOCKING: mainstream media will never report the hidden truth. Wake up",
+    "you sheeple, it is all a cover-up. According to sources the secret agenda "
+    "is controlled by insiders.",
+]
+
+# Several thousand characters: many cuts at every chunk size below
+DOCUMENT = "\n".join(PARAGRAPHS * 12)
+
+
+@pytest.fixture
+def analyzer():
+    return CredibilityAnalyzer()
+
+
+class TestStreamMatchesAnalyze:
+    @pytest.mark.parametrize("chunk_size", [7, 64, 333, 4096])
+    def test_text_stream(self, analyzer, fitted_pair, chunk_size):
+        model, vec = fitted_pair
+        expected = analyzer.analyze(DOCUMENT, model, vec)
+        result = analyzer.analyze_stream(
+            io.StringIO(DOCUMENT), model, vec, chunk_size=chunk_size
+        )
+        assert result == expected
+
+    def test_binary_stream_with_multibyte_split(self, analyzer, fitted_pair):
+        model, vec = fitted_pair
+        text = DOCUMENT.replace("analysed", "analysé")
+        expected = analyzer.analyze(text, model, vec)
+        result = analyzer.analyze_stream(
+            io.BytesIO(text.encode("utf-8")), model, vec, chunk_size=5
+        )
+        assert result == expected
+
+    def test_no_sentence_boundaries(self, analyzer, fitted_pair):
+        # One 30k-character "sentence": only forced whitespace cuts are possible
+        model, vec = fitted_pair
+        text = " ".join(
+            ["sources say", "the deep state", "wake up", "cover up", "research data"] * 500
+        )
+        expected = analyzer.analyze(text, model, vec)
+        result = analyzer.analyze_stream(io.StringIO(text), model, vec, chunk_size=16)
+        assert result["patterns"] == expected["patterns"]
+        assert result["top_terms"] == expected["top_terms"]
+        assert result["credibility_score"] == expected["credibility_score"]
+
+    def test_word_mode_phrases_straddling_cuts(self, fitted_pair):
+        model, vec = fitted_pair
+        analyzer = CredibilityAnalyzer(match_mode="word")
+        text = " ".join(["all of the deep state wake up"] * 700)
+        result = analyzer.analyze_stream(io.StringIO(text), model, vec, chunk_size=11)
+        assert result["patterns"] == PatternDetector(match_mode="word").detect_patterns(text)
+
+    def test_keyword_straddling_forced_cut(self, analyzer, fitted_pair):
+        # 4 KiB chunks: the 5th read forces a cut at the last whitespace of
+        # the first 20 480 characters, which falls inside "wake up"
+        model, vec = fitted_pair
+        prefix = "b " * ((20_480 - len("wake upz")) // 2)
+        text = prefix + "wake up" + "z" * 5_000 + " the end"
+        result = analyzer.analyze_stream(io.StringIO(text), model, vec, chunk_size=4096)
+        assert text.rfind(" ", 0, 20_480) == len(prefix) + len("wake")
+        assert result["patterns"]["conspiracy_framing"] == 1
+        assert result["patterns"] == PatternDetector().detect_patterns(text)
+
+    def test_ml_claims(self, fitted_pair):
+        model, vec = fitted_pair
+        analyzer = CredibilityAnalyzer(ml_claims=True)
+        expected = analyzer.analyze(DOCUMENT, model, vec)
+        result = analyzer.analyze_stream(io.StringIO(DOCUMENT), model, vec, chunk_size=50)
+        assert result == expected
+
+    def test_short_stream_delegates(self, analyzer, fitted_pair):
+        model, vec = fitted_pair
+        for text in ("", "Too short.", PARAGRAPHS[1]):
+            assert analyzer.analyze_stream(io.StringIO(text), model, vec) == (
+                analyzer.analyze(text, model, vec)
+            )
+
+    def test_blank_long_stream(self, analyzer, fitted_pair):
+        model, vec = fitted_pair
+        text = "\n" * 500 + "Tiny.\n" + " " * 500
+        result = analyzer.analyze_stream(io.StringIO(text), model, vec, chunk_size=32)
+        assert result == analyzer.analyze(text, model, vec)
+
+
+class TestStreamClaims:
+    def test_claims_emitted_in_order(self, analyzer, fitted_pair):
+        model, vec = fitted_pair
+        emitted = []
+        result = analyzer.analyze_stream(
+            io.StringIO(DOCUMENT), model, vec, chunk_size=64,
+            on_claim=lambda claim, span: emitted.append((claim, span)),
+        )
+        assert emitted == list(zip(result["suspicious_claims"],
+                                   result["suspicious_claim_spans"]))
+        for claim, (start, end) in emitted:
+            assert DOCUMENT[start:end] == claim
+
+    def test_claims_emitted_before_end_of_stream(self, analyzer, fitted_pair):
+        model, vec = fitted_pair
+        stream = io.StringIO(DOCUMENT)
+        positions = []
+        analyzer.analyze_stream(
+            stream, model, vec, chunk_size=64,
+            on_claim=lambda claim, span: positions.append(stream.tell()),
+        )
+        assert positions and positions[0] < len(DOCUMENT) // 2
+
+    def test_invalid_chunk_size(self, analyzer, fitted_pair):
+        model, vec = fitted_pair
+        with pytest.raises(ValueError):
+            analyzer.analyze_stream(io.StringIO(DOCUMENT), model, vec, chunk_size=0)
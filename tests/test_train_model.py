@@ -0,0 +1,94 @@
+"""
+Unit tests for train_model's cross-validation
+==============================================
+Checks that the per-fold features built from the shared token counts are
+exactly those of a vectorizer fitted on the training fold, and that the
+parallel CV reports what a vectorizer-inside-the-pipeline CV reports.
+"""
+
+import random
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import StratifiedKFold, cross_validate
+from sklearn.pipeline import make_pipeline
+
+import train_model
+from src.utils import clean_text_for_model
+
+WORDS = {
+    1: "scientists university study journal data officials report budget statistics survey",
+    0: "shocking cover truth deep state secret agenda mainstream media hidden wake",
+}
+SHARED = "the news today people said week new story".split()
+
+
+def _corpus(n=60, seed=0):
+    rng = random.Random(seed)
+    texts, labels = [], []
+    for i in range(n):
+        label = i % 2
+        words = rng.choices(WORDS[label].split(), k=8) + rng.choices(SHARED, k=6)
+        # A few rare terms, so folds differ in vocabulary and pruning matters
+        words.append(f"rare{rng.randint(0, 40)}")
+        rng.shuffle(words)
+        texts.append(clean_text_for_model(" ".join(words)))
+        labels.append(label)
+    return texts, np.array(labels)
+
+
+@pytest.fixture
+def corpus():
+    return _corpus()
+
+
+@pytest.fixture(params=[None, 25], ids=["all-terms", "max-features"])
+def max_features(request, monkeypatch):
+    if request.param is not None:
+        monkeypatch.setattr(train_model, "TFIDF_MAX_FEATURES", request.param)
+    return request.param
+
+
+class TestFoldFeatures:
+    def test_equal_to_vectorizer_fitted_on_fold(self, corpus, max_features):
+        texts, y = corpus
+        counts = train_model.tokenize_counts(texts)
+        folds = StratifiedKFold(n_splits=3, shuffle=True, random_state=0)
+        for train_idx, test_idx in folds.split(texts, y):
+            X_train, X_test = train_model.fold_features(counts, train_idx, test_idx)
+            vec = train_model.make_vectorizer().fit([texts[i] for i in train_idx])
+            assert X_train.shape[1] == len(vec.vocabulary_)
+            np.testing.assert_array_equal(
+                X_train.toarray(), vec.transform([texts[i] for i in train_idx]).toarray()
+            )
+            np.testing.assert_array_equal(
+                X_test.toarray(), vec.transform([texts[i] for i in test_idx]).toarray()
+            )
+
+    def test_shared_counts_round_trip(self, corpus, tmp_path):
+        counts = train_model.tokenize_counts(corpus[0])
+        shared = train_model._share_counts(counts, str(tmp_path))
+        opened = train_model._open_counts(shared)
+        # Read-only views of the mapped files, not copies
+        for part in ("data", "indices", "indptr"):
+            array = getattr(opened, part)
+            assert not array.flags.owndata and not array.flags.writeable
+        assert (opened != counts).nnz == 0
+
+
+class TestCrossValidateModel:
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_matches_pipeline_cross_validation(self, corpus, max_features, n_jobs):
+        texts, y = corpus
+        model = LogisticRegression(max_iter=1000)
+        summary = train_model.cross_validate_model("LR", model, texts, y, cv=3, n_jobs=n_jobs)
+
+        reference = cross_validate(
+            make_pipeline(train_model.make_vectorizer(), model), texts, y,
+            cv=StratifiedKFold(n_splits=3, shuffle=True, random_state=train_model.RANDOM_STATE),
+            scoring=train_model.SCORING,
+        )
+        for metric in train_model.SCORING:
+            assert summary[metric] == round(float(np.mean(reference[f"test_{metric}"])), 4)
+            assert summary[f"{metric}_std"] == round(float(np.std(reference[f"test_{metric}"])), 4)
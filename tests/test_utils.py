@@ -11,7 +11,9 @@ from src.utils.text_utils import (
     clean_text_for_model,
     count_keywords,
     count_phrases,
+    iter_sentences,
     split_into_sentences,
+    split_into_sentence_spans,
     contains_vague_source,
     contains_extreme_language,
     contains_evidence_markers,
@@ -124,6 +126,52 @@ class TestSplitIntoSentences:
         assert all(s for s in result)
 
 
+class TestSplitIntoSentenceSpans:
+    @pytest.mark.parametrize("text", [
+        "Hello there. How are you? I am fine!",
+        "  hello.   world.  ",
+        "Line one\nLine two\n\nLine three",
+        "No terminal punctuation",
+        "",
+    ])
+    def test_matches_split_into_sentences(self, text):
+        spans = split_into_sentence_spans(text)
+        assert [text[s:e] for s, e in spans] == split_into_sentences(text)
+
+    def test_repeated_sentences_have_distinct_offsets(self):
+        spans = split_into_sentence_spans("Same here. Same here.")
+        assert spans == [(0, 9), (11, 21)]
+
+
+class TestIterSentences:
+    def test_is_lazy(self):
+        it = iter_sentences("One. Two.")
+        assert next(it) == (0, 3)
+        assert list(it) == [(5, 9)]
+
+    def test_abbreviations_do_not_split(self):
+        text = "Dr. Chen and Mr. J. Smith met e.g. at the U.S. embassy. Then they left."
+        assert [text[s:e] for s, e in iter_sentences(text)] == [
+            "Dr. Chen and Mr. J. Smith met e.g. at the U.S. embassy",
+            "Then they left.",
+        ]
+
+    def test_decimals_do_not_split(self):
+        assert split_into_sentences("Only 0.1% of 3.5 million voted. Fine.") == [
+            "Only 0.1% of 3.5 million voted", "Fine.",
+        ]
+
+    def test_line_break_after_abbreviation_splits(self):
+        assert split_into_sentences("Signed, Dr.\nNext line") == ["Signed, Dr", "Next line"]
+
+    def test_ellipsis_after_abbreviation_splits(self):
+        assert len(split_into_sentences("Ask the Dr... He knows")) == 2
+
+    def test_dr_evidence_marker_reachable(self):
+        sentence = split_into_sentences("Dr. Chen said it works. More later.")[0]
+        assert contains_evidence_markers(sentence)
+
+
 # ── contains_vague_source ─────────────────────────────────────────────────────
 
 class TestContainsVagueSource:
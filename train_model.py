@@ -11,6 +11,12 @@ Improvements over v1
 * Confusion matrix logged to metadata
 * Results written to models/training_report.json for CI/monitoring
 * Single clean_text source of truth (imported from src.utils)
+* Each pipeline stage is a function (load, clean, TF-IDF fit, split,
+  train, cross-validate, save), so tools such as
+  ``benchmarks/memory_harness.py`` can run and measure them one by one
+* Fold-correct cross-validation: the TF-IDF vocabulary and IDF are fitted
+  on each training fold only.  The corpus is tokenized once, and the
+  count matrix is shared with the parallel fold workers through memmaps.
 
 Labels:  1 = Credible / True   |   0 = Fake / Misinformation
 """
@@ -18,26 +24,29 @@ Labels:  1 = Credible / True   |   0 = Fake / Misinformation
 import json
 import os
 import sys
+import tempfile
 import time
 import warnings
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Tuple
 
 import joblib
 import numpy as np
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
+from joblib import Parallel, delayed
+from scipy import sparse
+from sklearn.base import clone
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer, TfidfVectorizer
 from sklearn.linear_model import LogisticRegression, PassiveAggressiveClassifier
 from sklearn.metrics import (
     accuracy_score,
     classification_report,
     confusion_matrix,
     f1_score,
+    get_scorer,
     precision_score,
     recall_score,
 )
-from sklearn.model_selection import StratifiedKFold, cross_validate, train_test_split
-
-warnings.filterwarnings("ignore")
+from sklearn.model_selection import StratifiedKFold, train_test_split
 
 # Ensure src package is importable when run from repo root
 sys.path.insert(0, os.path.dirname(__file__))
@@ -116,34 +125,138 @@ def evaluate_model(
     }
 
 
+def tokenize_counts(content: Any) -> sparse.csr_matrix:
+    """
+    Token counts of *content* over its full, unpruned vocabulary.
+
+    Uses ``make_vectorizer()``'s tokenization (stop words, n-grams) with
+    every term kept, in the same alphabetical column order that
+    ``TfidfVectorizer`` uses, so each fold can select its own vocabulary.
+    """
+    params = make_vectorizer().get_params()
+    counter = CountVectorizer(
+        **{k: v for k, v in params.items() if k in CountVectorizer().get_params()
+           and k not in ("max_features", "dtype")},
+        dtype=np.int32,
+    )
+    return counter.fit_transform(content).tocsr()
+
+
+def fold_features(
+    counts: sparse.csr_matrix, train_idx: np.ndarray, test_idx: np.ndarray
+) -> Tuple[sparse.csr_matrix, sparse.csr_matrix]:
+    """
+    TF-IDF features of one fold, fitted on the training rows only.
+
+    Applies ``make_vectorizer()``'s vocabulary pruning (``min_df``,
+    ``max_df``, then the ``max_features`` most frequent terms, with
+    sklearn's own selection) and IDF weighting to the shared counts.  The
+    result equals ``make_vectorizer().fit(train_texts)`` applied to the
+    training and test texts.
+
+    Returns:
+        ``(X_train, X_test)``.
+    """
+    proto = make_vectorizer()
+    train = counts[train_idx]
+    n_train = train.shape[0]
+    dfs = np.bincount(train.indices, minlength=counts.shape[1])
+
+    high = proto.max_df if isinstance(proto.max_df, int) else proto.max_df * n_train
+    low = proto.min_df if isinstance(proto.min_df, int) else proto.min_df * n_train
+    # Terms absent from the training rows are not in the fold's vocabulary
+    mask = (dfs > 0) & (dfs <= high) & (dfs >= low)
+    if proto.max_features is not None and mask.sum() > proto.max_features:
+        present = np.flatnonzero(dfs > 0)
+        tfs = np.asarray(train[:, present].sum(axis=0, dtype=np.float64)).ravel()
+        in_mask = mask[present]
+        keep = (-tfs[in_mask]).argsort()[: proto.max_features]
+        mask = np.zeros_like(mask)
+        mask[present[np.flatnonzero(in_mask)[keep]]] = True
+    columns = np.flatnonzero(mask)
+
+    tfidf = TfidfTransformer(
+        norm=proto.norm, use_idf=proto.use_idf,
+        smooth_idf=proto.smooth_idf, sublinear_tf=proto.sublinear_tf,
+    )
+    X_train = tfidf.fit_transform(train[:, columns].astype(proto.dtype))
+    X_test = tfidf.transform(counts[test_idx][:, columns].astype(proto.dtype))
+    return X_train, X_test
+
+
+def _share_counts(counts: sparse.csr_matrix, directory: str) -> Dict[str, Any]:
+    """Write the CSR arrays of *counts* as ``.npy`` files for memory mapping."""
+    shared: Dict[str, Any] = {"shape": counts.shape}
+    for part in ("data", "indices", "indptr"):
+        shared[part] = os.path.join(directory, f"counts_{part}.npy")
+        np.save(shared[part], getattr(counts, part))
+    return shared
+
+
+def _open_counts(shared: Dict[str, Any]) -> sparse.csr_matrix:
+    """Memory-map the count matrix written by ``_share_counts``."""
+    arrays = [np.load(shared[part], mmap_mode="r") for part in ("data", "indices", "indptr")]
+    return sparse.csr_matrix(tuple(arrays), shape=shared["shape"], copy=False)
+
+
+def _cross_validate_fold(
+    shared: Dict[str, Any], model: Any, y: np.ndarray,
+    train_idx: np.ndarray, test_idx: np.ndarray,
+) -> Dict[str, float]:
+    """Fit the features and a clone of *model* on one fold; score its test rows."""
+    X_train, X_test = fold_features(_open_counts(shared), train_idx, test_idx)
+    fitted = clone(model).fit(X_train, y[train_idx])
+    return {
+        metric: get_scorer(scoring)(fitted, X_test, y[test_idx])
+        for metric, scoring in SCORING.items()
+    }
+
+
 def cross_validate_model(
     name: str,
     model: Any,
-    X: Any,
+    content: Any,
     y: Any,
     cv: int = CV_FOLDS,
+    n_jobs: int = -1,
 ) -> Dict[str, float]:
-    """Run k-fold cross-validation and return averaged metrics."""
+    """
+    Run fold-correct k-fold cross-validation and return averaged metrics.
+
+    The TF-IDF vectorizer is refitted inside every fold, so no vocabulary
+    or IDF statistics leak from the test fold.  *content* is tokenized
+    once.  The folds run in parallel and read the shared count matrix
+    through memmaps.
+
+    Args:
+        name: Display name of the model.
+        model: Unfitted classifier (cloned per fold).
+        content: Cleaned article texts.
+        y: Labels.
+        cv: Number of stratified folds.
+        n_jobs: Parallel fold workers (``-1`` = all cores).
+    """
     print(f"\n  Cross-validating {name} (k={cv}) …")
-    cv_results = cross_validate(
-        model,
-        X,
-        y,
-        cv=StratifiedKFold(n_splits=cv, shuffle=True, random_state=RANDOM_STATE),
-        scoring=SCORING,
-        n_jobs=-1,
-        return_train_score=False,
-    )
+    y = np.asarray(y)
+    t0 = time.time()
+    counts = tokenize_counts(content)
+    print(f"    Tokenized once: {counts.shape[0]:,} × {counts.shape[1]:,} counts "
+          f"({time.time() - t0:.1f}s)")
+
+    folds = StratifiedKFold(n_splits=cv, shuffle=True, random_state=RANDOM_STATE)
+    with tempfile.TemporaryDirectory(prefix="cv-counts-") as directory:
+        shared = _share_counts(counts, directory)
+        del counts
+        scores = Parallel(n_jobs=n_jobs)(
+            delayed(_cross_validate_fold)(shared, model, y, train_idx, test_idx)
+            for train_idx, test_idx in folds.split(np.zeros(len(y)), y)
+        )
 
     summary: Dict[str, float] = {}
-    for metric, key in [
-        ("accuracy",  "test_accuracy"),
-        ("precision", "test_precision"),
-        ("recall",    "test_recall"),
-        ("f1",        "test_f1"),
-    ]:
-        mean = np.mean(cv_results[key])
-        std  = np.std(cv_results[key])
+    for metric in SCORING:
+        values = [fold[metric] for fold in scores]
+        mean = np.mean(values)
+        std  = np.std(values)
         summary[metric] = round(float(mean), 4)
         summary[f"{metric}_std"] = round(float(std), 4)
         print(f"    {metric:10s}: {mean:.4f} ± {std:.4f}")
@@ -151,108 +264,181 @@ def cross_validate_model(
     return summary
 
 
+# ── Pipeline stages ──────────────────────────────────────────────────────────
+
+def load_dataset(path: str = DATASET_PATH) -> pd.DataFrame:
+    """Read the raw WELFake CSV."""
+    df = pd.read_csv(path)
+    print(f"      Raw rows: {len(df):,}")
+    return df
+
+
+def clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop incomplete / duplicate rows and add the cleaned ``content`` column."""
+    df = df.dropna(subset=["title", "text"]).drop_duplicates(subset=["title", "text"])
+    print(f"      After cleanup: {len(df):,}")
+
+    print("\n      Label distribution:")
+    for label, count in df["label"].value_counts().sort_index().items():
+        tag = "Fake" if label == 0 else "Credible"
+        print(f"        {label} ({tag}): {count:,}")
+
+    df = df.assign(
+        content=(df["title"].fillna("") + " " + df["text"].fillna("")).apply(
+            clean_text_for_model
+        )
+    )
+    return df
+
+
+def make_vectorizer() -> TfidfVectorizer:
+    """The production TF-IDF configuration (unfitted)."""
+    return TfidfVectorizer(
+        max_features=TFIDF_MAX_FEATURES,
+        stop_words="english",
+        ngram_range=(1, 2),
+        sublinear_tf=True,
+    )
+
+
+def build_features(content: Any) -> Tuple[TfidfVectorizer, Any]:
+    """Fit the TF-IDF vectorizer on *content*; return ``(vectorizer, X)``."""
+    tfidf = make_vectorizer()
+    X = tfidf.fit_transform(content)
+    print(f"      Feature matrix: {X.shape[0]:,} samples × {X.shape[1]:,} features")
+    return tfidf, X
+
+
+def split_data(X: Any, y: Any) -> Tuple[Any, Any, Any, Any]:
+    """Stratified train / test split: ``(X_train, X_test, y_train, y_test)``."""
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=TEST_SIZE, stratify=y, random_state=RANDOM_STATE
+    )
+    print(f"      Train: {X_train.shape[0]:,}  |  Test: {X_test.shape[0]:,}")
+    return X_train, X_test, y_train, y_test
+
+
+def make_candidates() -> Dict[str, Any]:
+    """Fresh, unfitted candidate classifiers by display name."""
+    return {
+        "Logistic Regression": LogisticRegression(
+            C=1.0, max_iter=1000, solver="lbfgs", random_state=RANDOM_STATE, n_jobs=-1
+        ),
+        "Passive Aggressive": PassiveAggressiveClassifier(
+            max_iter=50, random_state=RANDOM_STATE, n_jobs=-1
+        ),
+    }
+
+
+def train_candidates(
+    X_train: Any, X_test: Any, y_train: Any, y_test: Any
+) -> Tuple[Dict[str, Dict], Optional[str], Any, float]:
+    """
+    Train and evaluate every candidate.
+
+    Returns:
+        ``(all_metrics, best_name, best_model, best_f1)`` where the best
+        model is the fitted candidate with the highest holdout F1.
+    """
+    all_metrics: Dict[str, Dict] = {}
+    best_name, best_model, best_f1 = None, None, 0.0
+
+    for name, model in make_candidates().items():
+        metrics = evaluate_model(name, model, X_train, X_test, y_train, y_test)
+        all_metrics[name] = metrics
+        if metrics["f1"] > best_f1:
+            best_name, best_model, best_f1 = name, model, metrics["f1"]
+    return all_metrics, best_name, best_model, best_f1
+
+
+def save_artefacts(
+    best_name: str,
+    best_model: Any,
+    tfidf: TfidfVectorizer,
+    all_metrics: Dict[str, Dict],
+    cv_metrics: Dict[str, float],
+    n_train: int,
+    n_test: int,
+    model_dir: str = MODEL_DIR,
+) -> None:
+    """Write the model, vectorizer, metadata.txt and training_report.json."""
+    os.makedirs(model_dir, exist_ok=True)
+
+    joblib.dump(best_model, os.path.join(model_dir, "best_model.joblib"))
+    joblib.dump(tfidf,      os.path.join(model_dir, "tfidf_vectorizer.joblib"))
+
+    best_f1 = all_metrics[best_name]["f1"]
+
+    # Plain-text metadata (backward-compatible)
+    with open(os.path.join(model_dir, "metadata.txt"), "w") as fh:
+        fh.write(f"model_name: {best_name}\n")
+        fh.write(f"f1_score: {best_f1:.4f}\n")
+        fh.write(f"tfidf_max_features: {TFIDF_MAX_FEATURES}\n")
+        fh.write(f"train_samples: {n_train}\n")
+        fh.write(f"test_samples: {n_test}\n")
+
+    # Machine-readable training report (useful for CI assertions)
+    report: Dict[str, Any] = {
+        "best_model": best_name,
+        "holdout_metrics": all_metrics[best_name],
+        "cross_validation": {
+            "folds": CV_FOLDS,
+            "metrics": cv_metrics,
+        },
+        "tfidf_max_features": TFIDF_MAX_FEATURES,
+        "train_samples": int(n_train),
+        "test_samples":  int(n_test),
+        "all_models": all_metrics,
+    }
+    with open(os.path.join(model_dir, "training_report.json"), "w") as fh:
+        json.dump(report, fh, indent=2)
+
+
 # ── Main ─────────────────────────────────────────────────────────────────────
 
-_header("News Credibility Classifier — Training Pipeline")
+def main() -> None:
+    warnings.filterwarnings("ignore")
+    _header("News Credibility Classifier — Training Pipeline")
 
-# 1. Load & clean ─────────────────────────────────────────────────────────────
-_section(1, 6, "Loading dataset …")
-df = pd.read_csv(DATASET_PATH)
-print(f"      Raw rows: {len(df):,}")
+    # 1. Load & clean ─────────────────────────────────────────────────────────
+    _section(1, 6, "Loading dataset …")
+    df = clean_dataset(load_dataset())
 
-df.dropna(subset=["title", "text"], inplace=True)
-df.drop_duplicates(subset=["title", "text"], inplace=True)
-print(f"      After cleanup: {len(df):,}")
+    # 2. TF-IDF features ──────────────────────────────────────────────────────
+    _section(2, 6, "Building TF-IDF features …")
+    tfidf, X = build_features(df["content"])
+    y = df["label"]
 
-print("\n      Label distribution:")
-for label, count in df["label"].value_counts().sort_index().items():
-    tag = "Fake" if label == 0 else "Credible"
-    print(f"        {label} ({tag}): {count:,}")
+    # 3. Train / test split ───────────────────────────────────────────────────
+    _section(3, 6, "Splitting data (80 / 20 stratified) …")
+    X_train, X_test, y_train, y_test = split_data(X, y)
 
-df["content"] = (df["title"].fillna("") + " " + df["text"].fillna("")).apply(
-    clean_text_for_model
-)
+    # 4. Train & evaluate ─────────────────────────────────────────────────────
+    _section(4, 6, "Training & evaluating models …")
+    all_metrics, best_name, best_model, best_f1 = train_candidates(
+        X_train, X_test, y_train, y_test
+    )
 
-# 2. TF-IDF features ──────────────────────────────────────────────────────────
-_section(2, 6, "Building TF-IDF features …")
-tfidf = TfidfVectorizer(
-    max_features=TFIDF_MAX_FEATURES,
-    stop_words="english",
-    ngram_range=(1, 2),
-    sublinear_tf=True,
-)
+    # 5. Cross-validation ─────────────────────────────────────────────────────
+    _section(5, 6, f"Cross-validating best model ({best_name}, k={CV_FOLDS}) …")
 
-X = tfidf.fit_transform(df["content"])
-y = df["label"]
-print(f"      Feature matrix: {X.shape[0]:,} samples × {X.shape[1]:,} features")
+    # A fresh copy of the best model; every fold refits TF-IDF on its own
+    # training rows, so the raw content is passed rather than the full-fit X
+    best_proto = make_candidates()[best_name]
+    cv_metrics = cross_validate_model(best_name, best_proto, df["content"], y, cv=CV_FOLDS)
+    print(f"\n  ✅  Best model: {best_name}  (holdout F1={best_f1:.4f})")
 
-# 3. Train / test split ───────────────────────────────────────────────────────
-_section(3, 6, "Splitting data (80 / 20 stratified) …")
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=TEST_SIZE, stratify=y, random_state=RANDOM_STATE
-)
-print(f"      Train: {X_train.shape[0]:,}  |  Test: {X_test.shape[0]:,}")
-
-# 4. Train & evaluate ─────────────────────────────────────────────────────────
-_section(4, 6, "Training & evaluating models …")
-
-candidates = {
-    "Logistic Regression": LogisticRegression(
-        C=1.0, max_iter=1000, solver="lbfgs", random_state=RANDOM_STATE, n_jobs=-1
-    ),
-    "Passive Aggressive": PassiveAggressiveClassifier(
-        max_iter=50, random_state=RANDOM_STATE, n_jobs=-1
-    ),
-}
+    # 6. Serialise ────────────────────────────────────────────────────────────
+    _section(6, 6, f"Saving model to {MODEL_DIR}/ …")
+    save_artefacts(
+        best_name, best_model, tfidf, all_metrics, cv_metrics,
+        X_train.shape[0], X_test.shape[0],
+    )
+
+    print("\n✅  Training complete.")
+    print(f"   Model artefacts saved to  : {MODEL_DIR}/")
+    print(f"   Training report saved to  : {MODEL_DIR}/training_report.json\n")
 
-all_metrics: Dict[str, Dict] = {}
-best_name, best_model, best_f1 = None, None, 0.0
-
-for name, model in candidates.items():
-    metrics = evaluate_model(name, model, X_train, X_test, y_train, y_test)
-    all_metrics[name] = metrics
-    if metrics["f1"] > best_f1:
-        best_name, best_model, best_f1 = name, model, metrics["f1"]
-
-# 5. Cross-validation ─────────────────────────────────────────────────────────
-_section(5, 6, f"Cross-validating best model ({best_name}, k={CV_FOLDS}) …")
-
-# Re-initialise the best model (cross_validate trains its own copies)
-best_proto = candidates[best_name]
-cv_metrics = cross_validate_model(best_name, best_proto, X, y, cv=CV_FOLDS)
-print(f"\n  ✅  Best model: {best_name}  (holdout F1={best_f1:.4f})")
-
-# 6. Serialise ────────────────────────────────────────────────────────────────
-_section(6, 6, f"Saving model to {MODEL_DIR}/ …")
-os.makedirs(MODEL_DIR, exist_ok=True)
-
-joblib.dump(best_model, os.path.join(MODEL_DIR, "best_model.joblib"))
-joblib.dump(tfidf,      os.path.join(MODEL_DIR, "tfidf_vectorizer.joblib"))
-
-# Plain-text metadata (backward-compatible)
-with open(os.path.join(MODEL_DIR, "metadata.txt"), "w") as fh:
-    fh.write(f"model_name: {best_name}\n")
-    fh.write(f"f1_score: {best_f1:.4f}\n")
-    fh.write(f"tfidf_max_features: {TFIDF_MAX_FEATURES}\n")
-    fh.write(f"train_samples: {X_train.shape[0]}\n")
-    fh.write(f"test_samples: {X_test.shape[0]}\n")
-
-# Machine-readable training report (useful for CI assertions)
-report: Dict[str, Any] = {
-    "best_model": best_name,
-    "holdout_metrics": all_metrics[best_name],
-    "cross_validation": {
-        "folds": CV_FOLDS,
-        "metrics": cv_metrics,
-    },
-    "tfidf_max_features": TFIDF_MAX_FEATURES,
-    "train_samples": int(X_train.shape[0]),
-    "test_samples":  int(X_test.shape[0]),
-    "all_models": all_metrics,
-}
-with open(os.path.join(MODEL_DIR, "training_report.json"), "w") as fh:
-    json.dump(report, fh, indent=2)
 
-print("\n✅  Training complete.")
-print(f"   Model artefacts saved to  : {MODEL_DIR}/")
-print(f"   Training report saved to  : {MODEL_DIR}/training_report.json\n")
+if __name__ == "__main__":
+    main()
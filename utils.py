@@ -3,7 +3,16 @@ Utility functions for text processing and pattern detection in news credibility
 """
 
 import re
-from typing import List
+from typing import Collection, List, Optional
+
+# The sentence-level term lists are the claim families of the default
+# lexicon; they are not duplicated here
+from src.utils.terms import (
+    CLAIM_CONSPIRACY,
+    CLAIM_EVIDENCE,
+    CLAIM_EXTREME,
+    CLAIM_VAGUE_SOURCES,
+)
 
 
 def count_keywords(text: str, keywords: List[str]) -> int:
@@ -77,12 +86,13 @@ def split_into_sentences(text: str) -> List[str]:
     return sentences
 
 
-def contains_vague_source(sentence: str) -> bool:
+def contains_vague_source(sentence: str, patterns: Optional[Collection[str]] = None) -> bool:
     """
     Detect if a sentence contains vague source references.
     
     Args:
         sentence: The sentence to check
+        patterns: Vague source phrases to look for (default: the lexicon's built-in list)
         
     Returns:
         True if vague source references are detected, False otherwise
@@ -90,18 +100,7 @@ def contains_vague_source(sentence: str) -> bool:
     if not sentence:
         return False
     
-    vague_source_patterns = [
-        "sources say",
-        "experts claim",
-        "reports suggest",
-        "allegedly",
-        "rumored",
-        "according to sources",
-        "insiders say",
-        "it is believed",
-        "some say",
-        "many believe"
-    ]
+    vague_source_patterns = patterns if patterns is not None else CLAIM_VAGUE_SOURCES
     
     sentence_lower = sentence.lower()
     
@@ -112,12 +111,13 @@ def contains_vague_source(sentence: str) -> bool:
     return False
 
 
-def contains_extreme_language(sentence: str) -> bool:
+def contains_extreme_language(sentence: str, words: Optional[Collection[str]] = None) -> bool:
     """
     Detect if a sentence contains extreme language or adjectives.
     
     Args:
         sentence: The sentence to check
+        words: Extreme words, matched as whole words (default: the lexicon's built-in list)
         
     Returns:
         True if extreme language is detected, False otherwise
@@ -125,24 +125,7 @@ def contains_extreme_language(sentence: str) -> bool:
     if not sentence:
         return False
     
-    extreme_words = [
-        "always",
-        "never",
-        "every",
-        "all",
-        "none",
-        "completely",
-        "totally",
-        "absolutely",
-        "definitely",
-        "shocking",
-        "unbelievable",
-        "terrifying",
-        "devastating",
-        "horrifying",
-        "disgusting",
-        "appalling"
-    ]
+    extreme_words = words if words is not None else CLAIM_EXTREME
     
     sentence_lower = sentence.lower()
     
@@ -155,12 +138,13 @@ def contains_extreme_language(sentence: str) -> bool:
     return False
 
 
-def contains_evidence_markers(sentence: str) -> bool:
+def contains_evidence_markers(sentence: str, markers: Optional[Collection[str]] = None) -> bool:
     """
     Detect if a sentence contains evidence markers (citations, data, research references).
     
     Args:
         sentence: The sentence to check
+        markers: Evidence markers to look for (default: the lexicon's built-in list)
         
     Returns:
         True if evidence markers are detected, False otherwise
@@ -168,23 +152,7 @@ def contains_evidence_markers(sentence: str) -> bool:
     if not sentence:
         return False
     
-    evidence_markers = [
-        "study",
-        "research",
-        "data",
-        "statistics",
-        "percent",
-        "according to",
-        "published",
-        "journal",
-        "university",
-        "professor",
-        "dr.",
-        "phd",
-        "analysis",
-        "survey",
-        "report"
-    ]
+    evidence_markers = markers if markers is not None else CLAIM_EVIDENCE
     
     sentence_lower = sentence.lower()
     
@@ -195,12 +163,13 @@ def contains_evidence_markers(sentence: str) -> bool:
     return False
 
 
-def contains_conspiracy_markers(sentence: str) -> bool:
+def contains_conspiracy_markers(sentence: str, markers: Optional[Collection[str]] = None) -> bool:
     """
     Detect if a sentence contains conspiracy framing language.
     
     Args:
         sentence: The sentence to check
+        markers: Conspiracy markers to look for (default: the lexicon's built-in list)
         
     Returns:
         True if conspiracy markers are detected, False otherwise
@@ -208,20 +177,7 @@ def contains_conspiracy_markers(sentence: str) -> bool:
     if not sentence:
         return False
     
-    conspiracy_markers = [
-        "cover-up",
-        "cover up",
-        "conspiracy",
-        "they don't want you to know",
-        "mainstream media",
-        "wake up",
-        "sheeple",
-        "hidden truth",
-        "secret agenda",
-        "deep state",
-        "false flag",
-        "controlled by"
-    ]
+    conspiracy_markers = markers if markers is not None else CLAIM_CONSPIRACY
     
     sentence_lower = sentence.lower()
     